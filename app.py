@@ -1,13 +1,32 @@
 # app.py - Professional SaaS Dashboard
 
+import os
 import streamlit as st
-from src.memory.candidate_store import load_candidates
-from src.dashboard.feed import build_emerging_feed
-from src.dashboard.gemini_explainer import generate_human_cluster_title, explain_cluster_with_gemini
-from src.dashboard.graph import build_cluster_graph
-from src.dashboard.search import search_clusters_hybrid
+from src.memory.candidate_store import load_candidates, get_qdrant_client
+from src.memory.data_version import get_data_version
+from src.memory.tiering import ColdStore
+from src.dashboard.catalog import ClusterCatalog
+from src.dashboard.gemini_explainer import (
+    PRESET_QUESTIONS,
+    stream_cluster_explanation,
+    get_cluster_title_nowait,
+    prefetch_cluster_titles,
+    pending_title_count,
+    preload_title_cache,
+)
+from src.dashboard.local_titler import LocalTitler, load_document_frequencies, set_local_titler
+from src.dashboard.llm_budget import start_llm_run
+from src.dashboard.graph import build_cluster_graph, full_graph_node_count, GRAPH_NODE_BUDGET, GRAPH_EDGE_BUDGET
+from src.dashboard.search import search_clusters_hybrid, ClusterSearchIndex
+from src.dashboard.keyword_index import KeywordIndex
+from src.dashboard.qdrant_search import search_clusters_qdrant, collection_supports_hybrid
+from src.dashboard.signal_search import SignalSearchIndex, search_signals
+from src.dashboard.facets import FacetIndex, FACETS
+from src.dashboard.snapshot import load_dashboard_snapshot, snapshot_covers, get_snapshot_view, snapshot_feed
 from src.dashboard.time_filter import compute_time_slider_bounds, filter_clusters_by_time
-from src.dashboard.utils import format_signal_date
+from src.dashboard.time_index import TimeIndex
+from src.scoring.time_histogram import HistogramIndex
+from src.dashboard.utils import format_signal_date, format_facet_value
 from src.embeddings.embedding_model import EmbeddingModel
 from src.scoring.grounding_agent import compute_cluster_grounding
 from src.scoring.emergence import compute_emergence
@@ -15,6 +34,9 @@ from streamlit.components.v1 import html
 
 st.set_page_config(page_title="SignalWeave", layout="wide", initial_sidebar_state="expanded")
 
+# Load cached cluster titles in the background while the page renders
+preload_title_cache()
+
 # === CUSTOM CSS FOR PROFESSIONAL LOOK ===
 st.markdown("""
 <style>
@@ -195,6 +217,113 @@ def get_embedding_model():
 
 embedding_model = get_embedding_model()
 
+# === SHARED DATA LAYER ===
+# Cluster data only changes when main.py publishes a new data version. The dataset is
+# cached per version with st.cache_resource so all sessions share a single in-memory
+# copy (st.cache_data would hand each caller its own deserialized copy). The TTL is a
+# fallback for deployments where no version stamp is published.
+DATA_CACHE_TTL_SECONDS = 6 * 60 * 60
+VERSION_CHECK_TTL_SECONDS = 60
+SEARCH_TOP_K = 50
+SIGNAL_SEARCH_TOP_K = 200
+SIGNAL_SEARCH_BUDGET_MS = 150
+GRAPH_PHYSICS_MAX_CLUSTERS = 50
+# "memory" ranks in this process; "qdrant" fuses dense + sparse scores inside Qdrant
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "memory")
+
+@st.cache_data(ttl=VERSION_CHECK_TTL_SECONDS, show_spinner=False)
+def get_cached_data_version():
+    return get_data_version()
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner="Loading clusters...")
+def load_dataset(data_version):
+    # Shared across sessions - callers must not mutate the returned clusters
+    return load_candidates()
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_catalog(data_version):
+    # Indexed view over the full (unfiltered) dataset for O(1) lookups by cluster_id
+    return ClusterCatalog(load_dataset(data_version), histogram_index=load_histogram_index(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_time_index(data_version):
+    # CSR-packed member timestamps: slider moves become a vectorized searchsorted
+    return TimeIndex(load_dataset(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_histogram_index(data_version):
+    # Day-bucketed counts persisted with each cluster: slider bounds without a timestamp scan
+    return HistogramIndex(load_dataset(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_keyword_index(data_version):
+    # Inverted index from the term frequencies computed at ingest time
+    return KeywordIndex.from_clusters(load_dataset(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_search_index(data_version, _embedding_model):
+    # Normalized centroid matrix: one matrix-vector product per query
+    return ClusterSearchIndex(load_dataset(data_version), embedding_model=_embedding_model, version=data_version)
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_signal_index(data_version):
+    # IVF over member embeddings (clusters are the coarse lists), shares the TimeIndex matrix
+    return SignalSearchIndex(load_time_index(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_facet_index(data_version):
+    # One bitmap per facet value: facet combinations resolve with bitwise ops
+    return FacetIndex(load_dataset(data_version), time_index=load_time_index(data_version))
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_local_titles(data_version):
+    # TF-IDF keyword titles for every cluster in one vectorized pass (shown until Gemini titles exist)
+    dataset = load_dataset(data_version)
+    titler = LocalTitler(load_document_frequencies(dataset))
+    set_local_titler(titler)
+    return titler.title_clusters(dataset)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_cold_store(data_version):
+    # Archived (cold-tier) clusters: read from Qdrant (or the local fallback) only when a search includes them
+    return ColdStore()
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def start_llm_budget(data_version):
+    # One LLM run budget per data version, shared by every session in the process
+    start_llm_run()
+    return data_version
+
+@st.cache_resource(ttl=DATA_CACHE_TTL_SECONDS, max_entries=2, show_spinner=False)
+def load_snapshot(data_version):
+    return load_dashboard_snapshot()
+
+@st.cache_resource(show_spinner=False)
+def get_search_client():
+    # Qdrant client for server-side search, or None if the hybrid layout is unavailable
+    client = get_qdrant_client()
+    if client is None or not collection_supports_hybrid(client, "clusters_warm"):
+        return None
+    return client
+
+@st.cache_resource(show_spinner=False)
+def get_signals_client():
+    # Qdrant client for signals_hot (None without credentials -> local ANN index)
+    return get_qdrant_client()
+
+def invalidate_data_cache():
+    get_cached_data_version.clear()
+    load_dataset.clear()
+    load_catalog.clear()
+    load_time_index.clear()
+    load_histogram_index.clear()
+    load_keyword_index.clear()
+    load_search_index.clear()
+    load_signal_index.clear()
+    load_facet_index.clear()
+    load_local_titles.clear()
+    load_snapshot.clear()
+
 # === HEADER ===
 st.markdown("""
 <div style='text-align: center; padding: 20px 0 40px 0;'>
@@ -212,17 +341,25 @@ with st.sidebar:
     st.markdown("### ⚙️ Control Panel")
     st.divider()
     
-    # Load candidates
-    candidates = load_candidates()
-    original_candidates = candidates.copy()
+    # Load candidates (shared, version-keyed cache)
+    data_version = get_cached_data_version()
+    candidates = load_dataset(data_version)
+    original_catalog = load_catalog(data_version)
+    local_titles = load_local_titles(data_version)
+    start_llm_budget(data_version)
     
     if not candidates:
         st.error("⚠️ No clusters available. Run main.py first.")
         st.stop()
     
+    # Precomputed view written by main.py (feed order, titles, grounding, emergence)
+    snapshot = load_snapshot(data_version)
+    
     # Time filter
     st.markdown("#### ⏰ Time Range")
-    min_days, max_days, default_days = compute_time_slider_bounds(candidates)
+    min_days, max_days, default_days = compute_time_slider_bounds(
+        candidates, histogram_index=load_histogram_index(data_version)
+    )
     
     time_range_days = st.slider(
         "Days of history",
@@ -233,6 +370,34 @@ with st.sidebar:
     )
     
     st.caption(f"📊 {time_range_days} days | {len(candidates)} clusters")
+    
+    if st.button("🔄 Reload data", help="Drop the cached dataset and reload from storage"):
+        invalidate_data_cache()
+        st.rerun()
+    
+    # Snapshot covers the full time window only; narrower windows are recomputed live
+    active_snapshot = snapshot if snapshot_covers(snapshot, time_range_days, max_days) else None
+    st.divider()
+    
+    # Facets (counts come from bitmap popcounts under the current selection)
+    st.markdown("#### 🏷️ Facets")
+    facet_index = load_facet_index(data_version)
+    facet_selections = {name: st.session_state.get(f"facet_{name}", []) for name in FACETS}
+    facet_mask, facet_counts = facet_index.resolve(facet_selections, time_range_days)
+    
+    for name, label in FACETS.items():
+        counts = facet_counts[name]
+        options = [v for v in counts if counts[v] > 0 or v in facet_selections[name]]
+        if not options:
+            continue
+        st.multiselect(
+            label,
+            options,
+            key=f"facet_{name}",
+            format_func=lambda value, counts=counts: f"{format_facet_value(value)} ({counts.get(value, 0)})"
+        )
+    
+    st.caption(f"🏷️ {int(facet_mask.sum())} clusters match")
     st.divider()
     
     # Mode toggle
@@ -255,13 +420,17 @@ with st.sidebar:
         help="Clusters with fewer signals are candidates"
     )
 
-# Apply time filter
-candidates = filter_clusters_by_time(candidates, time_range_days)
+# Apply time filter (and facet bitmaps)
+candidates = filter_clusters_by_time(
+    candidates, time_range_days, time_index=load_time_index(data_version), mask=facet_mask
+)
 
 if not candidates:
     st.warning(f"⚠️ No clusters in the last {time_range_days} days. Increase time range.")
     st.stop()
 
+catalog = ClusterCatalog(candidates)
+
 # === SEARCH SECTION ===
 st.markdown("### 🔍 Search Emerging Signals")
 
@@ -278,35 +447,98 @@ with col1:
 with col2:
     search_button = st.button("Search", use_container_width=True, type="primary")
 
-# Perform search
-if search_button and search_query:
-    with st.spinner("🔍 Searching across all clusters..."):
-        results = search_clusters_hybrid(
+col_mode, col_agg = st.columns([3, 2])
+with col_mode:
+    search_mode = st.radio(
+        "Search mode",
+        ["Clusters", "Signals"],
+        horizontal=True,
+        help="Signals: match individual signals (not diluted by broad clusters), grouped by cluster"
+    )
+with col_agg:
+    signal_aggregation = st.radio(
+        "Group signals by",
+        ["max", "mean"],
+        horizontal=True,
+        disabled=search_mode != "Signals",
+        help="Cluster score = best matching signal (max) or average of its matching signals (mean)"
+    )
+include_archived = st.checkbox(
+    "Include archived clusters",
+    disabled=search_mode != "Clusters",
+    help="Also search clusters moved to the cold store after a long dormant period (slower)"
+)
+
+# Perform search (signal mode is fast enough to run on every query change)
+if search_query and (search_button or search_mode == "Signals"):
+    if search_mode == "Signals":
+        search_progress = st.progress(0.0, text="🔍 Searching signals...")
+        results, search_stats = search_signals(
             query=search_query,
-            clusters=candidates,
             embedding_model=embedding_model,
-            min_final_score=0.35
+            signal_index=load_signal_index(data_version),
+            clusters=candidates,
+            top_k=SIGNAL_SEARCH_TOP_K,
+            days=time_range_days,
+            aggregation=signal_aggregation,
+            budget_ms=SIGNAL_SEARCH_BUDGET_MS,
+            progress_callback=lambda fraction: search_progress.progress(min(fraction, 1.0), text="🔍 Searching signals..."),
+            client=get_signals_client() if SEARCH_BACKEND == "qdrant" else None
         )
+        search_progress.empty()
+        if search_stats.get("truncated"):
+            st.caption(f"⏱️ Partial results: latency budget of {SIGNAL_SEARCH_BUDGET_MS} ms reached")
+    else:
+        with st.spinner("🔍 Searching across all clusters..."):
+            search_client = get_search_client() if SEARCH_BACKEND == "qdrant" else None
+            if search_client is not None:
+                results = search_clusters_qdrant(
+                    query=search_query,
+                    client=search_client,
+                    embedding_model=embedding_model,
+                    min_final_score=0.35,
+                    top_k=SEARCH_TOP_K,
+                    clusters=candidates
+                )
+            else:
+                results = search_clusters_hybrid(
+                    query=search_query,
+                    clusters=candidates,
+                    embedding_model=embedding_model,
+                    min_final_score=0.35,
+                    keyword_index=load_keyword_index(data_version),
+                    search_index=load_search_index(data_version, embedding_model),
+                    top_k=SEARCH_TOP_K
+                )
+            if include_archived:
+                archived = load_cold_store(data_version).search(
+                    search_query, embedding_model, min_final_score=0.35, top_k=SEARCH_TOP_K
+                )
+                # A cluster revived by a run that stopped before commit_restore is in both tiers
+                archived = [r for r in archived if r["cluster_id"] not in original_catalog]
+                results = sorted(results + archived, key=lambda r: r["final_score"], reverse=True)[:SEARCH_TOP_K]
     
     if results:
         st.success(f"✅ Found {len(results)} matching clusters")
         
         for idx, result in enumerate(results):
-            # Get original cluster for full signal list
-            original_cluster = next(c for c in original_candidates if c["cluster_id"] == result["cluster_id"])
+            # Get original cluster for full signal list (archived results carry their own)
+            original_cluster = original_catalog.get(result["cluster_id"]) or result
             all_signals = original_cluster["signals"]
             
+            view = get_snapshot_view(active_snapshot, result)
+            
             # Compute emergence
-            emergence = compute_emergence(result, recent_days=30)
+            emergence = view if view else compute_emergence(result, recent_days=30)
             result["growth_ratio"] = emergence["growth_ratio"]
             
             # Generate title
             signal_texts = [s['text'] for s in result["signals"]]
             cluster_id = result["cluster_id"]
-            title = generate_human_cluster_title(signal_texts, cluster_id=cluster_id)
+            title = (view and view["title"]) or get_cluster_title_nowait(signal_texts, cluster_id, fallback=local_titles.get(cluster_id))
             
             # Grounding
-            grounding = compute_cluster_grounding(result)
+            grounding = view["grounding"] if view else compute_cluster_grounding(result)
             
             # === CLUSTER CARD ===
             st.markdown(f"""
@@ -319,7 +551,10 @@ if search_button and search_query:
             
             # Cluster type badge
             cluster_type = result.get("cluster_type", "Candidate")
-            badge_html += f'<span class="badge badge-medium">{"🔥 Active" if cluster_type == "Active" else "🌱 Candidate"}</span>'
+            if result.get("tier") == "cold":
+                badge_html += '<span class="badge badge-dormant">🗄️ Archived</span>'
+            else:
+                badge_html += f'<span class="badge badge-medium">{"🔥 Active" if cluster_type == "Active" else "🌱 Candidate"}</span>'
             
             # Emergence badge
             emergence_level = emergence.get("emergence_level", "stable")
@@ -375,12 +610,26 @@ if search_button and search_query:
             
             # Metrics
             col_a, col_b, col_c, col_d = st.columns(4)
-            with col_a:
-                st.metric("Final Score", f"{result['final_score']:.1%}")
-            with col_b:
-                st.metric("Semantic", f"{result['semantic_score']:.1%}")
-            with col_c:
-                st.metric("Lexical", f"{result['lexical_score']:.1%}")
+            if "matched_signals" in result:
+                best_signal = result["matched_signals"][0]
+                st.markdown(f"""
+                <div class="info-row">
+                    🎯 <strong>Best match:</strong> {best_signal['text']}
+                </div>
+                """, unsafe_allow_html=True)
+                with col_a:
+                    st.metric("Best Signal", f"{result['max_signal_score']:.1%}")
+                with col_b:
+                    st.metric("Mean Match", f"{result['mean_signal_score']:.1%}")
+                with col_c:
+                    st.metric("Matched", len(result["matched_signals"]))
+            else:
+                with col_a:
+                    st.metric("Final Score", f"{result['final_score']:.1%}")
+                with col_b:
+                    st.metric("Semantic", f"{result['semantic_score']:.1%}")
+                with col_c:
+                    st.metric("Lexical", f"{result['lexical_score']:.1%}")
             with col_d:
                 st.metric("Signals", result["signal_count"])
             
@@ -401,19 +650,23 @@ if search_button and search_query:
 st.divider()
 
 # === ACTIVE CLUSTERS FEED ===
-active_clusters = [c for c in candidates if c["signal_count"] >= ACTIVE_MIN]
-candidate_clusters = [c for c in candidates if c["signal_count"] < ACTIVE_MIN]
+active_range = (ACTIVE_MIN, None)
 
 # Apply display mode filter
 if display_mode == "Early Weak Signals":
-    active_clusters = [c for c in active_clusters if c["signal_count"] < 10]
+    active_range = (ACTIVE_MIN, 10)
 elif display_mode == "Mature Trends":
-    active_clusters = [c for c in active_clusters if c["signal_count"] >= 10]
+    active_range = (max(ACTIVE_MIN, 10), None)
+
+active_clusters = catalog.select(*active_range)
+candidate_clusters = catalog.select(max_signals=ACTIVE_MIN)
 
 st.markdown("### 🔥 Active Emerging Clusters")
 
 if active_clusters:
-    feed = build_emerging_feed(active_clusters)
+    feed = snapshot_feed(active_snapshot, active_clusters)
+    if feed is None:
+        feed = catalog.emerging_feed(*active_range)
     
     # Pagination
     clusters_per_page = 5
@@ -433,20 +686,29 @@ if active_clusters:
     end_idx = min(start_idx + clusters_per_page, len(feed))
     page_feed = feed[start_idx:end_idx]
 
+    # Titles for the next page are generated in the background before it is opened
+    next_page_clusters = [catalog.get(item["cluster_id"]) for item in feed[end_idx:end_idx + clusters_per_page]]
+    prefetch_cluster_titles([
+        c for c in next_page_clusters
+        if not (get_snapshot_view(active_snapshot, c) or {}).get("title")
+    ])
+
     for idx, item in enumerate(page_feed):
         # Get cluster data
-        cluster_data = next(c for c in active_clusters if c["cluster_id"] == item["cluster_id"])
+        cluster_data = catalog.get(item["cluster_id"])
         cluster_data["growth_ratio"] = item["growth_ratio"]
         
-        original_cluster = next(c for c in original_candidates if c["cluster_id"] == item["cluster_id"])
+        original_cluster = original_catalog.get(item["cluster_id"])
         all_signals = original_cluster["signals"]
         
+        view = get_snapshot_view(active_snapshot, cluster_data)
+        
         signal_texts = [s['text'] for s in cluster_data["signals"]]
         cluster_id = cluster_data["cluster_id"]
-        title = generate_human_cluster_title(signal_texts, cluster_id=cluster_id)
+        title = (view and view["title"]) or get_cluster_title_nowait(signal_texts, cluster_id, fallback=local_titles.get(cluster_id))
         
         # Grounding
-        grounding = compute_cluster_grounding(cluster_data)
+        grounding = view["grounding"] if view else compute_cluster_grounding(cluster_data)
         
         # === CLUSTER CARD ===
         st.markdown(f"""
@@ -556,15 +818,16 @@ if active_clusters:
         col1, col2, col3 = st.columns(3)
         question_key = f"question_{idx}_{cluster_id}"
         
+        why_question, who_question, next_question = PRESET_QUESTIONS
         with col1:
             if st.button("Why emerging?", key=f"why_{idx}_{cluster_id}"):
-                st.session_state[question_key] = "Why is this emerging?"
+                st.session_state[question_key] = why_question
         with col2:
             if st.button("Who cares?", key=f"who_{idx}_{cluster_id}"):
-                st.session_state[question_key] = "Who should care?"
+                st.session_state[question_key] = who_question
         with col3:
             if st.button("What's next?", key=f"next_{idx}_{cluster_id}"):
-                st.session_state[question_key] = "What could happen next?"
+                st.session_state[question_key] = next_question
         
         user_question = st.text_input(
             "Custom question:",
@@ -574,9 +837,9 @@ if active_clusters:
         )
         
         if user_question:
-            with st.spinner("🤔 Generating explanation..."):
-                response = explain_cluster_with_gemini(signal_texts, user_question)
-                st.info(response)
+            # Cached answers (same question, unchanged cluster) appear at once; new ones stream in
+            with st.container(border=True):
+                st.write_stream(stream_cluster_explanation(cluster_data["signals"], user_question, cluster_id=cluster_id))
         
         st.divider()
 else:
@@ -622,13 +885,43 @@ if active_clusters:
     
     # Add labels to clusters
     for c in active_clusters:
+        view = get_snapshot_view(active_snapshot, c)
         signal_texts = [s['text'] for s in c["signals"]]
         cluster_id = c["cluster_id"]
-        c["label"] = generate_human_cluster_title(signal_texts, cluster_id=cluster_id)
+        c["label"] = (view and view["title"]) or get_cluster_title_nowait(signal_texts, cluster_id, fallback=local_titles.get(cluster_id))
+    
+    # Large graphs freeze the browser while physics stabilizes - lay them out server-side
+    precomputed_layout = st.toggle(
+        "Precomputed layout",
+        value=len(active_clusters) > GRAPH_PHYSICS_MAX_CLUSTERS,
+        help="Position nodes on the server (fixed coordinates, no browser physics)"
+    )
+    
+    # Level of detail: past the node budget show cluster nodes only and expand one cluster on demand
+    graph_node_count = full_graph_node_count(active_clusters)
+    graph_detail = "overview" if graph_node_count > GRAPH_NODE_BUDGET else "full"
+    expanded_cluster_id = None
+    if graph_detail == "overview":
+        st.caption(
+            f"🔭 Overview: the full graph would need {graph_node_count:,} nodes, so only clusters and their "
+            f"nearest neighbors are shown (budget: {GRAPH_NODE_BUDGET:,} nodes, {GRAPH_EDGE_BUDGET:,} edges)."
+        )
+        cluster_labels = {c["cluster_id"]: c["label"] for c in active_clusters}
+        expanded_cluster_id = st.selectbox(
+            "Expand cluster",
+            options=[None] + sorted(cluster_labels, key=lambda cid: cluster_labels[cid]),
+            format_func=lambda cid: "None" if cid is None else cluster_labels[cid],
+            help="Show the member signals of one cluster"
+        )
     
-    # Build graph
-    build_cluster_graph(active_clusters)
-    html(open("cluster_graph.html").read(), height=700)
+    # Build graph (cached per cluster set - unchanged reruns skip edge computation)
+    graph_html = build_cluster_graph(
+        active_clusters,
+        layout="precomputed" if precomputed_layout else "physics",
+        detail=graph_detail,
+        expanded_cluster_id=expanded_cluster_id
+    )
+    html(graph_html, height=700)
     
     st.markdown("</div>", unsafe_allow_html=True)
 else:
@@ -643,15 +936,22 @@ if candidate_clusters:
     st.caption(f"📊 {len(candidate_clusters)} clusters below active threshold (< {ACTIVE_MIN} signals)")
     
     for c in candidate_clusters:
-        original_cluster = next(orig_c for orig_c in original_candidates if orig_c["cluster_id"] == c["cluster_id"])
+        original_cluster = original_catalog.get(c["cluster_id"])
         all_signals = original_cluster["signals"]
+        view = get_snapshot_view(active_snapshot, c)
         
         signal_texts = [s['text'] for s in c["signals"]]
         cluster_id = c["cluster_id"]
-        c["label"] = generate_human_cluster_title(signal_texts, cluster_id=cluster_id)
+        c["label"] = (view and view["title"]) or get_cluster_title_nowait(signal_texts, cluster_id, fallback=local_titles.get(cluster_id))
+        
+        # Snapshot previews are already sorted newest-first; use them when they hold every signal
+        if view and len(view["top_signals"]) == len(all_signals):
+            sorted_signals = view["top_signals"]
+        else:
+            sorted_signals = sorted(all_signals, key=lambda s: s['timestamp'], reverse=True)
         
         with st.expander(f"🌱 {c['label']} ({c['signal_count']} recent / {len(all_signals)} total)"):
-            for sig in sorted(all_signals, key=lambda s: s['timestamp'], reverse=True):
+            for sig in sorted_signals:
                 st.markdown(f"""
                 <div class="signal-item">
                     <strong>[{format_signal_date(sig['timestamp'])}]</strong><br>
@@ -661,6 +961,11 @@ if candidate_clusters:
 else:
     st.info("💡 No candidate clusters at this time.")
 
+# Titles still generating in the background show up on the next rerun
+pending_titles = pending_title_count()
+if pending_titles:
+    st.caption(f"⏳ Generating {pending_titles} cluster titles in the background - interact with the page to refresh them.")
+
 # === FOOTER ===
 st.divider()
 st.markdown("""
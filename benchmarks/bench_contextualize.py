@@ -0,0 +1,69 @@
+# benchmarks/bench_contextualize.py
+"""
+Benchmark historical contextualization of one ingest batch against a
+signals_hot collection: one query_points call per signal (previous
+contextualize_signal path) vs. batched query_batch_points requests over
+the embeddings main.py already computed, plus the persistence pass.
+
+Runs against local in-memory Qdrant, so it measures per-request overhead
+only; against Qdrant Cloud every saved request also saves a network round trip.
+
+Run from the repository root:
+    python -m benchmarks.bench_contextualize
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+
+from src.clustering.persistence import check_persistence, check_persistence_batch
+from src.ingestion.signal import Signal
+from src.memory.qdrant_client import QdrantMemory
+
+N_STORED = 5_000
+N_TOPICS = 500
+N_BATCH = 300
+DIM = 384
+TOP_K = 10
+MIN_SIMILARITY = 0.5
+
+
+def make_signals(prefix, n):
+    return [Signal(f"{prefix}-{i}", f"signal {i}", datetime(2026, 1, 1), "bench", "emerging_technology", "ai") for i in range(n)]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    # Past signals grouped in topics; new signals continue some topics (persistent), the rest are new
+    rng = np.random.default_rng(0)
+    topics = rng.normal(size=(N_TOPICS, DIM))
+    stored = (topics[rng.integers(N_TOPICS, size=N_STORED)] + 0.5 * rng.normal(size=(N_STORED, DIM))).astype(np.float32)
+    query_topics = np.vstack([topics[rng.integers(N_TOPICS, size=N_BATCH // 2)], rng.normal(size=(N_BATCH - N_BATCH // 2, DIM))])
+    queries = (query_topics + 0.5 * rng.normal(size=(N_BATCH, DIM))).tolist()
+
+    memory = QdrantMemory(collection_name="signals_hot", vector_size=DIM, use_cloud=False)
+    for start in range(0, N_STORED, 1000):
+        memory.upsert_signals(make_signals("past", 1000), stored[start:start + 1000].tolist())
+    print(f"{N_STORED} stored signals, {N_BATCH} new signals, top_k={TOP_K}")
+
+    single = timed("per-signal query_points", lambda: [
+        check_persistence({"similar_count": len(memory.search_similar_signals(q, top_k=TOP_K, score_threshold=MIN_SIMILARITY))})
+        for q in queries
+    ])
+    batched = timed("query_batch_points + batch persistence", lambda: check_persistence_batch([
+        {"similar_count": len(similar)}
+        for similar in memory.search_similar_signals_batch(queries, top_k=TOP_K, score_threshold=MIN_SIMILARITY)
+    ]))
+    assert [r["similar_count"] for r in single] == [r["similar_count"] for r in batched["results"]]
+    print(f"requests: {N_BATCH} vs {-(-N_BATCH // 64)}; {batched['persistent']} persistent, {batched['noise']} noise")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_graph.py
+"""
+Benchmark cluster graph construction for 2k active clusters: Python-loop
+pairwise cosine (previous implementation) vs. blocked matrix products, plus
+a cached rebuild with unchanged data and the level-of-detail overview. The
+loop baseline alone takes minutes.
+
+Run from the repository root:
+    python -m benchmarks.bench_graph
+"""
+
+import time
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard import graph
+from src.dashboard.graph import build_cluster_graph, cosine, similarity_edges, MAX_SIGNALS_PER_CLUSTER
+
+N_CLUSTERS = 2_000
+DIM = 384
+
+
+def legacy_edge_count(clusters):
+    """Pairwise loops of the previous build_cluster_graph (edges only)."""
+    edges = 0
+    for cluster in clusters:
+        visible = sorted(zip(cluster["signals"], cluster["embeddings"]), key=lambda x: x[0]["timestamp"], reverse=True)
+        visible = visible[:MAX_SIGNALS_PER_CLUSTER]
+        for i in range(len(visible)):
+            for j in range(i + 1, len(visible)):
+                if cosine(visible[i][1], visible[j][1]) > 0.65:
+                    edges += 1
+    for i in range(len(clusters)):
+        for j in range(i + 1, len(clusters)):
+            if cosine(clusters[i]["centroid"], clusters[j]["centroid"]) > 0.7:
+                edges += 1
+    return edges
+
+
+def vectorized_edge_count(clusters):
+    edges = 0
+    for cluster in clusters:
+        visible = sorted(zip(cluster["signals"], cluster["embeddings"]), key=lambda x: x[0]["timestamp"], reverse=True)
+        edges += len(similarity_edges([emb for _, emb in visible[:MAX_SIGNALS_PER_CLUSTER]], 0.65)[0])
+    edges += len(similarity_edges([c["centroid"] for c in clusters], 0.7)[0])
+    return edges
+
+
+def main():
+    print(f"[INFO] Generating {N_CLUSTERS} synthetic clusters...")
+    clusters = make_clusters(N_CLUSTERS, max_signals=25, dim=DIM)
+    for cluster in clusters:
+        cluster["label"] = f"Cluster {cluster['cluster_id'][:8]}"
+
+    start = time.perf_counter()
+    legacy_edges = legacy_edge_count(clusters)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    edges = vectorized_edge_count(clusters)
+    vectorized_ms = (time.perf_counter() - start) * 1000
+
+    assert edges == legacy_edges, (edges, legacy_edges)
+    print(f"edges (loops)      {legacy_ms:9.1f} ms ({legacy_edges} edges)")
+    print(f"edges (blocked)    {vectorized_ms:9.1f} ms ({edges} edges)")
+
+    graph._graph_cache.clear()
+
+    start = time.perf_counter()
+    build_cluster_graph(clusters)
+    print(f"build (cold)       {(time.perf_counter() - start) * 1000:9.1f} ms (edges + networkx + pyvis HTML)")
+
+    start = time.perf_counter()
+    full_html = build_cluster_graph(clusters)
+    print(f"build (cached)     {(time.perf_counter() - start) * 1000:9.1f} ms (hash of the cluster set only)")
+
+    start = time.perf_counter()
+    overview_html = build_cluster_graph(clusters, detail="overview")
+    print(f"build (overview)   {(time.perf_counter() - start) * 1000:9.1f} ms (cluster nodes + kNN edges)")
+    print(f"payload            {len(full_html) / 1e6:9.1f} MB full, {len(overview_html) / 1e6:.1f} MB overview")
+
+
+if __name__ == "__main__":
+    main()
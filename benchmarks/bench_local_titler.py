@@ -0,0 +1,66 @@
+# benchmarks/bench_local_titler.py
+"""
+Benchmark local keyword titles for 5k synthetic clusters (~50k signals):
+the previous per-cluster regex + Counter fallback vs. the vectorized
+TF-IDF titler (from persisted keyword_tf), plus building and incrementally
+updating the signal-corpus document frequencies.
+
+Run from the repository root:
+    python -m benchmarks.bench_local_titler
+"""
+
+import re
+import time
+from collections import Counter
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.keyword_index import ensure_keyword_tf
+from src.dashboard.local_titler import DocumentFrequencies, LocalTitler
+
+N_CLUSTERS = 5_000
+BATCH_SIGNALS = 300
+
+
+def previous_fallback_title(signals):
+    """The regex + Counter fallback this replaces (capitalized words of 5 signals)."""
+    words = []
+    for s in signals[:5]:
+        words.extend(re.findall(r'\b[A-Z][a-z]+\b', s))
+    if not words:
+        return "Emerging Technology Cluster"
+    return " / ".join(w for w, _ in Counter(words).most_common(3))
+
+
+def timed(label, fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<40} {best * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    clusters = make_clusters(N_CLUSTERS, max_signals=20)
+    for cluster in clusters:
+        ensure_keyword_tf(cluster)
+    texts = [s["text"] for c in clusters for s in c["signals"]]
+    print(f"{len(clusters)} clusters, {len(texts)} signals")
+
+    timed("previous fallback (per cluster)", lambda: {
+        c["cluster_id"]: previous_fallback_title([s["text"] for s in c["signals"]]) for c in clusters
+    })
+
+    doc_freqs = timed("document frequencies (full corpus)", lambda: DocumentFrequencies().add_texts(texts), repeat=1)
+    timed(f"document frequencies (+{BATCH_SIGNALS} signals)", lambda: doc_freqs.add_texts(texts[:BATCH_SIGNALS]), repeat=1)
+
+    titler = LocalTitler(doc_freqs)
+    titles = timed("TF-IDF titles (one vectorized pass)", lambda: titler.title_clusters(clusters))
+    timed("TF-IDF title (single cluster)", lambda: titler.title_texts([s["text"] for s in clusters[0]["signals"]]))
+    print(f"example: {titles[clusters[0]['cluster_id']]!r} vs {previous_fallback_title([s['text'] for s in clusters[0]['signals']])!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_neighbor_graph.py
+"""
+Benchmark the persistent kNN neighbor lists for 2k clusters (~26k signals):
+full build, an incremental ingest batch, compaction, storage footprint, and
+graph edge extraction from the stored lists vs. recomputing similarities.
+
+Run from the repository root:
+    python -m benchmarks.bench_neighbor_graph
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_clusters
+from src.clustering.neighbor_graph import (
+    update_neighbor_graph,
+    compact_neighbor_graph,
+    neighbor_graph_footprint,
+    signal_edges,
+    cluster_edges,
+)
+from src.dashboard.graph import similarity_edges, MAX_SIGNALS_PER_CLUSTER
+
+N_CLUSTERS = 2_000
+DIM = 384
+BATCH_SIGNALS = 300
+
+
+def hold_out_batch(clusters, n_signals):
+    """Remove the newest member of random clusters, as if they had not been ingested yet."""
+    rng = np.random.default_rng(1)
+    held_out = []
+    for i in rng.permutation(len(clusters)):
+        cluster = clusters[i]
+        if len(cluster["signals"]) > 1:
+            held_out.append((cluster, cluster["signals"].pop(), cluster["embeddings"].pop()))
+            cluster["centroid"] = np.mean(cluster["embeddings"], axis=0).tolist()
+        if len(held_out) == n_signals:
+            break
+    return held_out
+
+
+def main():
+    print(f"[INFO] Generating {N_CLUSTERS} synthetic clusters...")
+    clusters = make_clusters(N_CLUSTERS, max_signals=25, dim=DIM)
+    held_out = hold_out_batch(clusters, BATCH_SIGNALS)
+
+    start = time.perf_counter()
+    stats = update_neighbor_graph(clusters)
+    print(f"build (full)       {(time.perf_counter() - start) * 1000:9.1f} ms ({stats['new_signals']} signals)")
+
+    for cluster, signal, embedding in held_out:
+        cluster["signals"].append(signal)
+        cluster["embeddings"].append(embedding)
+        cluster["centroid"] = np.mean(cluster["embeddings"], axis=0).tolist()
+
+    start = time.perf_counter()
+    stats = update_neighbor_graph(clusters, new_signal_ids={signal["signal_id"] for _, signal, _ in held_out})
+    print(f"update (batch)     {(time.perf_counter() - start) * 1000:9.1f} ms "
+          f"({stats['new_signals']} new signals, {stats['updated_clusters']} clusters updated)")
+
+    # Simulate retention: dropped clusters and expired signals leave dangling entries behind
+    remaining = clusters[N_CLUSTERS // 10:]
+    expired = 0
+    for cluster in remaining:
+        if len(cluster["signals"]) > 2:
+            cluster["signals"].pop(0)
+            cluster["embeddings"].pop(0)
+            expired += 1
+    start = time.perf_counter()
+    compaction = compact_neighbor_graph(remaining)
+    print(f"compaction         {(time.perf_counter() - start) * 1000:9.1f} ms "
+          f"({compaction['entries_before'] - compaction['entries_after']} dangling entries dropped "
+          f"after removing {N_CLUSTERS // 10} clusters and {expired} signals)")
+
+    footprint = neighbor_graph_footprint(remaining)
+    n_signals = sum(len(c["signals"]) for c in remaining)
+    dense_bytes = n_signals * n_signals * 4
+    print(f"footprint          {footprint['bytes'] / 1e6:9.1f} MB JSON, {footprint['entries']} entries, "
+          f"{footprint['bytes'] / n_signals:.0f} B/signal (dense float32 matrix: {dense_bytes / 1e9:.1f} GB)")
+
+    start = time.perf_counter()
+    edges = 0
+    for cluster in remaining:
+        visible = sorted(zip(cluster["signals"], cluster["embeddings"]), key=lambda x: x[0]["timestamp"], reverse=True)
+        edges += len(similarity_edges([emb for _, emb in visible[:MAX_SIGNALS_PER_CLUSTER]], 0.65)[0])
+    edges += len(similarity_edges([c["centroid"] for c in remaining], 0.7)[0])
+    print(f"edges (computed)   {(time.perf_counter() - start) * 1000:9.1f} ms ({edges} edges)")
+
+    start = time.perf_counter()
+    edges = 0
+    for cluster in remaining:
+        visible = sorted(cluster["signals"], key=lambda s: s["timestamp"], reverse=True)
+        edges += len(signal_edges([s["signal_id"] for s in visible[:MAX_SIGNALS_PER_CLUSTER]], cluster["signal_neighbors"])[0])
+    edges += len(cluster_edges(remaining)[0])
+    print(f"edges (stored)     {(time.perf_counter() - start) * 1000:9.1f} ms ({edges} edges, kNN-sparsified)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_render.py
+"""
+Benchmark the dashboard render data path (no Streamlit) with and without ClusterCatalog.
+
+Run from the repository root:
+    python -m benchmarks.bench_render
+"""
+
+import time
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.catalog import ClusterCatalog
+from src.dashboard.feed import build_emerging_feed
+
+N_CLUSTERS = 20_000
+ACTIVE_MIN = 3
+CLUSTERS_PER_PAGE = 5
+
+
+def render_linear(candidates, original_candidates):
+    """Data path of app.py before the catalog: list comprehensions + next() lookups."""
+    active_clusters = [c for c in candidates if c["signal_count"] >= ACTIVE_MIN]
+    candidate_clusters = [c for c in candidates if c["signal_count"] < ACTIVE_MIN]
+    active_clusters = [c for c in active_clusters if c["signal_count"] < 10]
+
+    feed = build_emerging_feed(active_clusters)
+    for item in feed[:CLUSTERS_PER_PAGE]:
+        next(c for c in active_clusters if c["cluster_id"] == item["cluster_id"])
+        next(c for c in original_candidates if c["cluster_id"] == item["cluster_id"])
+
+    for c in candidate_clusters:
+        next(orig_c for orig_c in original_candidates if orig_c["cluster_id"] == c["cluster_id"])
+
+
+def render_catalog(candidates, original_catalog):
+    """Data path of app.py with ClusterCatalog."""
+    catalog = ClusterCatalog(candidates)
+    active_range = (ACTIVE_MIN, 10)
+    catalog.select(*active_range)
+    candidate_clusters = catalog.select(max_signals=ACTIVE_MIN)
+
+    feed = catalog.emerging_feed(*active_range)
+    for item in feed[:CLUSTERS_PER_PAGE]:
+        catalog.get(item["cluster_id"])
+        original_catalog.get(item["cluster_id"])
+
+    for c in candidate_clusters:
+        original_catalog.get(c["cluster_id"])
+
+
+def main():
+    print(f"[INFO] Generating {N_CLUSTERS} synthetic clusters...")
+    clusters = make_clusters(N_CLUSTERS)
+
+    start = time.perf_counter()
+    render_linear(clusters, clusters)
+    linear_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    original_catalog = ClusterCatalog(clusters)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_catalog(clusters, original_catalog)
+    catalog_s = time.perf_counter() - start
+
+    print(f"Linear lookups:          {linear_s * 1000:9.1f} ms")
+    print(f"Catalog build (cached):  {build_s * 1000:9.1f} ms")
+    print(f"Catalog render:          {catalog_s * 1000:9.1f} ms")
+    print(f"Speedup (render):        {linear_s / catalog_s:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_search_lexical.py
+"""
+Benchmark lexical scoring per query: re-tokenizing every signal vs. the inverted KeywordIndex.
+
+Run from the repository root:
+    python -m benchmarks.bench_search_lexical
+"""
+
+import time
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.keyword_index import KeywordIndex
+from src.dashboard.search import extract_keywords, compute_lexical_score
+
+CLUSTER_COUNTS = [10_000, 100_000]
+QUERIES = ["AWS Trainium chip", "datacenter power grid", "quantum encryption", "liquid cooling startup"]
+
+
+def main():
+    for n_clusters in CLUSTER_COUNTS:
+        print(f"[INFO] Generating {n_clusters} synthetic clusters...")
+        clusters = make_clusters(n_clusters, max_signals=10)
+
+        start = time.perf_counter()
+        index = KeywordIndex.from_clusters(clusters)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        legacy_ms = []
+        index_ms = []
+        bm25_ms = []
+        for query in QUERIES:
+            query_keywords = extract_keywords(query)
+
+            start = time.perf_counter()
+            for cluster in clusters:
+                compute_lexical_score(query_keywords, cluster["signals"])
+            legacy_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            index.lexical_scores(query_keywords)
+            index_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            index.bm25_scores(query_keywords)
+            bm25_ms.append((time.perf_counter() - start) * 1000)
+
+        print(f"{n_clusters:>7} clusters | index build {build_ms:8.1f} ms (tokenizes all signals - done once at ingest)")
+        print(f"{'':>7}          | re-tokenize  {sum(legacy_ms) / len(QUERIES):8.1f} ms/query")
+        print(f"{'':>7}          | overlap      {sum(index_ms) / len(QUERIES):8.1f} ms/query")
+        print(f"{'':>7}          | bm25         {sum(bm25_ms) / len(QUERIES):8.1f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
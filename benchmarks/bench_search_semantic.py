@@ -0,0 +1,75 @@
+# benchmarks/bench_search_semantic.py
+"""
+Benchmark semantic scoring per query: per-cluster cosine_similarity loop vs. the
+normalized centroid matrix (one matrix-vector product + argpartition top-k).
+
+Query embeddings come from a seeded random projection so the benchmark measures
+scoring only, not the sentence-transformers model.
+
+Run from the repository root:
+    python -m benchmarks.bench_search_semantic
+"""
+
+import time
+import numpy as np
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.search import ClusterSearchIndex, cosine_similarity, search_clusters_hybrid
+from src.dashboard.keyword_index import KeywordIndex
+
+CLUSTER_COUNTS = [10_000, 50_000]
+DIM = 384
+TOP_K = 50
+QUERIES = ["AWS Trainium chip", "datacenter power grid", "quantum encryption", "liquid cooling startup"]
+
+
+class RandomQueryModel:
+    """Deterministic stand-in for EmbeddingModel.embed() on queries."""
+
+    def embed(self, text):
+        rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+        return rng.standard_normal(DIM).astype(np.float32)
+
+
+def main():
+    model = RandomQueryModel()
+    for n_clusters in CLUSTER_COUNTS:
+        print(f"[INFO] Generating {n_clusters} synthetic clusters...")
+        clusters = make_clusters(n_clusters, max_signals=5, dim=DIM)
+
+        start = time.perf_counter()
+        search_index = ClusterSearchIndex(clusters)
+        keyword_index = KeywordIndex.from_clusters(clusters)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        loop_ms = []
+        matrix_ms = []
+        search_ms = []
+        for query in QUERIES:
+            query_embedding = model.embed(query)
+
+            start = time.perf_counter()
+            scores = [cosine_similarity(query_embedding, c["centroid"]) for c in clusters]
+            sorted(scores, reverse=True)
+            loop_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            scores = search_index.semantic_scores(query_embedding)
+            np.argpartition(-scores, TOP_K - 1)[:TOP_K]
+            matrix_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            search_clusters_hybrid(
+                query, clusters, model, min_final_score=0.0,
+                keyword_index=keyword_index, search_index=search_index, top_k=TOP_K
+            )
+            search_ms.append((time.perf_counter() - start) * 1000)
+
+        print(f"{n_clusters:>7} clusters | index build   {build_ms:8.1f} ms (once per data version)")
+        print(f"{'':>7}          | cosine loop   {sum(loop_ms) / len(QUERIES):8.1f} ms/query")
+        print(f"{'':>7}          | matrix top-k  {sum(matrix_ms) / len(QUERIES):8.1f} ms/query")
+        print(f"{'':>7}          | full search   {sum(search_ms) / len(QUERIES):8.1f} ms/query (top_k={TOP_K})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_signal_search.py
+"""
+Benchmark signal-level search: exact scan over all member embeddings vs. the
+IVF probe (clusters as coarse lists) used by the dashboard's signal mode.
+
+Run from the repository root:
+    python -m benchmarks.bench_signal_search
+"""
+
+import time
+import numpy as np
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.time_index import TimeIndex
+from src.dashboard.signal_search import SignalSearchIndex
+
+N_CLUSTERS = 20_000
+DIM = 128
+TOP_K = 200
+N_QUERIES = 20
+N_PROBES = [None, 1024, 256, 64]
+
+
+def main():
+    print(f"[INFO] Generating {N_CLUSTERS} synthetic clusters...")
+    clusters = make_clusters(N_CLUSTERS, max_signals=20, dim=DIM)
+
+    start = time.perf_counter()
+    index = SignalSearchIndex(TimeIndex(clusters))
+    print(f"[INFO] Indexed {len(index)} signals in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rng = np.random.default_rng(1)
+    queries = rng.standard_normal((N_QUERIES, DIM)).astype(np.float32)
+    exact = [{row for row, _ in index.search(q, top_k=TOP_K, n_probe=None)[0]} for q in queries]
+
+    for n_probe in N_PROBES:
+        elapsed = []
+        recall = []
+        for q, truth in zip(queries, exact):
+            hits, stats = index.search(q, top_k=TOP_K, days=90, n_probe=n_probe)
+            elapsed.append(stats["elapsed_ms"])
+            hits, _ = index.search(q, top_k=TOP_K, n_probe=n_probe)
+            recall.append(len({row for row, _ in hits} & truth) / TOP_K)
+        label = "exact" if n_probe is None else f"n_probe={n_probe}"
+        print(f"{label:>13} | {np.mean(elapsed):7.2f} ms/query (90-day window) | recall@{TOP_K} {np.mean(recall):.2f}")
+
+
+if __name__ == "__main__":
+    main()
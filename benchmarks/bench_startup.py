@@ -0,0 +1,128 @@
+# benchmarks/bench_startup.py
+"""
+Benchmark process startup cost of src.dashboard.gemini_explainer.
+
+Each scenario runs in a fresh interpreter. The title cache is backed by an
+in-memory Qdrant collection of N_TITLES titles behind a client that adds
+ROUND_TRIP_SECONDS per request, standing in for Qdrant Cloud:
+
+- eager: import + synchronous cache load + Gemini SDK import, i.e. what
+  every import paid before loading became lazy
+- lazy import: import only (no network, no SDK)
+- first lookup: the load moved to the first title lookup
+- preload: import, start the background preload, do STARTUP_WORK_SECONDS of
+  other startup work, then look up the first title (time of the lookup)
+
+The fake Qdrant is built before timing starts, so the qdrant_client import
+itself is not counted (the dashboard imports it elsewhere anyway).
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import subprocess
+import sys
+import time
+import uuid
+
+N_TITLES = 2_000
+ROUND_TRIP_SECONDS = 0.08
+STARTUP_WORK_SECONDS = 0.5
+RUNS = 3
+
+
+class SlowClient:
+    """Wraps a client and sleeps once per call, like a remote round trip."""
+
+    def __init__(self, client, round_trip: float):
+        self._client = client
+        self._round_trip = round_trip
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            time.sleep(self._round_trip)
+            return attr(*args, **kwargs)
+        return call
+
+
+def make_title_client(n_titles: int = N_TITLES, round_trip: float = ROUND_TRIP_SECONDS) -> SlowClient:
+    from qdrant_client import QdrantClient
+    from qdrant_client.http.models import PointStruct
+    from src.dashboard.title_cache import TITLE_COLLECTION
+
+    client = QdrantClient(":memory:")
+    client.create_collection(TITLE_COLLECTION, vectors_config={})
+    ids = [str(uuid.UUID(int=i + 1)) for i in range(n_titles)]
+    client.upsert(TITLE_COLLECTION, points=[
+        PointStruct(id=cid, vector={}, payload={"cluster_id": cid, "title": f"Title {i}"})
+        for i, cid in enumerate(ids)
+    ])
+    return SlowClient(client, round_trip)
+
+
+SCENARIOS = {
+    "eager": """
+t = time.perf_counter()
+import src.dashboard.gemini_explainer as ge
+ge._title_cache._client = client
+ge._title_cache.ensure_loaded()
+ge._get_genai()
+ready = time.perf_counter() - t
+""",
+    "lazy import": """
+t = time.perf_counter()
+import src.dashboard.gemini_explainer as ge
+ready = time.perf_counter() - t
+""",
+    "first lookup": """
+import src.dashboard.gemini_explainer as ge
+ge._title_cache._client = client
+t = time.perf_counter()
+ge._title_cache.get(str(uuid.UUID(int=1)))
+ready = time.perf_counter() - t
+""",
+    "preload": f"""
+import src.dashboard.gemini_explainer as ge
+ge._title_cache._client = client
+ge.preload_title_cache()
+time.sleep({STARTUP_WORK_SECONDS})
+t = time.perf_counter()
+ge._title_cache.get(str(uuid.UUID(int=1)))
+ready = time.perf_counter() - t
+""",
+}
+
+PRELUDE = """
+import json, time, uuid, warnings
+warnings.simplefilter("ignore")
+from benchmarks.bench_startup import make_title_client
+client = make_title_client()
+"""
+
+
+def run_scenario(code: str) -> float:
+    script = PRELUDE + code + "\nprint(json.dumps({'ready': ready}))\n"
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])["ready"]
+
+
+def main():
+    labels = {
+        "eager": "eager (previous import)",
+        "lazy import": "lazy import",
+        "first lookup": "first lookup, no preload",
+        "preload": f"first lookup after {STARTUP_WORK_SECONDS}s work",
+    }
+    print(f"{N_TITLES} cached titles, {ROUND_TRIP_SECONDS * 1000:.0f} ms per Qdrant request, best of {RUNS}")
+    for name, code in SCENARIOS.items():
+        best = min(run_scenario(code) for _ in range(RUNS))
+        print(f"{labels[name]:<34} {best * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_tiering.py
+"""
+Benchmark hot/warm/cold tiering on 5k synthetic clusters spread over two
+years: size and load time of the working set with and without evicting
+clusters dormant beyond 90 days, archiving them, matching a new batch
+against the cold index, and an on-demand search over the archive.
+
+Run from the repository root:
+    python -m benchmarks.bench_tiering
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import make_clusters
+from src.memory.tiering import ColdStore, split_by_tier
+
+N_CLUSTERS = 5_000
+DIM = 64
+HISTORY_DAYS = 730
+HORIZON_DAYS = 90
+N_BATCH_CLUSTERS = 50
+
+
+class RandomEmbeddingModel:
+    """Deterministic pseudo-embeddings (the search cost does not depend on the model)."""
+
+    def embed(self, text):
+        return np.random.default_rng(abs(hash(text)) % 2**32).normal(size=DIM).astype(np.float32)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<44} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    clusters = make_clusters(N_CLUSTERS, max_signals=10, dim=DIM, history_days=HISTORY_DAYS)
+    working, dormant = timed("split by tier", lambda: split_by_tier(clusters, horizon_days=HORIZON_DAYS))
+
+    full_json = json.dumps(clusters)
+    working_json = json.dumps(working)
+    print(f"working set: {len(working)}/{len(clusters)} clusters, "
+          f"{len(working_json) / 2**20:.1f} MB vs {len(full_json) / 2**20:.1f} MB")
+    timed("load all clusters (JSON)", lambda: json.loads(full_json))
+    timed("load working set (JSON)", lambda: json.loads(working_json))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ColdStore(Path(tmp) / "cold.jsonl.gz", Path(tmp) / "cold_index.npz", use_qdrant=False)
+        timed(f"archive {len(dormant)} dormant clusters", lambda: store.archive(dormant))
+        print(f"archive: {store.path.stat().st_size / 2**20:.1f} MB compressed, "
+              f"index {store.index_path.stat().st_size / 2**20:.1f} MB")
+
+        batch_centroids = [c["centroid"] for c in dormant[:N_BATCH_CLUSTERS // 2]] + \
+            np.random.default_rng(1).normal(size=(N_BATCH_CLUSTERS // 2, DIM)).tolist()
+        fresh = ColdStore(store.path, store.index_path, use_qdrant=False)
+        matches = timed(f"match {N_BATCH_CLUSTERS} batch clusters (index only)", lambda: fresh.match(batch_centroids, threshold=0.9))
+        print(f"revive candidates: {len(matches)}")
+
+        model = RandomEmbeddingModel()
+        timed("first archive search (reads archive)", lambda: fresh.search("gpu supply chain", model, top_k=50))
+        timed("next archive search", lambda: fresh.search("quantum encryption", model, top_k=50))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_time_filter.py
+"""
+Benchmark time-window filtering (slider moves) on ~1M signals.
+
+Run from the repository root:
+    python -m benchmarks.bench_time_filter
+"""
+
+import time
+
+from benchmarks.synthetic import make_clusters
+from src.dashboard.time_index import TimeIndex
+
+N_CLUSTERS = 50_000
+MAX_SIGNALS = 39  # ~20 signals per cluster on average => ~1M signals
+SLIDER_POSITIONS = [7, 30, 60, 90, 120]
+
+
+def main():
+    print(f"[INFO] Generating {N_CLUSTERS} synthetic clusters...")
+    clusters = make_clusters(N_CLUSTERS, max_signals=MAX_SIGNALS)
+    total_signals = sum(c["signal_count"] for c in clusters)
+    print(f"[INFO] {total_signals} signals")
+
+    start = time.perf_counter()
+    index = TimeIndex(clusters)
+    print(f"Index build (once per data version): {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    # Second pass reflects steady-state slider moves (first pass includes allocator warm-up)
+    for days in SLIDER_POSITIONS * 2:
+        start = time.perf_counter()
+        index.window_counts(days)
+        index.growth_ratios(days)
+        counts_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        filtered = index.filter(days)
+        filter_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{days:4d} days: counts+growth {counts_ms:7.1f} ms | filter {filter_ms:7.1f} ms | {len(filtered)} clusters")
+
+
+if __name__ == "__main__":
+    main()
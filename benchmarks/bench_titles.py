@@ -0,0 +1,50 @@
+# benchmarks/bench_titles.py
+"""
+Benchmark cluster title generation against a local LLM stand-in with
+simulated latency: one blocking request per cluster (previous main.py loop)
+vs. batched prompts on concurrent workers, plus a run where the endpoint
+answers the first requests with 429 + Retry-After.
+
+Run from the repository root:
+    python -m benchmarks.bench_titles
+"""
+
+import time
+
+from src.dashboard.llm_budget import LLMBudget
+from src.dashboard.title_service import TitleService
+from tests.llm_stub import LLMStub
+
+N_CLUSTERS = 64
+LATENCY_SECONDS = 0.25
+
+
+def make_items(n):
+    return [(f"cluster-{i}", [f"Signal {i}-{j} about an emerging trend" for j in range(5)]) for i in range(n)]
+
+
+def run(label, items, stub, **service_kwargs):
+    # Unlimited LLM budget: this measures batching and rate limiting only
+    budget = LLMBudget(max_calls_per_run=10 ** 6, max_calls_per_minute=10 ** 6)
+    service = TitleService(api_key="bench", api_base=stub.url, budget=budget, **service_kwargs)
+    start = time.perf_counter()
+    titles = service.generate_titles(items)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed * 1000:9.1f} ms  {len(titles)}/{len(items)} titles, "
+          f"{service.stats['requests']} requests, {service.stats['rate_limited']} rate-limited")
+
+
+def main():
+    items = make_items(N_CLUSTERS)
+
+    with LLMStub(latency=LATENCY_SECONDS) as stub:
+        run("sequential (1 per call)", items, stub, batch_size=1, max_workers=1, requests_per_minute=6000)
+        run("batched x8, 4 workers", items, stub, batch_size=8, max_workers=4, requests_per_minute=6000)
+        run("batched x8, 30 req/min", items, stub, batch_size=8, max_workers=4, requests_per_minute=30)
+
+    with LLMStub(latency=LATENCY_SECONDS, rate_limit_first=3, retry_after=1) as stub:
+        run("batched x8, 429 x3", items, stub, batch_size=8, max_workers=4, requests_per_minute=6000)
+
+
+if __name__ == "__main__":
+    main()
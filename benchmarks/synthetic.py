@@ -0,0 +1,79 @@
+# benchmarks/synthetic.py
+
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta
+import uuid
+import numpy as np
+
+VOCABULARY = (
+    "gpu supply chain shortage quantum encryption datacenter power grid energy agent "
+    "emergent behavior inference chip trainium liquid cooling open source model weights "
+    "policy incentive hardware startup training cluster network optical memory bandwidth "
+    "robotics battery fusion semiconductor fab export control satellite edge wireless"
+).split()
+
+SOURCES = [
+    "https://rss.arxiv.org/rss/cs.AI",
+    "https://semianalysis.substack.com/feed",
+    "https://www.datacenterdynamics.com/rss/"
+]
+
+
+def make_clusters(
+    n_clusters: int,
+    max_signals: int = 20,
+    dim: Optional[int] = None,
+    history_days: int = 120,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Generate synthetic clusters shaped like the ones loaded by candidate_store.
+
+    Args:
+        n_clusters: Number of clusters
+        max_signals: Upper bound on signals per cluster (uniform 1..max_signals)
+        dim: Embedding dimension, or None to skip embeddings/centroids
+        history_days: Timestamps are spread over this many days before now
+        seed: RNG seed for reproducible runs
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    clusters = []
+
+    for c in range(n_clusters):
+        count = int(rng.integers(1, max_signals + 1))
+        topic = rng.choice(VOCABULARY, size=3, replace=False)
+        offsets = np.sort(rng.uniform(0, history_days, size=count))[::-1]
+
+        signals = []
+        for j in range(count):
+            words = list(topic) + list(rng.choice(VOCABULARY, size=6))
+            signals.append({
+                "signal_id": f"sig-{c}-{j}",
+                "text": " ".join(words).capitalize() + ".",
+                "timestamp": (now - timedelta(days=float(offsets[j]))).isoformat(),
+                "source": SOURCES[int(rng.integers(len(SOURCES)))],
+                "domain": "emerging_technology",
+                "subdomain": ["ai", "compute", "energy"][int(rng.integers(3))],
+                "metadata": {}
+            })
+
+        cluster = {
+            "cluster_id": str(uuid.UUID(int=int(rng.integers(2**63)) << 64 | c)),
+            "signals": signals,
+            "signal_count": count,
+            "created_at": signals[0]["timestamp"],
+            "last_updated": signals[-1]["timestamp"],
+            "critic_report": None,
+            "controller_decision": None
+        }
+
+        if dim:
+            center = rng.normal(size=dim)
+            embeddings = center + 0.5 * rng.normal(size=(count, dim))
+            cluster["embeddings"] = embeddings.tolist()
+            cluster["centroid"] = embeddings.mean(axis=0).tolist()
+
+        clusters.append(cluster)
+
+    return clusters
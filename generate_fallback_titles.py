@@ -1,28 +1,16 @@
 """
 Generate fallback titles for all clusters (no Gemini API needed)
-Uses simple keyword extraction from signal texts
+Uses TF-IDF keyword titles (local_titler) over the loaded signal corpus
 """
 
 import os
 from dotenv import load_dotenv
 from qdrant_client import QdrantClient
-from collections import Counter
-import re
 
-load_dotenv()
+from src.dashboard.local_titler import DocumentFrequencies, LocalTitler
+from src.dashboard.title_cache import TitleCache
 
-def _fallback_title(signals):
-    """Fallback title generation - extract capitalized words"""
-    words = []
-    for s in signals[:5]:
-        words.extend(re.findall(r'\b[A-Z][a-z]+\b', s))
-    
-    if not words:
-        return "Emerging Technology Cluster"
-    
-    common = Counter(words).most_common(3)
-    title_words = [w for w, _ in common]
-    return " / ".join(title_words)
+load_dotenv()
 
 def main():
     client = QdrantClient(
@@ -91,33 +79,21 @@ def main():
     
     print(f"[INFO] Found {len(clusters)} clusters with signals\n")
     
-    success_count = 0
+    # Titles are written in batched upserts by a single flush (no per-title request)
+    title_cache = TitleCache(client=client, flush_interval=None)
     
-    for cluster in clusters:
-        cluster_id = cluster['cluster_id']
-        signal_texts = cluster['signal_texts']
-        
-        # Generate fallback title
-        title = _fallback_title(signal_texts)
-        
-        # Save to Qdrant cluster_titles collection
-        try:
-            # Use simple vector for title cache
-            client.upsert(
-                collection_name="cluster_titles",
-                points=[{
-                    "id": cluster_id,
-                    "vector": [0.5] * 384,  # Dummy embedding
-                    "payload": {
-                        "cluster_id": cluster_id,
-                        "title": title
-                    }
-                }]
-            )
-            print(f"  ✅ [{cluster_id[:8]}...] → {title}")
-            success_count += 1
-        except Exception as e:
-            print(f"  ❌ [{cluster_id[:8]}...] → {title} (failed: {e})")
+    # All clusters are titled in one vectorized pass, IDF over every loaded signal
+    titler = LocalTitler(DocumentFrequencies().add_texts(all_signals.values()))
+    titles = titler.title_clusters([
+        {'cluster_id': c['cluster_id'], 'signals': [{'text': t} for t in c['signal_texts']]}
+        for c in clusters
+    ])
+    
+    for cluster_id, title in titles.items():
+        title_cache.set(cluster_id, title)
+        print(f"  [{cluster_id[:8]}...] → {title}")
+    
+    success_count = title_cache.flush()
     
     print(f"\n{'='*60}")
     print(f"✅ Successfully generated {success_count} fallback titles")
@@ -15,18 +15,39 @@ from src.embeddings.embedding_model import EmbeddingModel
 # from src.memory.qdrant_client import QdrantMemory  # Lazy import to avoid pydantic issues
 # from src.memory.cluster_memory import ClusterMemory  # Lazy import
 from src.memory.candidate_store import load_candidates, save_candidates
-from src.clustering.contextualizer import contextualize_signal
-from src.clustering.persistence import check_persistence
-from src.clustering.proto_cluster import create_proto_cluster
+from src.memory.tiering import ColdStore, split_by_tier, evict_from_qdrant, TIER_DORMANT_HORIZON_DAYS
+from src.clustering.contextualizer import contextualize_signals_batch
+from src.clustering.persistence import check_persistence_batch
 from src.clustering.intra_batch_cluster import cluster_batch
 from src.clustering.cluster_evolution import evolve_clusters
+from src.clustering.neighbor_graph import update_neighbor_graph, compact_neighbor_graph
 from src.dashboard.feed import build_emerging_feed
+from src.dashboard.local_titler import (
+    DocumentFrequencies,
+    LocalTitler,
+    load_document_frequencies,
+    save_document_frequencies,
+    set_local_titler,
+)
 from src.scoring.critic_agent import evaluate_cluster
 from src.scoring.controller_agent import controller_decide
-from src.dashboard.gemini_explainer import generate_human_cluster_title
+from src.dashboard.gemini_explainer import (
+    refresh_cluster_titles,
+    flush_title_cache,
+    preload_title_cache,
+    precompute_cluster_answers,
+    flush_answer_cache,
+)
+from src.dashboard.llm_budget import get_llm_budget, start_llm_run
+from src.dashboard.snapshot import build_dashboard_snapshot, save_dashboard_snapshot
+from src.memory.data_version import new_data_version, publish_data_version
 
 VECTOR_SIZE = 384
 
+# Preset explainer questions are answered ahead of time for this many feed clusters
+# (one dashboard page)
+ANSWER_PRECOMPUTE_TOP_N = 5
+
 RSS_FEEDS = [
     {
         "url": "https://rss.arxiv.org/rss/cs.AI",
@@ -46,6 +67,13 @@ RSS_FEEDS = [
 ]
 
 
+def print_llm_report():
+    """Gemini spend and latency for this run (from the shared LLM budget)."""
+    print("[INFO] LLM spend this run:")
+    for line in get_llm_budget().format_report():
+        print(f"  {line}")
+
+
 def main(reset_seen_ids=False):
     # Reset seen IDs if requested
     if reset_seen_ids:
@@ -57,6 +85,12 @@ def main(reset_seen_ids=False):
         else:
             print("[INFO] No seen IDs file to reset")
 
+    # Title cache is needed at the end of the run; load it while ingestion runs
+    preload_title_cache()
+
+    # Fresh LLM budget for this run (per-run and per-minute caps on Gemini calls)
+    start_llm_run()
+
     # Initialize persistent candidate clusters (load from disk)
     candidate_clusters = load_candidates()
     print(f"[INFO] Loaded candidate clusters from disk: {len(candidate_clusters)}")
@@ -96,7 +130,8 @@ def main(reset_seen_ids=False):
         from src.memory.cluster_memory import ClusterMemory
         cluster_memory = ClusterMemory(
             collection_name="clusters_warm",
-            vector_size=VECTOR_SIZE
+            vector_size=VECTOR_SIZE,
+            hybrid_vectors=os.getenv("SEARCH_BACKEND", "memory") == "qdrant"
         )
     except Exception as e:
         print(f"[WARNING] Could not initialize cluster memory: {e}")
@@ -113,8 +148,26 @@ def main(reset_seen_ids=False):
             "embedding": embedding
         })
 
-    # 4) Store signals in memory
     embeddings = [item["embedding"] for item in signals_with_embeddings]
+
+    # 3b) Historical context for the whole batch: kNN searches in signals_hot sent as
+    # batched requests (reusing the embeddings above), then one persistence pass.
+    # Runs before the batch is stored so signals are not matched against themselves.
+    # The per-signal result travels with the signal into its cluster, where the critic
+    # (step 7) flags clusters with or without historical precedent.
+    if signal_memory:
+        try:
+            contextualized = contextualize_signals_batch(all_new_signals, embeddings, signal_memory)
+            persistence = check_persistence_batch(contextualized)
+            for item, result in zip(signals_with_embeddings, persistence["results"]):
+                item["signal"]["historical_matches"] = result["similar_count"]
+                item["signal"]["is_persistent"] = result["is_persistent"]
+            print(f"[INFO] Historical context: {persistence['persistent']} persistent signals, "
+                  f"{persistence['noise']} without similar past signals")
+        except Exception as e:
+            print(f"[WARNING] Could not contextualize signals: {e}")
+
+    # 4) Store signals in memory
     if signal_memory:
         signal_memory.upsert_signals(all_new_signals, embeddings)
     else:
@@ -126,6 +179,26 @@ def main(reset_seen_ids=False):
         similarity_threshold=0.50  # Higher threshold for broader clusters
     )
 
+    # 5b) Bring archived clusters back into the working set when the new batch continues
+    # their topic (matched against the cold-tier centroids, same threshold as step 6).
+    # They leave the cold tier only after the working set is saved (commit_restore, step 7);
+    # clusters already in the working set are leftovers of a run that died before that.
+    cold_store = ColdStore()
+    working_ids = {c["cluster_id"] for c in candidate_clusters}
+    revived = [
+        cluster for cluster in cold_store.restore(cold_store.match([c["centroid"] for c in batch_clusters]))
+        if cluster["cluster_id"] not in working_ids
+    ]
+    if revived:
+        if signal_memory:
+            for cluster in revived:
+                revived_embeddings = cluster.get("embeddings") or []
+                if len(revived_embeddings) != len(cluster["signals"]):
+                    revived_embeddings = [embedding_model.embed(s["text"]) for s in cluster["signals"]]
+                signal_memory.upsert_signals([Signal.from_dict(s) for s in cluster["signals"]], revived_embeddings)
+        candidate_clusters.extend(revived)
+        print(f"[INFO] Revived {len(revived)} archived clusters from the cold store")
+
     # 6) Evolve candidate clusters (merge new batch clusters into existing candidates)
     print(f"[DEBUG] Before evolution: {len(candidate_clusters)} existing candidates, {len(batch_clusters)} new batch clusters")
     candidate_clusters = evolve_clusters(
@@ -136,6 +209,48 @@ def main(reset_seen_ids=False):
     )
     print(f"[DEBUG] After evolution: {len(candidate_clusters)} total candidates")
 
+    # 6a) Tiering: clusters without a new signal for TIER_DORMANT_HORIZON_DAYS move to the
+    # cold store and leave clusters_warm / signals_hot, so they are no longer loaded,
+    # evaluated or filtered by the dashboard (the working set stays bounded)
+    new_signal_ids = {signal.signal_id for signal in all_new_signals}
+    touched_ids = {
+        c["cluster_id"] for c in candidate_clusters
+        if any(s["signal_id"] in new_signal_ids for s in c["signals"])
+    }
+    candidate_clusters, dormant_clusters = split_by_tier(candidate_clusters, keep_ids=touched_ids)
+    if dormant_clusters:
+        # Only clusters the cold tier stored are evicted; the others stay in the working set
+        archived_ids = set(cold_store.archive(dormant_clusters))
+        candidate_clusters.extend(c for c in dormant_clusters if c["cluster_id"] not in archived_ids)
+        dormant_clusters = [c for c in dormant_clusters if c["cluster_id"] in archived_ids]
+        evict_from_qdrant(
+            dormant_clusters,
+            cluster_client=cluster_memory.client if cluster_memory else None,
+            signal_client=signal_memory.client if signal_memory else None
+        )
+    print(f"[INFO] Tiering: {len(dormant_clusters)} clusters dormant > {TIER_DORMANT_HORIZON_DAYS} days archived, "
+          f"{len(cold_store)} in cold store, {len(candidate_clusters)} in working set")
+
+    # 6b) Maintain the persistent kNN neighbor lists (dashboard graph edges) - only new signals are scored
+    neighbor_stats = update_neighbor_graph(
+        candidate_clusters,
+        new_signal_ids=new_signal_ids
+    )
+    compaction = compact_neighbor_graph(candidate_clusters)
+    print(f"[INFO] Neighbor graph: {neighbor_stats['new_signals']} signals scored, "
+          f"{neighbor_stats['updated_clusters']} clusters updated, "
+          f"{compaction['entries_after']} edges ({compaction['bytes_after'] / 1024:.0f} KB)")
+
+    # 6c) Signal-corpus document frequencies for local keyword titles - only new signals are tokenized
+    doc_freqs = load_document_frequencies()
+    if doc_freqs.n_docs:
+        doc_freqs.add_texts(signal.text for signal in all_new_signals)
+    else:
+        doc_freqs = DocumentFrequencies.from_clusters(candidate_clusters)
+    save_document_frequencies(doc_freqs)
+    set_local_titler(LocalTitler(doc_freqs))
+    print(f"[INFO] Document frequencies: {doc_freqs.n_docs} signals, {len(doc_freqs)} terms")
+
     print(f"[INFO] Total candidate clusters: {len(candidate_clusters)}")
 
     # Show signal count distribution
@@ -190,25 +305,13 @@ def main(reset_seen_ids=False):
 
     # Store ALL clusters (active + candidates) to Qdrant warm memory
     if cluster_memory:
-        new_cluster_count = 0
         for cluster in candidate_clusters:
             cluster_memory.upsert_cluster(
                 proto_cluster=cluster,
                 embedding_model=embedding_model
             )
-            new_cluster_count += 1
         
         print(f"[INFO] Upserted {len(candidate_clusters)} clusters to Qdrant Cloud")
-        
-        # Generate titles for newly created clusters
-        if new_cluster_count > 0:
-            print(f"[INFO] Generating titles for {new_cluster_count} new clusters...")
-            for cluster in candidate_clusters:
-                signal_texts = [s["text"] for s in cluster["signals"]]
-                cluster_id = cluster["cluster_id"]
-                title = generate_human_cluster_title(signal_texts, cluster_id=cluster_id, use_cache=True)
-                print(f"  [{cluster_id[:8]}...] → {title}")
-            print(f"✅ Generated {new_cluster_count} cluster titles")
     else:
         print("[INFO] Skipping cluster storage to vector memory")
 
@@ -216,8 +319,42 @@ def main(reset_seen_ids=False):
     save_candidates(candidate_clusters)
     print(f"[INFO] Saved candidate clusters to disk: {len(candidate_clusters)}")
 
+    # Revived clusters are saved in the working set: drop them from the cold tier
+    committed = cold_store.commit_restore()
+    if committed:
+        print(f"[INFO] Removed {committed} revived clusters from the cold store")
+
+    # 7b) Titles in one bulk pass: new clusters, clusters that drifted or grew
+    # past the thresholds since their title was generated, and provisional
+    # fallback titles (batched, rate-limited, most emergent clusters first)
+    cluster_titles = {}
+    if cluster_memory and candidate_clusters:
+        cluster_titles, title_stats = refresh_cluster_titles(candidate_clusters)
+        regenerated = title_stats["new"] + title_stats["drift"] + title_stats["growth"] + title_stats["provisional"]
+        print(f"[INFO] Titles: {title_stats['new']} new, {title_stats['drift']} drifted, "
+              f"{title_stats['growth']} grown, {title_stats['provisional']} provisional retried, "
+              f"{title_stats['unchanged']} unchanged, {title_stats['baseline']} baselined")
+        for cluster_id, title in cluster_titles.items():
+            print(f"  [{cluster_id[:8]}...] → {title}")
+        print(f"✅ Generated {regenerated} cluster titles")
+        print(f"[INFO] Flushed {flush_title_cache()} cluster titles to Qdrant Cloud cache")
+
+    # Publish precomputed dashboard snapshot (read directly by app.py)
+    data_version = new_data_version()
+    snapshot = build_dashboard_snapshot(candidate_clusters, titles=cluster_titles, recent_days=30)
+    snapshot["data_version"] = data_version
+    if save_dashboard_snapshot(snapshot):
+        print(f"[INFO] Published dashboard snapshot {snapshot['snapshot_id'][:8]} to Qdrant Cloud")
+    else:
+        print(f"[INFO] Saved dashboard snapshot {snapshot['snapshot_id'][:8]} to disk")
+
+    # Publish the data version last so the dashboard cache only refreshes once everything is written
+    publish_data_version(data_version)
+    print(f"[INFO] Published data version {data_version}")
+
     if not active_clusters:
         print("[INFO] No active clusters yet (all are embryonic with <3 signals).")
+        print_llm_report()
         return
 
     # 8) Build Emerging Feed (only from active clusters)
@@ -229,6 +366,15 @@ def main(reset_seen_ids=False):
         print(f"   Size: {item['signal_count']} | Level: {item['emergence_level']} | Growth: {item['growth_ratio']:.2f}")
         print()
 
+    # 9) Answer the dashboard's preset questions for the top of the feed (served from the answer cache)
+    clusters_by_id = {c["cluster_id"]: c for c in active_clusters}
+    top_clusters = [clusters_by_id[item["cluster_id"]] for item in feed[:ANSWER_PRECOMPUTE_TOP_N]]
+    answer_stats = precompute_cluster_answers(top_clusters)
+    print(f"[INFO] Preset answers: {answer_stats['generated']} generated, {answer_stats['cached']} cached, "
+          f"{answer_stats['failed']} failed, {answer_stats['skipped']} skipped (over budget)")
+    print(f"[INFO] Flushed {flush_answer_cache()} answers to Qdrant Cloud cache")
+    print_llm_report()
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Weak Signal Engine - Emerging Technology Feed")
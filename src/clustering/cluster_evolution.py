@@ -5,6 +5,9 @@ import numpy as np
 from datetime import datetime
 import uuid
 
+from src.scoring.time_histogram import build_day_histogram, add_signals_to_histogram, ensure_day_histogram
+from src.dashboard.keyword_index import cluster_keyword_tf, add_signals_to_keyword_tf, ensure_keyword_tf
+
 
 def cosine_similarity(a: List[float], b: List[float]) -> float:
     a = np.array(a)
@@ -34,6 +37,8 @@ def evolve_clusters(
             embeddings = [embedding_model.embed(t) for t in texts]
             c["embeddings"] = embeddings
             c["centroid"] = compute_centroid(embeddings)
+        ensure_day_histogram(c)
+        ensure_keyword_tf(c)
 
     for new_cluster in new_batch_clusters:
         texts = [s["text"] for s in new_cluster["signals"]]
@@ -66,6 +71,8 @@ def evolve_clusters(
                     candidate["embeddings"].extend(new_signal_embeddings)
                     candidate["centroid"] = compute_centroid(candidate["embeddings"])
                     candidate["signal_count"] = len(candidate["signals"])
+                    add_signals_to_histogram(candidate["day_histogram"], new_signals_to_add)
+                    add_signals_to_keyword_tf(candidate["keyword_tf"], new_signals_to_add)
                 
                 merged = True
                 break
@@ -78,7 +85,9 @@ def evolve_clusters(
                 "embeddings": new_embeddings,
                 "centroid": new_centroid,
                 "signal_count": len(new_cluster["signals"]),
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": datetime.utcnow().isoformat(),
+                "day_histogram": build_day_histogram(new_cluster["signals"]),
+                "keyword_tf": cluster_keyword_tf(new_cluster["signals"])
             })
 
     return existing_candidates
\ No newline at end of file
@@ -1,27 +1,70 @@
 # src/clustering/contextualizer.py
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from src.ingestion.signal import Signal
 from src.embeddings.embedding_model import EmbeddingModel
 from src.memory.qdrant_client import QdrantMemory
 
+# Past signals at least this similar count as historical context
+# (same threshold as the intra-batch clustering in main.py)
+CONTEXT_MIN_SIMILARITY = 0.50
+
 
 def contextualize_signal(
     signal: Signal,
     embedding_model: EmbeddingModel,
     memory: QdrantMemory,
-    top_k: int = 10
+    top_k: int = 10,
+    score_threshold: Optional[float] = None
 ) -> Dict[str, Any]:
     embedding = embedding_model.embed(signal.text)
 
     similar_signals = memory.search_similar_signals(
         embedding=embedding,
-        top_k=top_k
+        top_k=top_k,
+        score_threshold=score_threshold
     )
 
     return {
         "signal": signal.to_dict(),
         "similar_count": len(similar_signals),
         "similar_signals": similar_signals
-    }
\ No newline at end of file
+    }
+
+
+def contextualize_signals_batch(
+    signals: List[Signal],
+    embeddings: List[List[float]],
+    memory: QdrantMemory,
+    top_k: int = 10,
+    score_threshold: Optional[float] = CONTEXT_MIN_SIMILARITY
+) -> List[Dict[str, Any]]:
+    """
+    Historical context for a whole ingest batch.
+
+    Reuses the embeddings already computed for the batch and sends the kNN
+    searches to Qdrant as batched requests (query_batch_points) instead of one
+    search per signal. Run it before the batch is stored, so signals are
+    not matched against themselves.
+
+    Args:
+        signals: New signals
+        embeddings: Their embeddings (same order)
+        memory: Signal memory (signals_hot)
+        top_k: Past signals to retrieve per signal
+        score_threshold: Minimum cosine similarity of a past signal
+
+    Returns:
+        One contextualize_signal()-shaped result per signal
+    """
+    similar = memory.search_similar_signals_batch(embeddings, top_k=top_k, score_threshold=score_threshold)
+
+    return [
+        {
+            "signal": signal.to_dict(),
+            "similar_count": len(similar_signals),
+            "similar_signals": similar_signals
+        }
+        for signal, similar_signals in zip(signals, similar)
+    ]
@@ -0,0 +1,320 @@
+# src/clustering/neighbor_graph.py
+
+from typing import List, Dict, Any, Optional, Set, Tuple
+from datetime import datetime
+import json
+import numpy as np
+
+# Neighbors kept per signal / per cluster, and the similarity an edge needs
+# (same thresholds as the dashboard graph's signal-signal and cross-cluster edges)
+SIGNAL_NEIGHBORS_K = 10
+CLUSTER_NEIGHBORS_K = 10
+SIGNAL_NEIGHBOR_THRESHOLD = 0.65
+CLUSTER_NEIGHBOR_THRESHOLD = 0.7
+
+# Similarities are stored rounded - 3 decimals is plenty for edge weights
+NEIGHBOR_DECIMALS = 3
+
+# Query rows per block when scoring new vectors against the whole set
+NEIGHBOR_BLOCK_SIZE = 1024
+
+NEIGHBOR_FIELDS = ("signal_neighbors", "cluster_neighbors")
+
+
+def _normalize_rows(vectors) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _cluster_vector(cluster: Dict[str, Any]):
+    """Centroid, or mean member embedding when no centroid is stored."""
+    if cluster.get("centroid") is not None:
+        return cluster["centroid"]
+    embeddings = cluster.get("embeddings")
+    if embeddings is not None and len(embeddings):
+        return np.mean(np.asarray(embeddings, dtype=np.float32), axis=0)
+    return None
+
+
+def _top_neighbors(rows: np.ndarray, cols: np.ndarray, values: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per row: the k best of the given sparse (row, col, score) entries, best first.
+
+    Works on the above-threshold entries only (a handful per row), so it
+    costs O(nnz log nnz) instead of a partition of every full row.
+
+    Returns:
+        (rows, cols, scores) sorted by row, then score desc
+    """
+    order = np.lexsort((-values, rows))
+    rows, cols, values = rows[order], cols[order], values[order]
+    # Rank within the row: position minus the row's first position
+    first = np.searchsorted(rows, rows, side="left")
+    keep = np.arange(len(rows)) - first < k
+    return rows[keep], cols[keep], values[keep]
+
+
+def _merge_neighbors(existing: List[List[Any]], candidates: List[Tuple[str, float]], k: int) -> List[List[Any]]:
+    """Union of two neighbor lists (candidates win on duplicates), best k first."""
+    best = {neighbor_id: similarity for neighbor_id, similarity in existing}
+    for neighbor_id, similarity in candidates:
+        best[neighbor_id] = round(float(similarity), NEIGHBOR_DECIMALS)
+    merged = sorted(best.items(), key=lambda x: x[1], reverse=True)[:k]
+    return [[neighbor_id, similarity] for neighbor_id, similarity in merged]
+
+
+def _scan(
+    matrix: np.ndarray,
+    query_rows: List[int],
+    ids: List[str],
+    k: int,
+    threshold: float,
+    is_query: np.ndarray
+) -> Tuple[Dict[str, List[List[Any]]], Dict[int, List[Tuple[str, float]]]]:
+    """
+    Score `query_rows` against every row of `matrix`, block by block.
+
+    Returns:
+        (fresh neighbor lists of the query rows,
+         reverse candidates: other row -> [(query id, similarity), ...] above threshold)
+    """
+    fresh: Dict[str, List[List[Any]]] = {}
+    reverse: Dict[int, List[Tuple[str, float]]] = {}
+    if len(matrix) < 2:
+        return {ids[row]: [] for row in query_rows}, reverse
+
+    for start in range(0, len(query_rows), NEIGHBOR_BLOCK_SIZE):
+        block = np.asarray(query_rows[start:start + NEIGHBOR_BLOCK_SIZE])
+        scores = matrix[block] @ matrix.T
+        scores[np.arange(len(block)), block] = -np.inf  # no self-loops
+
+        rows, cols = np.nonzero(scores > threshold)
+        values = scores[rows, cols]
+
+        for row in block.tolist():
+            fresh[ids[row]] = []
+        top_rows, top_cols, top_values = _top_neighbors(rows, cols, values, k)
+        for r, j, s in zip(top_rows.tolist(), top_cols.tolist(), top_values.tolist()):
+            fresh[ids[int(block[r])]].append([ids[j], round(s, NEIGHBOR_DECIMALS)])
+
+        # Rows outside the query set that may now list a query row as a neighbor
+        outside = ~is_query[cols]
+        for r, col, s in zip(rows[outside].tolist(), cols[outside].tolist(), values[outside].tolist()):
+            reverse.setdefault(col, []).append((ids[int(block[r])], s))
+
+    return fresh, reverse
+
+
+def update_neighbor_graph(
+    clusters: List[Dict[str, Any]],
+    new_signal_ids: Optional[Set[str]] = None,
+    k_signals: int = SIGNAL_NEIGHBORS_K,
+    k_clusters: int = CLUSTER_NEIGHBORS_K,
+    signal_threshold: float = SIGNAL_NEIGHBOR_THRESHOLD,
+    cluster_threshold: float = CLUSTER_NEIGHBOR_THRESHOLD
+) -> Dict[str, int]:
+    """
+    Incrementally maintain sparse kNN neighbor lists for signals and clusters.
+
+    Only new signals (and signals without a list yet) are scored against the
+    full embedding set - O(new x total) instead of all pairs - and existing
+    signals adopt a new signal when it beats their current neighbors. Cluster
+    lists are refreshed the same way for clusters whose membership changed.
+
+    Lists are stored on each cluster (persisted with its payload):
+    - signal_neighbors: {member signal_id: [[neighbor signal_id, similarity], ...]}
+    - cluster_neighbors: [[neighbor cluster_id, similarity], ...]
+    - neighbors_updated_at: set when any of the cluster's lists changed
+
+    Args:
+        clusters: All clusters, with member "embeddings" aligned to "signals"
+        new_signal_ids: Signals ingested in this run (None = only backfill missing lists)
+        k_signals: Neighbors kept per signal
+        k_clusters: Neighbors kept per cluster
+        signal_threshold: Minimum similarity of a signal edge
+        cluster_threshold: Minimum similarity of a cluster edge
+
+    Returns:
+        Stats: new_signals, changed_clusters, updated_clusters
+    """
+    new_signal_ids = new_signal_ids or set()
+    now = datetime.utcnow().isoformat()
+    updated = set()
+
+    # Pack member embeddings (lists are gathered globally: merges may move signals between clusters)
+    ids, vectors, owners = [], [], []
+    lists: Dict[str, List[List[Any]]] = {}
+    for ci, cluster in enumerate(clusters):
+        lists.update(cluster.get("signal_neighbors") or {})
+        for signal, embedding in zip(cluster.get("signals", []), cluster.get("embeddings") or []):
+            if embedding is not None:
+                ids.append(signal["signal_id"])
+                vectors.append(embedding)
+                owners.append(ci)
+
+    query_rows = [i for i, sid in enumerate(ids) if sid in new_signal_ids or sid not in lists]
+    gained = {owners[row] for row in query_rows}
+    if query_rows:
+        matrix = _normalize_rows(vectors)
+        is_query = np.zeros(len(ids), dtype=bool)
+        is_query[query_rows] = True
+        fresh, reverse = _scan(matrix, query_rows, ids, k_signals, signal_threshold, is_query)
+
+        lists.update(fresh)
+        updated |= gained
+        for row, candidates in reverse.items():
+            merged = _merge_neighbors(lists.get(ids[row], []), candidates, k_signals)
+            if merged != lists.get(ids[row]):
+                lists[ids[row]] = merged
+                updated.add(owners[row])
+
+    # Cluster lists: rescore clusters that gained signals or have no list yet
+    cluster_ids = [c["cluster_id"] for c in clusters]
+    known_ids = set(cluster_ids)
+    with_vector = [i for i, c in enumerate(clusters) if _cluster_vector(c) is not None]
+    changed = [
+        i for i in with_vector
+        if i in gained or clusters[i].get("cluster_neighbors") is None
+    ]
+    changed_ids = {cluster_ids[i] for i in changed}
+
+    if changed:
+        position = {ci: row for row, ci in enumerate(with_vector)}
+        vector_ids = [cluster_ids[i] for i in with_vector]
+        matrix = _normalize_rows([_cluster_vector(clusters[i]) for i in with_vector])
+        is_query = np.zeros(len(with_vector), dtype=bool)
+        is_query[[position[i] for i in changed]] = True
+        fresh, reverse = _scan(matrix, [position[i] for i in changed], vector_ids, k_clusters, cluster_threshold, is_query)
+
+        for i in changed:
+            clusters[i]["cluster_neighbors"] = fresh[cluster_ids[i]]
+            updated.add(i)
+        for row, ci in enumerate(with_vector):
+            if not is_query[row]:
+                old = clusters[ci].get("cluster_neighbors") or []
+                # Entries pointing at changed clusters are stale - replaced by the fresh similarities
+                kept = [e for e in old if e[0] not in changed_ids and e[0] in known_ids]
+                merged = _merge_neighbors(kept, reverse.get(row, []), k_clusters)
+                if merged != old:
+                    clusters[ci]["cluster_neighbors"] = merged
+                    updated.add(ci)
+
+    for ci, cluster in enumerate(clusters):
+        cluster["signal_neighbors"] = {
+            s["signal_id"]: lists.get(s["signal_id"], []) for s in cluster.get("signals", [])
+        }
+        cluster.setdefault("cluster_neighbors", [])
+        if ci in updated:
+            cluster["neighbors_updated_at"] = now
+
+    return {
+        "new_signals": len(query_rows),
+        "changed_clusters": len(changed),
+        "updated_clusters": len(updated)
+    }
+
+
+def compact_neighbor_graph(
+    clusters: List[Dict[str, Any]],
+    k_signals: int = SIGNAL_NEIGHBORS_K,
+    k_clusters: int = CLUSTER_NEIGHBORS_K
+) -> Dict[str, int]:
+    """
+    Drop dangling and redundant neighbor entries.
+
+    Removes lists of signals that are no longer members, entries pointing at
+    signals or clusters that no longer exist (or at themselves), duplicate
+    entries, and trims lists that exceed k (e.g., after k was lowered).
+
+    Returns:
+        Stats: entries_before, entries_after, bytes_before, bytes_after
+    """
+    before = neighbor_graph_footprint(clusters)
+    signal_ids = {s["signal_id"] for c in clusters for s in c.get("signals", [])}
+    cluster_ids = {c["cluster_id"] for c in clusters}
+
+    for cluster in clusters:
+        members = {s["signal_id"] for s in cluster.get("signals", [])}
+        cluster["signal_neighbors"] = {
+            sid: _merge_neighbors([], [(n, s) for n, s in entries if n in signal_ids and n != sid], k_signals)
+            for sid, entries in (cluster.get("signal_neighbors") or {}).items()
+            if sid in members
+        }
+        cluster["cluster_neighbors"] = _merge_neighbors([], [
+            (n, s) for n, s in cluster.get("cluster_neighbors") or []
+            if n in cluster_ids and n != cluster["cluster_id"]
+        ], k_clusters)
+
+    after = neighbor_graph_footprint(clusters)
+    return {
+        "entries_before": before["entries"],
+        "entries_after": after["entries"],
+        "bytes_before": before["bytes"],
+        "bytes_after": after["bytes"]
+    }
+
+
+def neighbor_graph_footprint(clusters: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Stored neighbor entries and their serialized size (bytes of JSON payload)."""
+    entries = 0
+    size = 0
+    for cluster in clusters:
+        signal_neighbors = cluster.get("signal_neighbors") or {}
+        entries += sum(len(v) for v in signal_neighbors.values()) + len(cluster.get("cluster_neighbors") or [])
+        for field in NEIGHBOR_FIELDS:
+            if field in cluster:
+                size += len(json.dumps(cluster[field], separators=(",", ":")))
+    return {"entries": entries, "bytes": size}
+
+
+def signal_edges(
+    signal_ids: List[str],
+    signal_neighbors: Dict[str, List[List[Any]]],
+    threshold: float = SIGNAL_NEIGHBOR_THRESHOLD
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precomputed edges among `signal_ids`, in the format of similarity_edges().
+
+    Returns:
+        (rows_i, rows_j, similarities) with i < j indexing into signal_ids
+    """
+    return _edges_from_lists(signal_ids, signal_neighbors, threshold)
+
+
+def cluster_edges(
+    clusters: List[Dict[str, Any]],
+    threshold: float = CLUSTER_NEIGHBOR_THRESHOLD,
+    k: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precomputed edges among `clusters` from their cluster_neighbors lists.
+
+    Args:
+        k: Use only each cluster's k best neighbors (None = the whole list)
+
+    Returns:
+        (rows_i, rows_j, similarities) with i < j indexing into clusters
+    """
+    neighbors = {c["cluster_id"]: (c.get("cluster_neighbors") or [])[:k] for c in clusters}
+    return _edges_from_lists([c["cluster_id"] for c in clusters], neighbors, threshold)
+
+
+def _edges_from_lists(
+    node_ids: List[str],
+    neighbors: Dict[str, List[List[Any]]],
+    threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    position = {node_id: i for i, node_id in enumerate(node_ids)}
+    edges: Dict[Tuple[int, int], float] = {}
+    for i, node_id in enumerate(node_ids):
+        for neighbor_id, similarity in neighbors.get(node_id, []):
+            j = position.get(neighbor_id)
+            if j is not None and j != i and similarity > threshold:
+                edges[(min(i, j), max(i, j))] = similarity
+
+    pairs = sorted(edges)
+    rows_i = np.array([i for i, _ in pairs], dtype=np.int64)
+    rows_j = np.array([j for _, j in pairs], dtype=np.int64)
+    return rows_i, rows_j, np.array([edges[p] for p in pairs], dtype=np.float64)
@@ -1,6 +1,6 @@
 # src/clustering/persistence.py
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 def check_persistence(
@@ -21,4 +21,24 @@ def check_persistence(
         "is_persistent": is_persistent,
         "similar_count": similar_count,
         "reason": reason
-    }
\ No newline at end of file
+    }
+
+def check_persistence_batch(
+    contextualized_outputs: List[Dict[str, Any]],
+    min_similar: int = 2
+) -> Dict[str, Any]:
+    """
+    Persistence check over a whole contextualized batch.
+
+    Returns:
+        {"results": one check_persistence() result per signal (same order),
+         "persistent": count, "noise": count}
+    """
+    results = [check_persistence(output, min_similar=min_similar) for output in contextualized_outputs]
+    persistent = sum(1 for result in results if result["is_persistent"])
+
+    return {
+        "results": results,
+        "persistent": persistent,
+        "noise": len(results) - persistent
+    }
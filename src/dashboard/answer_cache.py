@@ -0,0 +1,310 @@
+# src/dashboard/answer_cache.py
+
+from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict
+from pathlib import Path
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+from src.dashboard.title_cache import get_cache_client
+
+# Payload-only collection (no vectors) holding explainer answers
+ANSWER_COLLECTION = "cluster_answers"
+
+# Persistent cache file (fallback only)
+ANSWER_CACHE_FILE = Path("cluster_answer_cache.json")
+
+# LRU bound and answer lifetime (the key already changes when the cluster's content does)
+ANSWER_CACHE_MAX_ENTRIES = 1000
+ANSWER_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# New answers are written at most this often (and at exit)
+ANSWER_FLUSH_INTERVAL_SECONDS = 30.0
+ANSWER_FLUSH_BATCH_SIZE = 256
+
+
+def content_version(signals: List[Dict[str, Any]]) -> str:
+    """
+    Hash of the cluster's member set (sorted signal ids, text for signals without one).
+
+    Independent of signal order, and changes whenever a signal joins or leaves,
+    so the stored cluster and its (re-sorted) time-filtered copy share answers
+    while a grown cluster gets new ones.
+    """
+    members = sorted(s.get("signal_id") or s.get("text", "") for s in signals)
+    return hashlib.sha1("\x1f".join(members).encode("utf-8")).hexdigest()
+
+
+def normalize_question(question: str) -> str:
+    """Case, whitespace and trailing punctuation do not change the question."""
+    return re.sub(r"\s+", " ", question).strip().rstrip("?!. ").lower()
+
+
+def answer_key(version: str, question: str) -> str:
+    return f"{version}|{normalize_question(question)}"
+
+
+def _point_id(key: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, key))
+
+
+class AnswerCache:
+    """
+    LRU + TTL cache of explainer answers, shared by every session in the process.
+
+    Keyed by (content_version() of the cluster's signals, normalized question).
+    Loaded lazily on first use; new answers are written behind in batches to
+    a payload-only Qdrant collection (local JSON file as fallback), so
+    answers precomputed by main.py are served to the dashboard and vice versa.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        cache_file: Path = ANSWER_CACHE_FILE,
+        max_entries: int = ANSWER_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = ANSWER_CACHE_TTL_SECONDS,
+        flush_interval: Optional[float] = ANSWER_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        self._client = client
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        self._timer: Optional[threading.Timer] = None
+        self._collection_ready = False
+        self.stats = {"hits": 0, "remote_hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+        atexit.register(self.flush)
+
+    @property
+    def client(self) -> Optional[Any]:
+        if self._client is None:
+            self._client = get_cache_client()
+        return self._client
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._entries)
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        return self._clock() - entry["created_at"] > self.ttl_seconds
+
+    def get(self, version: str, question: str) -> Optional[str]:
+        """
+        Cached answer, or None if missing or older than the TTL.
+
+        A local miss is checked against Qdrant by point id (one lookup), so
+        answers written by another process since the load are found too.
+        """
+        self.ensure_loaded()
+        key = answer_key(version, question)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                self.stats["expired"] += 1
+                entry = None
+        if entry is None:
+            entry = self._fetch(key)
+        with self._lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+            self.stats["hits"] += 1
+            return entry["answer"]
+
+    def _fetch(self, key: str) -> Optional[Dict[str, Any]]:
+        client = self._client if self._collection_ready else None
+        if client is None:
+            return None
+        try:
+            points = client.retrieve(collection_name=ANSWER_COLLECTION, ids=[_point_id(key)], with_payload=True)
+        except Exception as e:
+            print(f"[WARNING] Could not look up answer in Qdrant: {e}")
+            return None
+        entry = points[0].payload if points else None
+        if entry is None or self._expired(entry):
+            return None
+        self.stats["remote_hits"] += 1
+        return entry
+
+    def set(self, version: str, question: str, answer: str, cluster_id: Optional[str] = None):
+        """Store an answer; it reaches Qdrant / disk with the next flush."""
+        self.ensure_loaded()
+        key = answer_key(version, question)
+        with self._lock:
+            self._entries[key] = {
+                "key": key,
+                "cluster_id": cluster_id,
+                "question": normalize_question(question),
+                "answer": answer,
+                "created_at": self._clock()
+            }
+            self._entries.move_to_end(key)
+            self._dirty.add(key)
+            self._evict()
+            self._schedule_flush()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            self._dirty.discard(key)
+            self.stats["evicted"] += 1
+
+    def _schedule_flush(self):
+        if self._timer is None and self.flush_interval is not None:
+            self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _ensure_collection(self, client: Any) -> bool:
+        if self._collection_ready:
+            return True
+        try:
+            client.get_collection(ANSWER_COLLECTION)
+        except Exception:
+            try:
+                client.create_collection(collection_name=ANSWER_COLLECTION, vectors_config={})
+            except Exception as e:
+                print(f"[WARNING] Could not create answer collection: {e}")
+                return False
+        self._collection_ready = True
+        return True
+
+    def ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self.load()
+
+    def _load_entries(self, entries: List[Dict[str, Any]]):
+        # Loaded answers rank below anything already used, newest last, so eviction drops the oldest
+        fresh = sorted((e for e in entries if e.get("key") and not self._expired(e)), key=lambda e: e["created_at"], reverse=True)
+        with self._lock:
+            for entry in fresh:
+                if entry["key"] not in self._entries:
+                    self._entries[entry["key"]] = entry
+                    self._entries.move_to_end(entry["key"], last=False)
+            self._evict()
+
+    def load(self) -> int:
+        """
+        Load unexpired answers from Qdrant (preferred) or the local file.
+
+        Expired answers are deleted from the collection while loading.
+
+        Returns:
+            Number of answers loaded
+        """
+        client = self.client
+        if client and self._ensure_collection(client):
+            try:
+                from qdrant_client.http import models
+                cutoff = self._clock() - self.ttl_seconds
+                try:
+                    client.delete(
+                        collection_name=ANSWER_COLLECTION,
+                        points_selector=models.FilterSelector(filter=models.Filter(must=[
+                            models.FieldCondition(key="created_at", range=models.Range(lt=cutoff))
+                        ]))
+                    )
+                except Exception as e:
+                    print(f"[WARNING] Could not prune expired answers: {e}")
+
+                entries = []
+                offset = None
+                while True:
+                    points, offset = client.scroll(
+                        collection_name=ANSWER_COLLECTION,
+                        limit=256,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=False
+                    )
+                    entries.extend(point.payload for point in points)
+                    if not points or offset is None:
+                        break
+                self._load_entries(entries)
+                print(f"[INFO] Loaded {len(self._entries)} cached answers from Qdrant Cloud")
+                self._loaded = True
+                return len(self._entries)
+            except Exception as e:
+                print(f"[WARNING] Could not load answer cache from Qdrant: {e}")
+
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    self._load_entries(json.load(f))
+                print(f"[INFO] Loaded {len(self._entries)} cached answers from local file")
+            except Exception as e:
+                print(f"[WARNING] Could not load answer cache from file: {e}")
+        self._loaded = True
+        return len(self._entries)
+
+    def flush(self) -> int:
+        """
+        Write new answers now (batched upserts; local file if Qdrant is unavailable).
+
+        Returns:
+            Number of answers written to Qdrant
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty = [dict(self._entries[key]) for key in self._dirty if key in self._entries]
+            self._dirty.clear()
+        if not dirty:
+            return 0
+
+        written = 0
+        client = self.client
+        if client and self._ensure_collection(client):
+            from qdrant_client.http.models import PointStruct
+            for start in range(0, len(dirty), ANSWER_FLUSH_BATCH_SIZE):
+                batch = dirty[start:start + ANSWER_FLUSH_BATCH_SIZE]
+                try:
+                    client.upsert(
+                        collection_name=ANSWER_COLLECTION,
+                        points=[PointStruct(id=_point_id(e["key"]), vector={}, payload=e) for e in batch]
+                    )
+                    written += len(batch)
+                except Exception as e:
+                    print(f"[WARNING] Could not save {len(batch)} answers to Qdrant: {e}")
+                    with self._lock:
+                        self._dirty.update(entry["key"] for entry in batch)
+
+        if written < len(dirty):
+            self._save_file()
+        return written
+
+    def _save_file(self):
+        try:
+            with self._lock:
+                entries = list(self._entries.values())
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"[WARNING] Could not save answer cache: {e}")
@@ -0,0 +1,88 @@
+# src/dashboard/catalog.py
+
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+from src.dashboard.feed import build_emerging_feed
+from src.scoring.time_histogram import HistogramIndex
+
+
+class ClusterCatalog:
+    """
+    Indexed, read-only view over a list of clusters.
+
+    Replaces the linear `next(c for c in clusters if ...)` lookups in the
+    dashboard with a hash index by cluster_id, a sorted index by signal count
+    and the emergence-sorted feed (computed once, on first use). Clusters are
+    returned as the same dict objects that were passed in - the catalog never
+    copies them.
+    """
+
+    def __init__(
+        self,
+        clusters: List[Dict[str, Any]],
+        recent_days: int = 30,
+        histogram_index: Optional[HistogramIndex] = None
+    ):
+        self.clusters = list(clusters)
+        self.recent_days = recent_days
+        self._histogram_index = histogram_index
+
+        # Hash index: cluster_id -> position
+        self._positions = {c["cluster_id"]: i for i, c in enumerate(self.clusters)}
+
+        # Sorted index by signal count (ascending, stable => original order within ties)
+        self._signal_counts = np.array([c["signal_count"] for c in self.clusters], dtype=np.int64)
+        self._by_signal_count = np.argsort(self._signal_counts, kind="stable")
+        self._sorted_counts = self._signal_counts[self._by_signal_count]
+
+        # Emergence-sorted feed is computed lazily, from the day histograms where they
+        # cover the clusters (histogram_index, if given, must be built over the same list)
+        self._feed = None
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def __iter__(self):
+        return iter(self.clusters)
+
+    def __contains__(self, cluster_id: str) -> bool:
+        return cluster_id in self._positions
+
+    def get(self, cluster_id: str) -> Optional[Dict[str, Any]]:
+        """O(1) lookup by cluster_id, or None if unknown."""
+        position = self._positions.get(cluster_id)
+        return self.clusters[position] if position is not None else None
+
+    def _positions_in_count_range(self, min_signals: Optional[int], max_signals: Optional[int]) -> np.ndarray:
+        lo = 0 if min_signals is None else np.searchsorted(self._sorted_counts, min_signals, side="left")
+        hi = len(self.clusters) if max_signals is None else np.searchsorted(self._sorted_counts, max_signals, side="left")
+        # Restore original order so results match a list comprehension over the clusters
+        return np.sort(self._by_signal_count[lo:hi])
+
+    def select(self, min_signals: Optional[int] = None, max_signals: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Clusters with min_signals <= signal_count < max_signals, in original order.
+
+        Uses binary search on the signal-count index instead of a full scan.
+        """
+        return [self.clusters[i] for i in self._positions_in_count_range(min_signals, max_signals)]
+
+    def _ensure_feed(self):
+        if self._feed is None:
+            self._feed = build_emerging_feed(
+                self.clusters, recent_days=self.recent_days, histogram_index=self._histogram_index
+            )
+
+    def emerging_feed(self, min_signals: Optional[int] = None, max_signals: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Emerging feed (sorted by emergence level, then growth ratio) restricted to
+        a signal-count range. Emergence is computed once per catalog.
+
+        Returns the same items as build_emerging_feed() over the selected clusters.
+        """
+        self._ensure_feed()
+        if min_signals is None and max_signals is None:
+            return [dict(item) for item in self._feed]
+        wanted = {self.clusters[i]["cluster_id"] for i in self._positions_in_count_range(min_signals, max_signals)}
+        return [dict(item) for item in self._feed if item["cluster_id"] in wanted]
@@ -0,0 +1,164 @@
+# src/dashboard/facets.py
+
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import threading
+import numpy as np
+
+from src.dashboard.time_index import TimeIndex
+
+# Facet name -> UI label
+FACETS = {
+    "domain": "Domain",
+    "subdomain": "Subdomain",
+    "source": "Source",
+    "critic_confidence": "Critic confidence",
+    "controller_action": "Controller action",
+    "emergence": "Emergence"
+}
+
+# Same thresholds and recent window as compute_emergence()
+EMERGENCE_RECENT_DAYS = 30
+
+# Windows (days, minute) whose time mask / emergence bitmaps are kept per index
+FACET_WINDOW_CACHE_SIZE = 8
+
+
+def _cluster_facet_values(cluster: Dict[str, Any]) -> Dict[str, set]:
+    """Static facet values of one cluster (signal-level facets are multi-valued)."""
+    signals = cluster.get("signals", [])
+    critic = cluster.get("critic_report") or {}
+    controller = cluster.get("controller_decision") or {}
+    return {
+        "domain": {s.get("domain") for s in signals if s.get("domain")},
+        "subdomain": {s.get("subdomain") for s in signals if s.get("subdomain")},
+        "source": {s.get("source") for s in signals if s.get("source")},
+        "critic_confidence": {critic["confidence"]} if critic.get("confidence") else set(),
+        "controller_action": {controller["final_action"]} if controller.get("final_action") else set()
+    }
+
+
+class FacetIndex:
+    """
+    Bitmap indexes for faceted filtering of the dashboard.
+
+    Every facet value owns one boolean array over the dataset (positions match
+    the TimeIndex / dataset order). Any combination of selected values plus the
+    time window resolves with bitwise OR (within a facet) and AND (across
+    facets), and option counts are bitmap popcounts - no cluster rescans.
+
+    Emergence depends on the time window, so its bitmaps are derived from the
+    TimeIndex window counts for the requested window. One index is shared by
+    every dashboard session, so the per-window bitmaps live in a small LRU
+    keyed by (days, minute) behind a lock.
+    """
+
+    def __init__(self, clusters: List[Dict[str, Any]], time_index: Optional[TimeIndex] = None):
+        self.n_clusters = len(clusters)
+        self.time_index = time_index if time_index is not None else TimeIndex(clusters)
+
+        positions: Dict[str, Dict[str, List[int]]] = {name: {} for name in FACETS if name != "emergence"}
+        for i, cluster in enumerate(clusters):
+            for name, values in _cluster_facet_values(cluster).items():
+                for value in values:
+                    positions[name].setdefault(value, []).append(i)
+
+        self.bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for name, by_value in positions.items():
+            self.bitmaps[name] = {}
+            for value in sorted(by_value):
+                bitmap = np.zeros(self.n_clusters, dtype=bool)
+                bitmap[by_value[value]] = True
+                self.bitmaps[name][value] = bitmap
+
+        self._window_cache: "OrderedDict[Tuple[int, datetime], Tuple[np.ndarray, Dict[str, np.ndarray]]]" = OrderedDict()
+        self._window_cache_lock = threading.Lock()
+
+    def _window_bitmaps(self, days: int, now: Optional[datetime] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """(time mask, emergence bitmaps) for a window - reused within the same minute."""
+        now = now or datetime.now()
+        key = (days, now.replace(second=0, microsecond=0))
+        with self._window_cache_lock:
+            cached = self._window_cache.get(key)
+            if cached is not None:
+                self._window_cache.move_to_end(key)
+                return cached
+
+        in_window = self.time_index.window_counts(days, now)
+        recent = self.time_index.window_counts(min(days, EMERGENCE_RECENT_DAYS), now)
+        ratios = np.divide(recent, in_window, out=np.zeros(self.n_clusters), where=in_window > 0)
+        time_mask = in_window > 0
+        emergence = {
+            "rapid": time_mask & (ratios >= 0.6),
+            "stable": time_mask & (ratios >= 0.3) & (ratios < 0.6),
+            "dormant": time_mask & (ratios < 0.3)
+        }
+        window = (time_mask, emergence)
+
+        with self._window_cache_lock:
+            self._window_cache[key] = window
+            self._window_cache.move_to_end(key)
+            while len(self._window_cache) > FACET_WINDOW_CACHE_SIZE:
+                self._window_cache.popitem(last=False)
+        return window
+
+    def facet_bitmaps(self, name: str, days: int, now: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """Value -> bitmap for one facet."""
+        if name == "emergence":
+            return self._window_bitmaps(days, now)[1]
+        return self.bitmaps.get(name, {})
+
+    def _facet_mask(self, name: str, selected: List[str], days: int, now: Optional[datetime]) -> Optional[np.ndarray]:
+        """OR of the selected values' bitmaps, or None if nothing is selected (no restriction)."""
+        if not selected:
+            return None
+        bitmaps = self.facet_bitmaps(name, days, now)
+        mask = np.zeros(self.n_clusters, dtype=bool)
+        for value in selected:
+            if value in bitmaps:
+                mask |= bitmaps[value]
+        return mask
+
+    def resolve(
+        self,
+        selections: Dict[str, List[str]],
+        days: int,
+        now: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, Dict[str, Dict[str, int]]]:
+        """
+        Resolve facet selections plus the time window.
+
+        Args:
+            selections: Facet name -> selected values (empty = no restriction)
+            days: Time window in days
+            now: Reference time (default: datetime.now())
+
+        Returns:
+            (mask over the dataset, facet counts). Counts for a facet apply the
+            time window and every *other* facet's selection (disjunctive counts),
+            so options of a facet stay selectable alongside each other.
+        """
+        # One reference time for the whole call, so every lookup sees the same window
+        now = now or datetime.now()
+        time_mask, _ = self._window_bitmaps(days, now)
+        facet_masks = {name: self._facet_mask(name, selections.get(name, []), days, now) for name in FACETS}
+
+        mask = time_mask.copy()
+        for facet_mask in facet_masks.values():
+            if facet_mask is not None:
+                mask &= facet_mask
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for name in FACETS:
+            # Disjunctive counts: AND of the time window and all *other* facets
+            base = time_mask.copy()
+            for other, facet_mask in facet_masks.items():
+                if other != name and facet_mask is not None:
+                    base &= facet_mask
+            counts[name] = {
+                value: int(np.count_nonzero(bitmap & base))
+                for value, bitmap in self.facet_bitmaps(name, days, now).items()
+            }
+
+        return mask, counts
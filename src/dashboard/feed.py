@@ -1,8 +1,9 @@
 # src/dashboard/feed.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from src.scoring.emergence import compute_emergence
+from src.scoring.time_histogram import HistogramIndex
 
 
 EMERGENCE_PRIORITY = {
@@ -14,12 +15,36 @@ EMERGENCE_PRIORITY = {
 
 def build_emerging_feed(
     proto_clusters: List[Dict[str, Any]],
-    recent_days: int = 30
+    recent_days: int = 30,
+    histogram_index: Optional[HistogramIndex] = None
 ) -> List[Dict[str, Any]]:
+    """
+    Clusters sorted by emergence level, then growth ratio.
+
+    With a prebuilt HistogramIndex (e.g., the dashboard's, already built for the
+    slider bounds), emergence of clusters whose day histogram covers all their
+    signals comes from its vectorized counts; the other clusters (e.g.,
+    time-filtered copies) and calls without an index use compute_emergence()
+    per cluster. Building an index for a single feed would cost more than it saves.
+
+    Args:
+        proto_clusters: Clusters to rank
+        recent_days: Emergence window
+        histogram_index: HistogramIndex built over `proto_clusters` (same order)
+    """
+    covered = [False] * len(proto_clusters)
+    if histogram_index is not None:
+        levels = histogram_index.emergence_levels(recent_days).tolist()
+        ratios = histogram_index.growth_ratios(recent_days).tolist()
+        covered = histogram_index.covered.tolist()
+
     feed = []
 
-    for cluster in proto_clusters:
-        emergence = compute_emergence(cluster, recent_days=recent_days)
+    for i, cluster in enumerate(proto_clusters):
+        if covered[i]:
+            emergence = {"emergence_level": levels[i], "growth_ratio": round(ratios[i], 2)}
+        else:
+            emergence = compute_emergence(cluster, recent_days=recent_days)
 
         feed.append({
             "cluster_id": cluster["cluster_id"],
@@ -1,162 +1,59 @@
 import os
-from typing import List
-import google.generativeai as genai
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from dotenv import load_dotenv
 import time
 import hashlib
-import json
-from pathlib import Path
-from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams, PointStruct
+import threading
+
+from src.dashboard.answer_cache import AnswerCache, content_version
+from src.dashboard.llm_budget import get_llm_budget, rank_by_priority
+from src.dashboard.local_titler import local_title
+from src.dashboard.title_cache import TitleCache
+from src.dashboard.title_drift import title_source, title_refresh_reason, TITLE_DRIFT_THRESHOLD, TITLE_GROWTH_THRESHOLD
+from src.dashboard.title_service import TitleService, get_title_service
+from src.dashboard.title_worker import TitleWorker
 
 # Load environment variables
 load_dotenv()
 
-# Configure Gemini API
+# Gemini API key (the SDK itself is imported and configured on first use)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-
-# Persistent cache file (fallback only)
-CACHE_FILE = Path("cluster_title_cache.json")
-CACHE_COLLECTION = "cluster_titles"
-
-# In-memory cache for this session
-_title_cache = {}
-
-
-def _get_qdrant_client():
-    """Get Qdrant Cloud client if credentials available."""
-    if os.getenv("QDRANT_URL") and os.getenv("QDRANT_API_KEY"):
-        try:
-            return QdrantClient(
-                url=os.getenv("QDRANT_URL"),
-                api_key=os.getenv("QDRANT_API_KEY"),
-                timeout=30
-            )
-        except Exception as e:
-            print(f"[WARNING] Failed to connect to Qdrant: {e}")
-            return None
-    return None
-
-
-def _ensure_cache_collection():
-    """Ensure the cluster_titles collection exists in Qdrant."""
-    client = _get_qdrant_client()
-    if not client:
-        return False
-    
-    try:
-        client.get_collection(CACHE_COLLECTION)
-        return True
-    except Exception:
-        try:
-            # Create collection with 384-dim vectors to match embedding model
-            client.create_collection(
-                collection_name=CACHE_COLLECTION,
-                vectors_config=VectorParams(
-                    size=384,
-                    distance=Distance.COSINE
-                )
-            )
-            return True
-        except Exception as e:
-            print(f"[WARNING] Could not create cache collection: {e}")
-            return False
-
-
-def _load_cache():
-    """Load title cache from Qdrant Cloud or fallback to disk."""
-    global _title_cache
-    
-    # Try loading from Qdrant Cloud first
-    client = _get_qdrant_client()
-    if client and _ensure_cache_collection():
-        try:
-            offset = None
-            while True:
-                response = client.scroll(
-                    collection_name=CACHE_COLLECTION,
-                    limit=100,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=False
-                )
-                points, next_offset = response
-                
-                if not points:
-                    break
-                
-                for point in points:
-                    cluster_id = point.payload.get("cluster_id")
-                    title = point.payload.get("title")
-                    if cluster_id and title:
-                        _title_cache[cluster_id] = title
-                
-                if next_offset is None:
-                    break
-                offset = next_offset
-            
-            print(f"[INFO] Loaded {len(_title_cache)} titles from Qdrant Cloud cache")
-            return
-        except Exception as e:
-            print(f"[WARNING] Could not load cache from Qdrant: {e}")
-    
-    # Fallback to local file
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                _title_cache = json.load(f)
-            print(f"[INFO] Loaded {len(_title_cache)} titles from local cache file")
-        except Exception as e:
-            print(f"[WARNING] Could not load title cache from file: {e}")
-            _title_cache = {}
-    else:
-        _title_cache = {}
+_genai = None
 
+# Write-behind title cache: hits are served from memory, new titles are
+# flushed to Qdrant Cloud (or the local file) in batches. Loaded on first use
+# (or in the background via preload_title_cache()), never at import.
+_title_cache = TitleCache()
 
-def _save_cache_to_cloud(cluster_id: str, title: str):
-    """Save a single title to Qdrant Cloud cache."""
-    client = _get_qdrant_client()
-    if not client or not _ensure_cache_collection():
-        # Fallback to local file
-        _save_cache()
-        return False
-    
-    try:
-        # Use cluster_id directly as string UUID (avoids hash collisions)
-        point = PointStruct(
-            id=cluster_id,  # Qdrant supports string UUIDs as point IDs
-            vector=[0.0] * 384,  # Match collection dimension (384)
-            payload={
-                "cluster_id": cluster_id,
-                "title": title,
-                "updated_at": time.time()
-            }
-        )
-        
-        client.upsert(
-            collection_name=CACHE_COLLECTION,
-            points=[point]
-        )
-        return True
-    except Exception as e:
-        print(f"[WARNING] Could not save to Qdrant cache: {e}")
-        _save_cache()  # Fallback to local file
-        return False
+# Explainer answers by (cluster content version, normalized question), shared by all sessions
+_answer_cache = AnswerCache()
 
+# Explainer prompt context: newest signals first, truncated per signal
+EXPLAIN_CONTEXT_SIGNALS = 10
+EXPLAIN_SIGNAL_CHARS = 200
 
-def _save_cache():
-    """Save title cache to local file (fallback only)."""
-    try:
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(_title_cache, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        print(f"Warning: Could not save title cache: {e}")
+# Questions behind the dashboard's quick buttons (precomputed for the top clusters by main.py)
+PRESET_QUESTIONS = ("Why is this emerging?", "Who should care?", "What could happen next?")
+
+
+def _get_genai():
+    """Import and configure google.generativeai once, on the first Gemini call."""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=GEMINI_API_KEY)
+        _genai = genai
+    return _genai
+
+
+def preload_title_cache():
+    """Start loading the title cache on a background thread (idempotent)."""
+    _title_cache.preload()
 
 
-# Load cache on module import
-_load_cache()
+def flush_title_cache() -> int:
+    """Persist titles generated since the last flush (also runs periodically and at exit)."""
+    return _title_cache.flush()
 
 
 def _get_cache_key(signals: List[str]) -> str:
@@ -181,7 +78,7 @@ def generate_human_cluster_title(signals: List[str], cluster_id: str = None, use
     """
     if not GEMINI_API_KEY:
         # Fallback to simple extraction if API key not available
-        return _fallback_title(signals)
+        return local_title(signals)
     
     # Use cluster_id as cache key if available, otherwise fall back to signal-based key
     if cluster_id:
@@ -190,13 +87,15 @@ def generate_human_cluster_title(signals: List[str], cluster_id: str = None, use
     else:
         cache_key = _get_cache_key(signals)
     
-    # Check cache first
-    if use_cache and cache_key in _title_cache:
-        # Ensure it's also saved to Qdrant (in case it's only in memory)
-        if cluster_id:
-            _save_cache_to_cloud(cluster_id, _title_cache[cache_key])
-        return _title_cache[cache_key]
-    
+    # Check cache first (provisional fallback titles are upgraded when budget allows)
+    if use_cache and cache_key in _title_cache and not _title_cache.is_provisional(cache_key):
+        return _title_cache.get(cache_key)
+
+    budget = get_llm_budget()
+    if not budget.acquire("title"):
+        return _title_cache.get(cache_key) or local_title(signals)
+
+    start = time.perf_counter()
     try:
         # Prepare signal texts (limit to 1-5 signals to prevent hallucination on large clusters)
         signal_sample = signals[:5] if len(signals) >= 5 else signals[:max(1, len(signals))]
@@ -218,57 +117,240 @@ Requirements:
 Output ONLY the title, nothing else."""
 
         # Use gemini-2.5-flash-lite (faster, prevents hallucination)
-        model = genai.GenerativeModel('gemini-2.5-flash-lite')
+        model = _get_genai().GenerativeModel('gemini-2.5-flash-lite')
         response = model.generate_content(prompt)
-        
+        budget.record("title", time.perf_counter() - start, len(prompt))
+
         title = response.text.strip()
         
         # Ensure it's not too long
         if len(title.split()) > 12:
             title = " ".join(title.split()[:10]) + "..."
         
-        # Cache the result in memory and save to Qdrant Cloud
-        _title_cache[cache_key] = title
-        if cluster_id:
-            _save_cache_to_cloud(cluster_id, title)
-        else:
-            _save_cache()  # Fallback to local file for non-cluster-id keys
+        # Cache the result (persisted by the next flush)
+        _title_cache.set(cache_key, title)
         
         return title
         
     except Exception as e:
         print(f"Gemini API error in title generation: {e}")
-        # Cache fallback too
-        fallback = _fallback_title(signals)
-        _title_cache[cache_key] = fallback
-        if cluster_id:
-            _save_cache_to_cloud(cluster_id, fallback)
-        else:
-            _save_cache()
+        budget.record("title", time.perf_counter() - start, ok=False)
+        # Cache fallback too, as provisional so it is retried later
+        fallback = local_title(signals)
+        _title_cache.set(cache_key, fallback, provisional=True)
         return fallback
 
 
-def explain_cluster_with_gemini(cluster_signals: List[str], user_question: str) -> str:
+def generate_cluster_titles(clusters: List[Dict[str, Any]], use_cache: bool = True, service: TitleService = None) -> Dict[str, str]:
     """
-    Answer user questions about an emerging cluster using Gemini.
-    
+    Titles for many clusters at once.
+
+    Cached titles are served from memory; the rest are generated by the
+    TitleService (several clusters per prompt, concurrent rate-limited
+    requests) instead of one blocking Gemini call per cluster. The LLM
+    budget goes to the most emergent, largest clusters first.
+
     Args:
-        cluster_signals: List of signal texts in the cluster
-        user_question: User's question about the cluster
-    
+        clusters: Clusters with "cluster_id" and "signals"
+        use_cache: Whether to use cached titles (default: True)
+        service: TitleService to use (default: the shared process-wide service)
+
     Returns:
-        A clear, non-technical explanation
+        cluster_id -> title (clusters Gemini did not title get the fallback title)
     """
+    titles = {}
+    missing = []
+    for cluster in rank_by_priority(clusters):
+        cluster_id = cluster["cluster_id"]
+        if use_cache and cluster_id in _title_cache and not _title_cache.is_provisional(cluster_id):
+            titles[cluster_id] = _title_cache.get(cluster_id)
+        else:
+            missing.append((cluster_id, [s["text"] for s in cluster["signals"]]))
+
+    if not missing:
+        return titles
+
     if not GEMINI_API_KEY:
-        return "⚠️ Gemini API key not configured. Please add GEMINI_API_KEY to your .env file."
-    
-    try:
-        # Prepare cluster context (limit signals and truncate for efficiency)
-        signal_sample = cluster_signals[:10]
-        signal_text = "\n".join([f"- {s[:200]}" for s in signal_sample])
-        
-        # System prompt + user question
-        prompt = f"""You are an analyst explaining an emerging technology trend to a non-technical audience.
+        # Fallback to simple extraction if API key not available (not cached, like single titles)
+        titles.update({cluster_id: local_title(texts) for cluster_id, texts in missing})
+        return titles
+
+    sources = {c["cluster_id"]: title_source(c) for c in clusters}
+    titles.update(_generate_and_cache(missing, service, sources))
+    return titles
+
+
+def refresh_cluster_titles(
+    clusters: List[Dict[str, Any]],
+    drift_threshold: float = TITLE_DRIFT_THRESHOLD,
+    growth_threshold: float = TITLE_GROWTH_THRESHOLD,
+    service: TitleService = None
+) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    Bulk title pass for the end of a pipeline run.
+
+    Generates titles for clusters without one and regenerates cached titles
+    whose cluster drifted (centroid cosine distance) or grew past the
+    thresholds since the title was generated, all in one batched
+    TitleService call. Provisional fallback titles are upgraded too. The LLM
+    budget goes to the most emergent, largest clusters first; clusters it
+    does not cover get a provisional local title. Cached titles without a
+    recorded source get the current centroid / signal count as their
+    baseline instead of an LLM call.
+
+    Args:
+        clusters: Clusters with "cluster_id", "signals" and "centroid"/"embeddings"
+        drift_threshold: Cosine distance that triggers regeneration
+        growth_threshold: Relative signal-count growth that triggers regeneration
+        service: TitleService to use (default: the shared process-wide service)
+
+    Returns:
+        (cluster_id -> title, counts of new/drift/growth/provisional/unchanged/baseline titles)
+    """
+    titles = {}
+    stats = {"new": 0, "drift": 0, "growth": 0, "provisional": 0, "unchanged": 0, "baseline": 0}
+    sources = {}
+    stale = []
+    for cluster in rank_by_priority(clusters):
+        cluster_id = cluster["cluster_id"]
+        sources[cluster_id] = title_source(cluster)
+        title = _title_cache.get(cluster_id)
+        if title is None:
+            reason = "new"
+        elif _title_cache.is_provisional(cluster_id):
+            reason = "provisional"
+        elif _title_cache.get_source(cluster_id) is None:
+            _title_cache.set(cluster_id, title, sources[cluster_id])
+            reason = "baseline"
+        else:
+            reason = title_refresh_reason(_title_cache.get_source(cluster_id), cluster, drift_threshold, growth_threshold)
+
+        stats[reason or "unchanged"] += 1
+        if reason in ("new", "drift", "growth", "provisional"):
+            stale.append((cluster_id, [s["text"] for s in cluster["signals"]]))
+        else:
+            titles[cluster_id] = title
+
+    if not stale:
+        return titles, stats
+
+    if not GEMINI_API_KEY:
+        # Fallback titles are not cached, so keep the old title where there is one
+        for cluster_id, texts in stale:
+            titles[cluster_id] = _title_cache.get(cluster_id) or local_title(texts)
+        return titles, stats
+
+    titles.update(_generate_and_cache(stale, service, sources))
+    return titles, stats
+
+
+def _generate_and_cache(
+    missing: List[Tuple[str, List[str]]],
+    service: TitleService = None,
+    sources: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, str]:
+    """
+    Generate titles with the TitleService and cache them.
+
+    `missing` is in priority order: only as many clusters as the remaining
+    LLM budget covers are sent. Clusters Gemini gave no title keep their
+    previous title, or get a provisional local title.
+    """
+    service = service or get_title_service()
+    affordable = service.budget.remaining * service.batch_size
+    generated = service.generate_titles(missing[:affordable])
+    titles = {}
+    for cluster_id, texts in missing:
+        title = generated.get(cluster_id)
+        if title is None and _title_cache.get(cluster_id):
+            # Keep the previous title (and its source, so it is retried next time)
+            titles[cluster_id] = _title_cache.get(cluster_id)
+            continue
+        if title is None:
+            _title_cache.set(cluster_id, local_title(texts), (sources or {}).get(cluster_id), provisional=True)
+        else:
+            _title_cache.set(cluster_id, title, (sources or {}).get(cluster_id))
+        titles[cluster_id] = _title_cache.get(cluster_id)
+    return titles
+
+
+_title_worker: Optional[TitleWorker] = None
+_title_worker_lock = threading.Lock()
+
+
+def get_title_worker() -> TitleWorker:
+    """Process-wide background title worker (shared by every dashboard session)."""
+    global _title_worker
+    with _title_worker_lock:
+        if _title_worker is None:
+            _title_worker = TitleWorker(_generate_and_cache)
+        return _title_worker
+
+
+def get_cluster_title_nowait(signals: List[str], cluster_id: str, fallback: Optional[str] = None) -> str:
+    """
+    Cluster title for rendering, without waiting on Gemini.
+
+    Returns the cached title if there is one. Otherwise the cluster is queued
+    for background generation and the local fallback title is returned; the
+    generated title lands in the cache and is shown on the next rerun.
+    Provisional titles are returned as well, and queued for an upgrade while
+    the LLM budget lasts.
+
+    Args:
+        signals: List of signal texts in the cluster
+        cluster_id: Cluster ID (cache key)
+        fallback: Precomputed local title (default: computed from `signals`)
+
+    Returns:
+        Cached title or fallback title
+    """
+    title = _title_cache.get(cluster_id)
+    if title and not _title_cache.is_provisional(cluster_id):
+        return title
+    if GEMINI_API_KEY and get_llm_budget().remaining:
+        get_title_worker().submit([(cluster_id, signals)])
+    return title or fallback or local_title(signals)
+
+
+def prefetch_cluster_titles(clusters: List[Dict[str, Any]]) -> int:
+    """
+    Queue background titles for clusters that are about to be shown (e.g., the next page).
+
+    Returns:
+        Number of clusters queued
+    """
+    if not GEMINI_API_KEY or not get_llm_budget().remaining:
+        return 0
+    missing = [
+        (c["cluster_id"], [s["text"] for s in c["signals"]])
+        for c in clusters if c["cluster_id"] not in _title_cache or _title_cache.is_provisional(c["cluster_id"])
+    ]
+    get_title_worker().submit(missing)
+    return len(missing)
+
+
+def pending_title_count() -> int:
+    """Clusters whose background title is still being generated."""
+    return get_title_worker().pending if _title_worker is not None else 0
+
+
+def _explain_context(cluster_signals: List[Dict[str, Any]]) -> List[str]:
+    # One canonical order (newest first, then signal id) whatever order the caller
+    # holds the signals in, so the same members always give the same prompt
+    newest_first = sorted(
+        cluster_signals,
+        key=lambda s: (s.get("timestamp") or "", s.get("signal_id") or ""),
+        reverse=True
+    )
+    return [s["text"][:EXPLAIN_SIGNAL_CHARS] for s in newest_first[:EXPLAIN_CONTEXT_SIGNALS]]
+
+
+def _explain_prompt(context: List[str], user_question: str) -> str:
+    signal_text = "\n".join([f"- {s}" for s in context])
+
+    # System prompt + user question
+    return f"""You are an analyst explaining an emerging technology trend to a non-technical audience.
 
 Use simple language.
 Be factual and grounded in the provided evidence.
@@ -282,46 +364,152 @@ USER QUESTION: {user_question}
 
 Provide a clear, helpful answer based only on the signals above."""
 
+
+# Shown instead of an answer when the LLM budget refuses the call (never cached)
+BUDGET_EXHAUSTED_MESSAGE = "⚠️ The AI call budget is used up for now. Please try again later."
+
+
+def _explain_error(error: Exception) -> str:
+    error_msg = str(error)
+    if "429" in error_msg or "quota" in error_msg.lower():
+        return "⚠️ Rate limit reached. Please wait a moment and try again."
+    return f"⚠️ Error generating explanation: {error_msg[:200]}"
+
+
+def stream_cluster_explanation(
+    cluster_signals: List[Dict[str, Any]],
+    user_question: str,
+    cluster_id: str = None,
+    use_cache: bool = True,
+    wait_for_budget: bool = False
+) -> Iterator[str]:
+    """
+    Answer a question about a cluster as a stream of text chunks (for st.write_stream).
+
+    Answers are served from the shared answer cache when the same question
+    (normalized) was asked about the same member signals within the TTL, in
+    any order (e.g., the time-filtered copy of a stored cluster).
+    Otherwise the Gemini response is streamed and cached once complete;
+    error messages are yielded but never cached. Every Gemini attempt takes
+    a call from the LLM budget.
+
+    Args:
+        cluster_signals: Signals in the cluster (dicts with text, timestamp, signal_id)
+        user_question: User's question about the cluster
+        cluster_id: Optional cluster ID (stored with the cached answer)
+        use_cache: Whether to use cached answers (default: True)
+        wait_for_budget: Wait out the per-minute budget instead of giving up (batch work)
+
+    Yields:
+        Chunks of a clear, non-technical explanation
+    """
+    context = _explain_context(cluster_signals)
+    version = content_version(cluster_signals)
+    if use_cache:
+        cached = _answer_cache.get(version, user_question)
+        if cached is not None:
+            yield cached
+            return
+
+    if not GEMINI_API_KEY:
+        yield "⚠️ Gemini API key not configured. Please add GEMINI_API_KEY to your .env file."
+        return
+
+    budget = get_llm_budget()
+    chunks = []
+    try:
         # Use gemini-2.5-flash with retry
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        # Retry logic for rate limits
+        model = _get_genai().GenerativeModel('gemini-2.5-flash')
+        prompt = _explain_prompt(context, user_question)
+
+        # Retry logic for rate limits (only until the first chunk has been shown)
         max_retries = 3
         for attempt in range(max_retries):
+            if not budget.acquire("answer", wait=wait_for_budget):
+                yield BUDGET_EXHAUSTED_MESSAGE
+                return
+            start = time.perf_counter()
             try:
-                response = model.generate_content(prompt)
-                return response.text.strip()
+                for chunk in model.generate_content(prompt, stream=True):
+                    text = chunk.text
+                    if text:
+                        chunks.append(text)
+                        yield text
+                budget.record("answer", time.perf_counter() - start, len(prompt))
+                break
             except Exception as retry_error:
-                if "429" in str(retry_error) or "quota" in str(retry_error).lower():
+                budget.record("answer", time.perf_counter() - start, len(prompt), ok=False)
+                if not chunks and ("429" in str(retry_error) or "quota" in str(retry_error).lower()):
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
                         time.sleep(wait_time)
                         continue
                 raise retry_error
-        
     except Exception as e:
-        error_msg = str(e)
-        if "429" in error_msg or "quota" in error_msg.lower():
-            return "⚠️ Rate limit reached. Please wait a moment and try again."
-        return f"⚠️ Error generating explanation: {error_msg[:200]}"
+        yield ("\n\n" if chunks else "") + _explain_error(e)
+        return
 
+    answer = "".join(chunks).strip()
+    if answer:
+        _answer_cache.set(version, user_question, answer, cluster_id=cluster_id)
 
-def _fallback_title(signals: List[str]) -> str:
-    """Fallback title generation when Gemini API is unavailable."""
-    # Simple keyword extraction as fallback
-    from collections import Counter
-    import re
-    
-    words = []
-    for s in signals[:5]:
-        # Extract capitalized words and meaningful terms
-        words.extend(re.findall(r'\b[A-Z][a-z]+\b', s))
-    
-    if not words:
-        return "Emerging Technology Cluster"
+
+def explain_cluster_with_gemini(
+    cluster_signals: List[Dict[str, Any]],
+    user_question: str,
+    cluster_id: str = None,
+    wait_for_budget: bool = False
+) -> str:
+    """
+    Answer user questions about an emerging cluster using Gemini.
     
-    # Get top 3 most common words
-    common = Counter(words).most_common(3)
-    title_words = [w for w, _ in common]
+    Args:
+        cluster_signals: Signals in the cluster (dicts with text, timestamp, signal_id)
+        user_question: User's question about the cluster
+        cluster_id: Optional cluster ID (stored with the cached answer)
+        wait_for_budget: Wait out the per-minute budget instead of giving up (batch work)
     
-    return " / ".join(title_words)
+    Returns:
+        A clear, non-technical explanation
+    """
+    return "".join(stream_cluster_explanation(
+        cluster_signals, user_question, cluster_id=cluster_id, wait_for_budget=wait_for_budget
+    )).strip()
+
+
+def precompute_cluster_answers(clusters: List[Dict[str, Any]], questions: Tuple[str, ...] = PRESET_QUESTIONS) -> Dict[str, int]:
+    """
+    Answer the preset questions for the given clusters ahead of time (ingest run).
+
+    Already cached answers are skipped, so only clusters whose content changed
+    cost Gemini calls. Once the run's LLM budget is spent the remaining
+    answers are skipped (asked interactively later instead).
+
+    Args:
+        clusters: Clusters with "cluster_id" and "signals" (e.g., the top of the feed)
+        questions: Questions to answer (default: the dashboard's preset buttons)
+
+    Returns:
+        Counts of cached, generated, failed and skipped answers
+    """
+    stats = {"cached": 0, "generated": 0, "failed": 0, "skipped": 0}
+    if not GEMINI_API_KEY:
+        return stats
+
+    for cluster in clusters:
+        version = content_version(cluster["signals"])
+        for question in questions:
+            if _answer_cache.get(version, question) is not None:
+                stats["cached"] += 1
+                continue
+            if not get_llm_budget().remaining:
+                stats["skipped"] += 1
+                continue
+            explain_cluster_with_gemini(cluster["signals"], question, cluster_id=cluster["cluster_id"], wait_for_budget=True)
+            stats["generated" if _answer_cache.get(version, question) is not None else "failed"] += 1
+    return stats
+
+
+def flush_answer_cache() -> int:
+    """Persist answers generated since the last flush (also runs periodically and at exit)."""
+    return _answer_cache.flush()
@@ -2,36 +2,241 @@ import networkx as nx
 from pyvis.network import Network
 import numpy as np
 import math
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from src.dashboard.graph_layout import GraphLayout
+from src.clustering.neighbor_graph import (
+    signal_edges, cluster_edges, SIGNAL_NEIGHBOR_THRESHOLD, CLUSTER_NEIGHBOR_THRESHOLD
+)
 
 # Configuration
 MAX_SIGNALS_PER_CLUSTER = 25
+SIGNAL_EDGE_THRESHOLD = 0.65
+CLUSTER_EDGE_THRESHOLD = 0.7
+
+# Rows per block when computing all-pairs centroid similarities
+EDGE_BLOCK_SIZE = 1024
+
+# Level of detail: render budgets, and nearest neighbors per cluster in the overview
+GRAPH_NODE_BUDGET = 1500
+GRAPH_EDGE_BUDGET = 4000
+OVERVIEW_NEIGHBORS = 5
+
+# Process-level cache: graph key -> generated HTML (shared by all sessions, so every
+# access holds the lock - Streamlit runs sessions on concurrent threads)
+GRAPH_CACHE_SIZE = 8
+_graph_cache = OrderedDict()
+_graph_cache_lock = threading.Lock()
+
+# Process-level layout: anchor positions persist across reruns and update incrementally
+_graph_layout = GraphLayout()
+
+# vis.js assets shipped with the repository. pyvis links lib/bindings relative to the page
+# and vis-network from cdnjs; both are inlined from lib/ so the graph needs no network
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "lib")
+_LOCAL_ASSET_TAG = re.compile(r'<script src="lib/([^"]+)"></script>|<link href="lib/([^"]+)" rel="stylesheet">')
+_VIS_NETWORK_VERSION = "9.1.2"
+_REMOTE_ASSETS = {
+    "vis-network.min.js": f"vis-{_VIS_NETWORK_VERSION}/vis-network.min.js",
+    "vis-network.min.css": f"vis-{_VIS_NETWORK_VERSION}/vis-network.css",
+}
+_REMOTE_ASSET_TAG = re.compile(
+    r'<script src="https://[^"]*/vis-network/' + re.escape(_VIS_NETWORK_VERSION) + r'/[^"]*?([\w.-]+\.js)"[^>]*></script>'
+    r'|<link rel="stylesheet" href="https://[^"]*/vis-network/' + re.escape(_VIS_NETWORK_VERSION) + r'/[^"]*?([\w.-]+\.css)"[^>]*/?>'
+)
+# pyvis' template also pulls Bootstrap from jsdelivr, only for its select/filter menus (unused here)
+_BOOTSTRAP_TAG = re.compile(r'<link\s[^>]*bootstrap[^>]*/>|<script\s[^>]*bootstrap[^>]*>\s*</script>')
 
 def cosine(a, b):
     if a is None or b is None:
         return 0.0
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
-def build_cluster_graph(clusters, threshold=0.55):
-    G = nx.Graph()
+def _normalize_rows(vectors):
+    matrix = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
 
-    for cluster in clusters:
-        cluster_id = cluster["cluster_id"]
-        cluster_label = cluster["label"]
-        signals = cluster["signals"]
-        embeddings = cluster["embeddings"]
-        total_signal_count = len(signals)
+def similarity_edges(vectors, threshold, block_size=EDGE_BLOCK_SIZE):
+    """
+    All pairs (i, j), i < j, with cosine similarity > threshold.
+
+    Computed with blocked matrix products over row-normalized vectors, so memory
+    stays at block_size x n similarities regardless of n.
+
+    Returns:
+        (rows_i, rows_j, similarities) arrays, ordered by (i, j)
+    """
+    n = len(vectors)
+    if n < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    matrix = _normalize_rows(vectors)
+    rows_i, rows_j, sims = [], [], []
+    for start in range(0, n, block_size):
+        block = matrix[start:start + block_size]
+        # Only the upper triangle: compare the block against itself and later rows
+        scores = block @ matrix[start:].T
+        local_i, local_j = np.nonzero(np.triu(scores > threshold, k=1))
+        rows_i.append(local_i + start)
+        rows_j.append(local_j + start)
+        sims.append(scores[local_i, local_j])
+    return np.concatenate(rows_i), np.concatenate(rows_j), np.concatenate(sims)
+
+def knn_edges(vectors, k, threshold, block_size=EDGE_BLOCK_SIZE):
+    """
+    Sparsified similarity graph: each row's k most similar rows with cosine > threshold.
+
+    An edge is kept if either endpoint selects it, so every node keeps its
+    strongest links while the edge count stays O(n * k) instead of O(n^2).
+
+    Returns:
+        (rows_i, rows_j, similarities) arrays with i < j, ordered by (i, j)
+    """
+    n = len(vectors)
+    k = min(k, n - 1)
+    if k <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    matrix = _normalize_rows(vectors)
+    rows_i, rows_j, sims = [], [], []
+    for start in range(0, n, block_size):
+        scores = matrix[start:start + block_size] @ matrix.T
+        local = np.arange(len(scores))
+        scores[local, local + start] = -np.inf  # no self-loops
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(scores, top, axis=1)
+        keep = top_sims > threshold
+        sources = np.broadcast_to((local + start)[:, None], top.shape)[keep]
+        targets = top[keep]
+        rows_i.append(np.minimum(sources, targets))
+        rows_j.append(np.maximum(sources, targets))
+        sims.append(top_sims[keep])
+
+    rows_i, rows_j, sims = np.concatenate(rows_i), np.concatenate(rows_j), np.concatenate(sims)
+    # Mutual neighbors select the same pair twice
+    _, first = np.unique(rows_i * n + rows_j, return_index=True)
+    return rows_i[first], rows_j[first], sims[first]
+
+def _add_graph_to_network(net, G):
+    """
+    Same result as net.from_nx(G), in linear time.
+
+    pyvis' add_edge() rescans every existing edge to reject duplicates (and
+    add_node() scans a list of ids), which is quadratic in the graph size.
+    networkx already guarantees unique nodes and edges, so they are appended directly.
+    """
+    def add_node(node_id):
+        if node_id in net.node_map:
+            return
+        options = dict(G.nodes[node_id])
+        shape = options.pop("shape", "dot")
+        label = options.pop("label", None)
+        options.setdefault("color", "#97c2fc")
+        options["id"] = node_id
+        options["label"] = label if label else node_id
+        options["shape"] = shape
+        if net.font_color:
+            options["font"] = dict(color=net.font_color)
+        net.nodes.append(options)
+        net.node_ids.append(node_id)
+        net.node_map[node_id] = options
 
+    for source, target, data in G.edges(data=True):
+        # from_nx casts the size of every node that has edges to int
+        for node_id in (source, target):
+            G.nodes[node_id]["size"] = int(G.nodes[node_id].get("size", 10))
+        add_node(source)
+        add_node(target)
+
+        options = dict(data)
+        if "width" not in options:
+            options["width"] = options.pop("weight", 1)
+        options["from"] = source
+        options["to"] = target
+        net.edges.append(options)
+
+    for node_id in nx.isolates(G):
+        G.nodes[node_id].setdefault("size", 10)
+        add_node(node_id)
+
+@lru_cache(maxsize=None)
+def _read_asset(relative_path):
+    """Contents of a lib/ asset, read from disk once per process (None if missing)."""
+    try:
+        with open(os.path.join(LIB_DIR, relative_path), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        print(f"[WARNING] Graph asset lib/{relative_path} not found: {e}")
+        return None
+
+def _inline_local_assets(html_content):
+    """
+    Replace links to lib/ and CDN-hosted vis-network assets with their inlined
+    contents, and drop the Bootstrap tags.
+
+    The graph is rendered in a srcdoc iframe, where relative lib/ paths do
+    not resolve; inlining makes the HTML self-contained and lets it render
+    offline. Unreadable assets keep their original tag.
+    """
+    def inline(match, script_path, style_path):
+        path = script_path or style_path
+        content = _read_asset(path) if path else None
+        if content is None:
+            return match.group(0)
+        return f"<script>{content}</script>" if script_path else f"<style>{content}</style>"
+
+    def replace_local(match):
+        return inline(match, *match.groups())
+
+    def replace_remote(match):
+        script_name, style_name = match.groups()
+        return inline(match, _REMOTE_ASSETS.get(script_name), _REMOTE_ASSETS.get(style_name))
+
+    html_content = _LOCAL_ASSET_TAG.sub(replace_local, html_content)
+    html_content = _REMOTE_ASSET_TAG.sub(replace_remote, html_content)
+    return _BOOTSTRAP_TAG.sub("", html_content)
+
+def full_graph_node_count(clusters):
+    """Nodes the full-detail graph would have: anchor, visible signals and "+N more" per cluster."""
+    return sum(
+        1 + min(len(c["signals"]), MAX_SIGNALS_PER_CLUSTER) + (len(c["signals"]) > MAX_SIGNALS_PER_CLUSTER)
+        for c in clusters
+    )
+
+def _add_cluster_nodes(G, cluster, signal_threshold, with_members=True):
+    """
+    Add a cluster's anchor node and, if with_members, its most recent signals,
+    their signal-signal edges and the "+N more" node.
+
+    Returns:
+        (visible signal ids, cluster node size)
+    """
+    cluster_id = cluster["cluster_id"]
+    cluster_label = cluster["label"]
+    signals = cluster["signals"]
+    total_signal_count = len(signals)
+    visible_signals = []
+
+    if with_members:
         # Sort signals by timestamp (most recent first)
-        signals_with_embeddings = list(zip(signals, embeddings))
+        signals_with_embeddings = list(zip(signals, cluster["embeddings"]))
         signals_with_embeddings.sort(key=lambda x: x[0]["timestamp"], reverse=True)
         
         # Cap visible signals
         visible_signals = signals_with_embeddings[:MAX_SIGNALS_PER_CLUSTER]
-        hidden_count = total_signal_count - len(visible_signals)
 
         # Add visible signal nodes
-        for i, (s, emb) in enumerate(visible_signals):
-            short_label = s["text"][:40] + "…"
+        for s, emb in visible_signals:
             G.add_node(
                 s["signal_id"],
                 label="",  # Hide label for cleanliness
@@ -45,101 +250,209 @@ def build_cluster_graph(clusters, threshold=0.55):
             )
 
         # Add signal-signal edges (only between visible signals and only strong connections)
-        for i in range(len(visible_signals)):
-            for j in range(i+1, len(visible_signals)):
-                sim = cosine(visible_signals[i][1], visible_signals[j][1])
-                if sim > 0.65:  # Higher threshold for cleaner graph
-                    # Fade edge color for large clusters
-                    edge_opacity = 1.0 if total_signal_count < 50 else 0.5 if total_signal_count < 100 else 0.3
-                    edge_color = f"rgba(14, 17, 23, {edge_opacity})"
-                    G.add_edge(
-                        visible_signals[i][0]["signal_id"],
-                        visible_signals[j][0]["signal_id"],
-                        value=sim,
-                        color=edge_color,
-                        smooth=False  # Straight lines
-                    )
-
-        # Calculate logarithmic cluster node size based on total signal count
-        # Formula: base_size + log_factor * log(1 + signal_count)
-        base_size = 35
-        log_factor = 15
-        cluster_size = base_size + log_factor * math.log(1 + total_signal_count)
-        
-        # Add cluster anchor node
-        cluster_node_id = f"cluster_{cluster_id}"
-        G.add_node(
-            cluster_node_id,
-            label=cluster_label,
-            title=f"{cluster_label} ({total_signal_count} signals)",
-            size=cluster_size,
-            color="#f4b000",
-            font={"size": 18, "color": "white"},
-            physics=True,  # Enable physics for dragging
-            borderWidth=0,
-            borderWidthSelected=0
-        )
-
-        # Connect cluster to visible signals
         # Fade edge color for large clusters
-        edge_opacity = 1.0 if total_signal_count < 50 else 0.6 if total_signal_count < 100 else 0.4
-        cluster_edge_color = f"rgba(244, 176, 0, {edge_opacity})"
-        
-        for s, emb in visible_signals:
+        edge_opacity = 1.0 if total_signal_count < 50 else 0.5 if total_signal_count < 100 else 0.3
+        edge_color = f"rgba(14, 17, 23, {edge_opacity})"
+        if cluster.get("signal_neighbors") is not None and signal_threshold >= SIGNAL_NEIGHBOR_THRESHOLD:
+            # Neighbor lists maintained at ingest time - no similarity computation at render time
+            rows_i, rows_j, sims = signal_edges(
+                [s["signal_id"] for s, _ in visible_signals], cluster["signal_neighbors"], signal_threshold
+            )
+        else:
+            rows_i, rows_j, sims = similarity_edges([emb for _, emb in visible_signals], signal_threshold)
+        for i, j, sim in zip(rows_i.tolist(), rows_j.tolist(), sims.tolist()):
             G.add_edge(
-                cluster_node_id,
-                s["signal_id"],
-                value=0.9,
-                color=cluster_edge_color,
+                visible_signals[i][0]["signal_id"],
+                visible_signals[j][0]["signal_id"],
+                value=sim,
+                color=edge_color,
                 smooth=False  # Straight lines
             )
+
+    hidden_count = total_signal_count - len(visible_signals)
+
+    # Calculate logarithmic cluster node size based on total signal count
+    # Formula: base_size + log_factor * log(1 + signal_count)
+    base_size = 35
+    log_factor = 15
+    cluster_size = base_size + log_factor * math.log(1 + total_signal_count)
+    
+    # Add cluster anchor node
+    cluster_node_id = f"cluster_{cluster_id}"
+    title = f"{cluster_label} ({total_signal_count} signals)"
+    if not with_members:
+        title += "\nExpand this cluster below the graph to show its signals."
+    G.add_node(
+        cluster_node_id,
+        label=cluster_label,
+        title=title,
+        size=cluster_size,
+        color="#f4b000",
+        font={"size": 18, "color": "white"},
+        physics=True,  # Enable physics for dragging
+        borderWidth=0,
+        borderWidthSelected=0
+    )
+
+    # Connect cluster to visible signals
+    # Fade edge color for large clusters
+    edge_opacity = 1.0 if total_signal_count < 50 else 0.6 if total_signal_count < 100 else 0.4
+    cluster_edge_color = f"rgba(244, 176, 0, {edge_opacity})"
+    
+    for s, emb in visible_signals:
+        G.add_edge(
+            cluster_node_id,
+            s["signal_id"],
+            value=0.9,
+            color=cluster_edge_color,
+            smooth=False  # Straight lines
+        )
+    
+    # Add "+N more" collapsed node if there are hidden signals
+    if with_members and hidden_count > 0:
+        collapsed_node_id = f"collapsed_{cluster_id}"
+        G.add_node(
+            collapsed_node_id,
+            label=f"+{hidden_count} more",
+            title=f"This cluster has {hidden_count} more signals not shown in the graph.\nSelect the cluster below to view all {total_signal_count} signals.",
+            size=12,
+            color="#ff9500",
+            font={"size": 14, "color": "white"},
+            physics=True,
+            borderWidth=0,
+            borderWidthSelected=0,
+            shape='box'
+        )
         
-        # Add "+N more" collapsed node if there are hidden signals
-        if hidden_count > 0:
-            collapsed_node_id = f"collapsed_{cluster_id}"
-            G.add_node(
-                collapsed_node_id,
-                label=f"+{hidden_count} more",
-                title=f"This cluster has {hidden_count} more signals not shown in the graph.\nSelect the cluster below to view all {total_signal_count} signals.",
-                size=12,
-                color="#ff9500",
-                font={"size": 14, "color": "white"},
-                physics=True,
-                borderWidth=0,
-                borderWidthSelected=0,
-                shape='box'
-            )
-            
-            # Connect collapsed node to cluster hub
-            G.add_edge(
-                cluster_node_id,
-                collapsed_node_id,
-                value=0.9,
-                color="#ff9500",
-                smooth=False,
-                dashes=True
-            )
+        # Connect collapsed node to cluster hub
+        G.add_edge(
+            cluster_node_id,
+            collapsed_node_id,
+            value=0.9,
+            color="#ff9500",
+            smooth=False,
+            dashes=True
+        )
 
-    # Cross-cluster edges
-    for i in range(len(clusters)):
-        for j in range(i+1, len(clusters)):
-            if "centroid" in clusters[i] and "centroid" in clusters[j]:
-                sim = cosine(clusters[i]["centroid"], clusters[j]["centroid"])
-                if sim > 0.7:
-                    G.add_edge(
-                        f"cluster_{clusters[i]['cluster_id']}",
-                        f"cluster_{clusters[j]['cluster_id']}",
-                        value=sim,
-                        color="#ff006e",
-                        dashes=True,
-                        smooth=False  # Straight lines
-                    )
+    return [s["signal_id"] for s, _ in visible_signals], cluster_size
+
+def graph_cache_key(clusters, signal_threshold=SIGNAL_EDGE_THRESHOLD, cluster_threshold=CLUSTER_EDGE_THRESHOLD, layout="physics", view=""):
+    """
+    Hash of everything the rendered graph depends on.
+
+    Signal texts and embeddings never change for a signal_id, so cluster ids,
+    labels, member signal ids and timestamps (visible-signal order) identify the
+    graph, plus the stamp of the cluster's precomputed neighbor lists; `view`
+    carries the level-of-detail settings.
+    """
+    digest = hashlib.sha1(f"{signal_threshold}|{cluster_threshold}|{MAX_SIGNALS_PER_CLUSTER}|{layout}|{view}".encode("utf-8"))
+    for cluster in clusters:
+        digest.update(f"\x1e{cluster['cluster_id']}\x1f{cluster.get('label', '')}\x1f{cluster.get('centroid') is not None}\x1f{cluster.get('neighbors_updated_at')}".encode("utf-8"))
+        for s in cluster["signals"]:
+            digest.update(f"\x1f{s['signal_id']}@{s.get('timestamp')}".encode("utf-8"))
+    return digest.hexdigest()
+
+def build_cluster_graph(
+    clusters,
+    threshold=0.55,
+    signal_threshold=SIGNAL_EDGE_THRESHOLD,
+    cluster_threshold=CLUSTER_EDGE_THRESHOLD,
+    layout="physics",
+    detail="full",
+    expanded_cluster_id=None,
+    max_nodes=GRAPH_NODE_BUDGET,
+    max_edges=GRAPH_EDGE_BUDGET
+):
+    """
+    Build the pyvis cluster graph and return its HTML.
+
+    The HTML is generated in memory (nothing is written to the working
+    directory, so concurrent sessions never share a file). Identical inputs
+    (same graph_cache_key) are served from a process-level cache without
+    recomputing edges or regenerating HTML.
+
+    layout="physics" lets the browser stabilize a barnesHut simulation;
+    layout="precomputed" emits fixed coordinates from GraphLayout (computed
+    once, updated incrementally) with physics disabled, so large graphs load
+    without freezing the page.
+
+    detail="full" shows every cluster with its most recent signals.
+    detail="overview" shows cluster nodes only (the largest max_nodes) joined
+    by a kNN graph over their centroids; only expanded_cluster_id gets its
+    signals. detail="auto" picks the overview once the full graph would
+    exceed max_nodes. Cross-cluster edges are capped at max_edges (strongest
+    kept) in every mode.
+    """
+    view = f"{detail}|{expanded_cluster_id}|{max_nodes}|{max_edges}"
+    cache_key = graph_cache_key(clusters, signal_threshold, cluster_threshold, layout, view)
+    with _graph_cache_lock:
+        cached = _graph_cache.get(cache_key)
+        if cached is not None:
+            _graph_cache.move_to_end(cache_key)
+            return cached
+
+    if detail == "auto":
+        detail = "overview" if full_graph_node_count(clusters) > max_nodes else "full"
+
+    shown = clusters
+    if detail == "overview":
+        # Node budget: keep the largest clusters, reserving room for the expanded cluster's members
+        expanded = next((c for c in clusters if c["cluster_id"] == expanded_cluster_id), None)
+        reserved = full_graph_node_count([expanded]) - 1 if expanded is not None else 0
+        ranked = sorted(clusters, key=lambda c: len(c["signals"]), reverse=True)
+        shown_ids = {c["cluster_id"] for c in ranked[:max(max_nodes - reserved, 1)]}
+        if expanded is not None and expanded_cluster_id not in shown_ids:
+            shown_ids.discard(ranked[len(shown_ids) - 1]["cluster_id"])
+            shown_ids.add(expanded_cluster_id)
+        shown = [c for c in clusters if c["cluster_id"] in shown_ids]
+
+    G = nx.Graph()
+    visible_signal_ids = {}
+    cluster_sizes = {}
+
+    for cluster in shown:
+        with_members = detail == "full" or cluster["cluster_id"] == expanded_cluster_id
+        visible_signal_ids[cluster["cluster_id"]], cluster_sizes[cluster["cluster_id"]] = \
+            _add_cluster_nodes(G, cluster, signal_threshold, with_members=with_members)
+
+    # Cross-cluster edges: precomputed neighbor lists when every cluster has one, otherwise
+    # blocked all-pairs threshold (or a sparsified kNN graph in overview)
+    k = OVERVIEW_NEIGHBORS if detail == "overview" else None
+    if all(c.get("cluster_neighbors") is not None for c in shown) and cluster_threshold >= CLUSTER_NEIGHBOR_THRESHOLD:
+        with_centroid = shown
+        rows_i, rows_j, sims = cluster_edges(shown, cluster_threshold, k=k)
+    else:
+        with_centroid = [c for c in shown if c.get("centroid") is not None]
+        centroids = [c["centroid"] for c in with_centroid]
+        if detail == "overview":
+            rows_i, rows_j, sims = knn_edges(centroids, k, cluster_threshold)
+        else:
+            rows_i, rows_j, sims = similarity_edges(centroids, cluster_threshold)
+    if len(sims) > max_edges:
+        # Edge budget: keep the strongest edges (in their original order)
+        keep = np.sort(np.argpartition(-sims, max_edges - 1)[:max_edges])
+        rows_i, rows_j, sims = rows_i[keep], rows_j[keep], sims[keep]
+    for i, j, sim in zip(rows_i.tolist(), rows_j.tolist(), sims.tolist()):
+        G.add_edge(
+            f"cluster_{with_centroid[i]['cluster_id']}",
+            f"cluster_{with_centroid[j]['cluster_id']}",
+            value=sim,
+            color="#ff006e",
+            dashes=True,
+            smooth=False  # Straight lines
+        )
+
+    if layout == "precomputed":
+        positions = _graph_layout.node_positions(clusters, visible_signal_ids, cluster_sizes)
+        for node_id, (x, y) in positions.items():
+            if node_id in G:
+                G.nodes[node_id].update(x=x, y=y, physics=False)
 
     net = Network(height="600px", bgcolor="#0e1117", font_color="white")
-    net.from_nx(G)
+    _add_graph_to_network(net, G)
     
     # Configure physics for initial layout only - will be disabled after stabilization
-    net.set_options("""
+    options = json.loads("""
     {
         "nodes": {
             "borderWidth": 0,
@@ -180,6 +493,10 @@ def build_cluster_graph(clusters, threshold=0.55):
         }
     }
     """)
+    if layout == "precomputed":
+        # Fixed server-side coordinates: no stabilization pass in the browser
+        options["physics"] = {"enabled": False}
+    net.set_options(json.dumps(options))
     
     # Add custom JavaScript for click-to-show-persistent-text and group movement
     custom_html = """
@@ -294,18 +611,20 @@ def build_cluster_graph(clusters, threshold=0.55):
     """
     
     try:
-        net.write_html("cluster_graph.html")
-        
-        # Inject custom JavaScript into the generated HTML
-        with open("cluster_graph.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = _inline_local_assets(net.generate_html())
         
         # Insert custom script before closing body tag
         html_content = html_content.replace("</body>", custom_html + "</body>")
-        
-        with open("cluster_graph.html", "w", encoding="utf-8") as f:
-            f.write(html_content)
             
     except Exception as e:
-        with open("cluster_graph.html", "w") as f:
-            f.write(f"<html><body><h3>Cluster Graph (pyvis error: {e})</h3><p>Clusters: {len(clusters)}</p></body></html>")
+        html_content = f"<html><body><h3>Cluster Graph (pyvis error: {e})</h3><p>Clusters: {len(clusters)}</p></body></html>"
+        # Don't cache failures
+        return html_content
+    
+    with _graph_cache_lock:
+        _graph_cache[cache_key] = html_content
+        _graph_cache.move_to_end(cache_key)
+        while len(_graph_cache) > GRAPH_CACHE_SIZE:
+            _graph_cache.popitem(last=False)
+    
+    return html_content
@@ -0,0 +1,225 @@
+# src/dashboard/graph_layout.py
+
+from typing import List, Dict, Any, Optional, Tuple, Hashable
+from collections import OrderedDict
+import math
+import threading
+import zlib
+import numpy as np
+
+# Grid spacing (px) between cluster anchors - wide enough for two signal rings
+CLUSTER_SPACING = 450.0
+
+# Recompute the whole projection once more than this fraction of clusters changed
+FULL_RELAYOUT_FRACTION = 0.25
+
+# Anchors kept for clusters absent from the latest call (other windows, facets, sessions)
+MAX_IDLE_ANCHORS = 5000
+
+
+def _cluster_vector(cluster: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Centroid, or mean member embedding when no centroid is stored."""
+    if cluster.get("centroid") is not None:
+        return np.asarray(cluster["centroid"], dtype=np.float64)
+    embeddings = cluster.get("embeddings")
+    if embeddings is not None and len(embeddings):
+        return np.asarray(embeddings, dtype=np.float64).mean(axis=0)
+    return None
+
+
+def _fingerprint(cluster: Dict[str, Any]) -> Hashable:
+    """
+    Change detector for the anchor's input vector.
+
+    With a stored centroid (kept as-is by time-filtered copies) it is a
+    checksum of the centroid, so a window change does not look like a content
+    change; otherwise the anchor uses the mean member embedding, which does
+    follow the window: member count and newest member id.
+    """
+    if cluster.get("centroid") is not None:
+        return zlib.crc32(np.asarray(cluster["centroid"], dtype=np.float64).tobytes())
+    signals = cluster.get("signals", [])
+    return len(signals), signals[-1].get("signal_id") if signals else None
+
+
+def _fallback_position(cluster_id: str, radius: float) -> np.ndarray:
+    """Deterministic point on a circle for clusters without vectors."""
+    angle = (zlib.crc32(cluster_id.encode("utf-8")) % 3600) / 3600 * 2 * math.pi
+    return np.array([radius * math.cos(angle), radius * math.sin(angle)])
+
+
+def _ring_offsets(radius: int) -> List[Tuple[int, int]]:
+    """Grid offsets at Chebyshev distance `radius` (the square ring's perimeter)."""
+    if radius == 0:
+        return [(0, 0)]
+    offsets = [(dx, dy) for dx in range(-radius, radius + 1) for dy in (-radius, radius)]
+    offsets += [(dx, dy) for dy in range(-radius + 1, radius) for dx in (-radius, radius)]
+    return offsets
+
+
+def _snap_to_grid(
+    positions: np.ndarray,
+    spacing: float,
+    movable: Optional[np.ndarray] = None,
+    blocked: Optional[List[np.ndarray]] = None
+) -> np.ndarray:
+    """
+    Move anchors to the nearest free cell of a square grid with the given spacing.
+
+    Keeps the projection's neighborhoods while guaranteeing anchors never
+    overlap, in roughly linear time. Only rows flagged in `movable` are moved;
+    the others keep their position and block their cell, so incremental
+    updates leave anchors the user has already seen where they are. Cells of
+    `blocked` anchors (cached for clusters outside this call) are kept free too.
+    """
+    positions = positions.copy()
+    if movable is None:
+        movable = np.ones(len(positions), dtype=bool)
+
+    occupied = {
+        (int(round(x / spacing)), int(round(y / spacing)))
+        for x, y in list(positions[~movable]) + list(blocked or [])
+    }
+
+    for i in np.flatnonzero(movable).tolist():
+        cx, cy = int(round(positions[i, 0] / spacing)), int(round(positions[i, 1] / spacing))
+        radius = 0
+        cell = None
+        while cell is None:
+            # Free cells on the square ring at this radius, nearest to the projected point first
+            ring = [(cx + dx, cy + dy) for dx, dy in _ring_offsets(radius) if (cx + dx, cy + dy) not in occupied]
+            if ring:
+                cell = min(ring, key=lambda c: (c[0] * spacing - positions[i, 0]) ** 2 + (c[1] * spacing - positions[i, 1]) ** 2)
+            radius += 1
+        occupied.add(cell)
+        positions[i] = (cell[0] * spacing, cell[1] * spacing)
+    return positions
+
+
+class GraphLayout:
+    """
+    Server-side layout for the cluster graph (no browser physics needed).
+
+    Cluster anchors come from a 2-D PCA projection of the cluster centroids;
+    member signals sit on a ring around their anchor in timestamp order.
+    Anchors are snapped to a grid so they never overlap. Anchor positions are
+    cached per cluster with a fingerprint of its input vector: when only a few
+    clusters change, new or changed clusters are projected with the stored PCA basis and placed in the nearest free
+    cell while every other anchor stays put.
+
+    Callers pass time-filtered (and facet-filtered) cluster sets, so anchors
+    of clusters outside the latest call are kept, least recently used first
+    out, and reused when a window or another session brings them back. A full
+    relayout changes the basis and drops them. One lock serializes callers,
+    since a single instance is shared by all dashboard sessions.
+    """
+
+    def __init__(self, spacing: float = CLUSTER_SPACING, max_idle_anchors: int = MAX_IDLE_ANCHORS):
+        self.spacing = spacing
+        self.max_idle_anchors = max_idle_anchors
+        self._anchors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._fingerprints: Dict[str, Hashable] = {}
+        self._basis: Optional[Tuple[np.ndarray, np.ndarray, float]] = None
+        self._lock = threading.Lock()
+
+    def _fit(self, vectors: np.ndarray):
+        mean = vectors.mean(axis=0)
+        centered = vectors - mean
+        if len(vectors) >= 2:
+            _, _, vt = np.linalg.svd(centered, full_matrices=False)
+            components = vt[:2]
+            if len(components) < 2:
+                components = np.vstack([components, np.zeros_like(components[0])])
+        else:
+            components = np.zeros((2, vectors.shape[1]))
+        projected = centered @ components.T
+        # Scale so the layout covers ~spacing px per cluster along each axis
+        extent = float(np.abs(projected).max()) or 1.0
+        scale = self.spacing * math.sqrt(len(vectors)) / (2 * extent)
+        self._basis = (mean, components, scale)
+
+    def _project(self, vector: np.ndarray) -> np.ndarray:
+        mean, components, scale = self._basis
+        return ((vector - mean) @ components.T) * scale
+
+    def cluster_positions(self, clusters: List[Dict[str, Any]]) -> Dict[str, Tuple[float, float]]:
+        """Anchor (x, y) per cluster_id, reusing cached anchors of unchanged clusters."""
+        if not clusters:
+            return {}
+
+        with self._lock:
+            return self._cluster_positions(clusters)
+
+    def _cluster_positions(self, clusters: List[Dict[str, Any]]) -> Dict[str, Tuple[float, float]]:
+        ids = [c["cluster_id"] for c in clusters]
+        fingerprints = [_fingerprint(c) for c in clusters]
+        changed = [
+            i for i, (cid, fp) in enumerate(zip(ids, fingerprints))
+            if self._fingerprints.get(cid) != fp or cid not in self._anchors
+        ]
+
+        radius = self.spacing * math.sqrt(len(clusters)) / 2
+        full = self._basis is None or len(changed) > FULL_RELAYOUT_FRACTION * len(clusters)
+
+        if full:
+            vectors = [_cluster_vector(c) for c in clusters]
+            dims = {len(v) for v in vectors if v is not None}
+            if len(dims) == 1:
+                self._fit(np.vstack([v for v in vectors if v is not None]))
+            positions = np.vstack([
+                self._project(v) if v is not None and self._basis is not None else _fallback_position(cid, radius)
+                for cid, v in zip(ids, vectors)
+            ])
+            positions = _snap_to_grid(positions, self.spacing)
+        elif changed:
+            positions = np.vstack([self._anchors.get(cid, np.zeros(2)) for cid in ids])
+            for i in changed:
+                vector = _cluster_vector(clusters[i])
+                positions[i] = self._project(vector) if vector is not None and len(vector) == len(self._basis[0]) \
+                    else _fallback_position(ids[i], radius)
+            movable = np.zeros(len(ids), dtype=bool)
+            movable[changed] = True
+            current = set(ids)
+            idle = [anchor for cid, anchor in self._anchors.items() if cid not in current]
+            positions = _snap_to_grid(positions, self.spacing, movable=movable, blocked=idle)
+        else:
+            positions = np.vstack([self._anchors[cid] for cid in ids])
+
+        if full:
+            # Anchors from the previous basis would overlap the new grid
+            self._anchors.clear()
+            self._fingerprints.clear()
+        for i, cid in enumerate(ids):
+            self._anchors[cid] = positions[i]
+            self._anchors.move_to_end(cid)
+            self._fingerprints[cid] = fingerprints[i]
+        # Bound the idle anchors so removed (e.g., evicted) clusters don't accumulate
+        while len(self._anchors) > len(ids) + self.max_idle_anchors:
+            cid, _ = self._anchors.popitem(last=False)
+            self._fingerprints.pop(cid, None)
+
+        return {cid: (float(x), float(y)) for cid, (x, y) in zip(ids, positions)}
+
+    def node_positions(
+        self,
+        clusters: List[Dict[str, Any]],
+        visible_signal_ids: Dict[str, List[str]],
+        cluster_sizes: Dict[str, float]
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Positions for every graph node: cluster anchors, member signals on a
+        ring around their anchor, and the "+N more" node just outside the ring.
+        """
+        anchors = self.cluster_positions(clusters)
+        positions: Dict[str, Tuple[float, float]] = {}
+
+        for cluster_id, (x, y) in anchors.items():
+            positions[f"cluster_{cluster_id}"] = (x, y)
+            signal_ids = visible_signal_ids.get(cluster_id, [])
+            ring = cluster_sizes.get(cluster_id, 35.0) + 40.0 + 2.0 * len(signal_ids)
+            for j, signal_id in enumerate(signal_ids):
+                angle = 2 * math.pi * j / max(len(signal_ids), 1)
+                positions[signal_id] = (x + ring * math.cos(angle), y + ring * math.sin(angle))
+            positions[f"collapsed_{cluster_id}"] = (x, y - ring - 30.0)
+
+        return positions
@@ -0,0 +1,214 @@
+# src/dashboard/keyword_index.py
+
+from typing import List, Dict, Any, Set, Optional
+from collections import Counter
+import math
+
+from src.dashboard.search import normalize_text, STOPWORDS
+
+
+def keyword_counts(text: str) -> Counter:
+    """
+    Keyword term frequencies for one text.
+
+    Uses the same normalization and filtering rules as extract_keywords(), so
+    set(keyword_counts(text)) == extract_keywords(text).
+    """
+    return Counter(
+        token for token in normalize_text(text).split()
+        if len(token) >= 3 and token not in STOPWORDS
+    )
+
+
+def cluster_keyword_tf(signals: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Keyword term frequencies over all signal texts of a cluster."""
+    return add_signals_to_keyword_tf({}, signals)
+
+
+def add_signals_to_keyword_tf(keyword_tf: Dict[str, int], signals: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Incrementally add signal texts to a cluster's term frequencies (mutates and returns it)."""
+    for signal in signals:
+        for term, count in keyword_counts(signal.get("text", "")).items():
+            keyword_tf[term] = keyword_tf.get(term, 0) + count
+    return keyword_tf
+
+
+def ensure_keyword_tf(cluster: Dict[str, Any]) -> Dict[str, int]:
+    """Backfill term frequencies for clusters stored before the keyword index existed."""
+    if not cluster.get("keyword_tf"):
+        cluster["keyword_tf"] = cluster_keyword_tf(cluster.get("signals", []))
+    return cluster["keyword_tf"]
+
+
+class KeywordIndex:
+    """
+    Inverted keyword index: term -> {cluster_id: term frequency}.
+
+    Cluster term frequencies are computed once at ingest time (and persisted
+    with each cluster as `keyword_tf`), so queries never re-tokenize the corpus.
+    Scoring a query touches only the postings of its terms.
+
+    The index covers the full dataset. Scores restricted to time-filtered
+    copies of its clusters (fewer signals than were indexed) use the term
+    frequencies of the copies' own signals, tokenized on first use and
+    memoized per signal id.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self._cluster_terms: Dict[str, Dict[str, int]] = {}
+        self._signal_counts: Dict[str, int] = {}
+        self._signal_terms: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+
+    @classmethod
+    def from_clusters(cls, clusters: List[Dict[str, Any]]) -> "KeywordIndex":
+        """Build the index from persisted `keyword_tf` (tokenizing only clusters without one)."""
+        index = cls()
+        for cluster in clusters:
+            keyword_tf = cluster.get("keyword_tf") or cluster_keyword_tf(cluster.get("signals", []))
+            index.add_cluster(cluster["cluster_id"], keyword_tf, signal_count=len(cluster.get("signals", [])))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._cluster_terms)
+
+    def add_cluster(self, cluster_id: str, keyword_tf: Dict[str, int], signal_count: Optional[int] = None):
+        """Insert or replace a cluster's postings (signal_count enables windowed scoring)."""
+        if cluster_id in self._cluster_terms:
+            self.remove_cluster(cluster_id)
+
+        terms = dict(keyword_tf)
+        self._cluster_terms[cluster_id] = terms
+        if signal_count is not None:
+            self._signal_counts[cluster_id] = signal_count
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[cluster_id] = tf
+
+        length = sum(terms.values())
+        self.doc_lengths[cluster_id] = length
+        self._total_length += length
+
+    def add_signals(self, cluster_id: str, signals: List[Dict[str, Any]]):
+        """Incrementally index new signals of an existing (or new) cluster."""
+        terms = self._cluster_terms.setdefault(cluster_id, {})
+        added = 0
+        for signal in signals:
+            for term, count in keyword_counts(signal.get("text", "")).items():
+                terms[term] = terms.get(term, 0) + count
+                self.postings.setdefault(term, {})[cluster_id] = terms[term]
+                added += count
+        self.doc_lengths[cluster_id] = self.doc_lengths.get(cluster_id, 0) + added
+        self._total_length += added
+        if cluster_id in self._signal_counts:
+            self._signal_counts[cluster_id] += len(signals)
+
+    def remove_cluster(self, cluster_id: str):
+        """Drop a cluster's postings."""
+        terms = self._cluster_terms.pop(cluster_id, None)
+        self._signal_counts.pop(cluster_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(cluster_id, None)
+                if not posting:
+                    del self.postings[term]
+        self._total_length -= self.doc_lengths.pop(cluster_id, 0)
+
+    def _signal_keyword_counts(self, signal: Dict[str, Any]) -> Dict[str, int]:
+        signal_id = signal.get("signal_id")
+        if signal_id is None:
+            return keyword_counts(signal.get("text", ""))
+        counts = self._signal_terms.get(signal_id)
+        if counts is None:
+            counts = self._signal_terms[signal_id] = keyword_counts(signal.get("text", ""))
+        return counts
+
+    def window_terms(self, cluster: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        Term frequencies of a time-filtered cluster copy's own signals.
+
+        Returns None when the copy holds every indexed signal (its indexed
+        term frequencies apply as they are).
+        """
+        signals = cluster.get("signals", [])
+        indexed = self._signal_counts.get(cluster["cluster_id"])
+        if indexed is None or len(signals) >= indexed:
+            return None
+        terms: Dict[str, int] = {}
+        for signal in signals:
+            for term, count in self._signal_keyword_counts(signal).items():
+                terms[term] = terms.get(term, 0) + count
+        return terms
+
+    def _restricted_terms(self, query_keywords: Set[str], clusters: Optional[List[Dict[str, Any]]]):
+        """Per matching cluster: None (indexed terms apply) or its windowed term frequencies."""
+        matched = set()
+        for term in query_keywords:
+            matched.update(self.postings.get(term, {}).keys())
+        if clusters is None:
+            return {cluster_id: None for cluster_id in matched}
+        # Windowed term frequencies are a subset of the indexed ones: only indexed matches can match
+        return {
+            cluster["cluster_id"]: self.window_terms(cluster)
+            for cluster in clusters if cluster["cluster_id"] in matched
+        }
+
+    def lexical_scores(self, query_keywords: Set[str], clusters: Optional[List[Dict[str, Any]]] = None) -> Dict[str, float]:
+        """
+        Lexical overlap ratio per matching cluster: (# query keywords in cluster) / (# query keywords).
+
+        Same value as compute_lexical_score(); clusters without any match are omitted (score 0.0).
+        With `clusters` (e.g. time-filtered copies of indexed clusters), scores are
+        restricted to them and computed from their own signals.
+        """
+        if not query_keywords:
+            return {}
+        scores: Dict[str, float] = {}
+        for cluster_id, window in self._restricted_terms(query_keywords, clusters).items():
+            terms = self._cluster_terms[cluster_id] if window is None else window
+            hits = sum(1 for term in query_keywords if terms.get(term))
+            if hits:
+                scores[cluster_id] = hits / len(query_keywords)
+        return scores
+
+    def bm25_scores(
+        self,
+        query_keywords: Set[str],
+        k1: float = 1.2,
+        b: float = 0.75,
+        clusters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, float]:
+        """
+        Okapi BM25 score per matching cluster (each cluster is one document).
+
+        Scores are normalized to [0, 1] by the best match so they can replace the
+        overlap ratio in the hybrid score. With `clusters`, scores are restricted to
+        them and term frequencies / lengths come from their own signals; IDF and
+        the average length stay those of the full index.
+        """
+        n_docs = len(self._cluster_terms)
+        if not query_keywords or not n_docs:
+            return {}
+        avg_length = self._total_length / n_docs or 1.0
+
+        scores: Dict[str, float] = {}
+        for cluster_id, window in self._restricted_terms(query_keywords, clusters).items():
+            terms = self._cluster_terms[cluster_id] if window is None else window
+            length = self.doc_lengths[cluster_id] if window is None else sum(window.values())
+            norm = k1 * (1 - b + b * length / avg_length)
+            for term in query_keywords:
+                posting = self.postings.get(term)
+                tf = terms.get(term, 0)
+                if not posting or not tf:
+                    continue
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                scores[cluster_id] = scores.get(cluster_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        best = max(scores.values(), default=0.0)
+        if best <= 0:
+            return {}
+        return {cluster_id: score / best for cluster_id, score in scores.items()}
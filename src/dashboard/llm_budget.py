@@ -0,0 +1,176 @@
+# src/dashboard/llm_budget.py
+
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from collections import deque
+import os
+import threading
+import time
+import numpy as np
+
+from src.dashboard.feed import EMERGENCE_PRIORITY
+from src.scoring.emergence import compute_emergence
+
+# Gemini calls (every request attempt, titles and answers alike) per pipeline
+# run / dashboard data version, and per rolling minute across the process
+LLM_MAX_CALLS_PER_RUN = int(os.getenv("LLM_MAX_CALLS_PER_RUN", "200"))
+LLM_MAX_CALLS_PER_MINUTE = int(os.getenv("LLM_MAX_CALLS_PER_MINUTE", "60"))
+
+# Rough prompt size estimate for the spend report (Gemini averages ~4 chars per token)
+CHARS_PER_TOKEN = 4
+
+
+def cluster_priority(cluster: Dict[str, Any], recent_days: int = 30) -> Tuple[int, float, int]:
+    """
+    Sort key for spending LLM calls: emergence level, then growth ratio, then size.
+
+    Same ordering as the emerging feed, with the signal count as tie-breaker.
+    Clusters without member timestamps rank below every scored cluster.
+    """
+    size = len(cluster.get("signals", []))
+    try:
+        emergence = compute_emergence(cluster, recent_days=recent_days)
+    except (KeyError, TypeError, ValueError):
+        return (0, 0.0, size)
+    return (EMERGENCE_PRIORITY[emergence["emergence_level"]], emergence["growth_ratio"], size)
+
+
+def rank_by_priority(clusters: List[Dict[str, Any]], recent_days: int = 30) -> List[Dict[str, Any]]:
+    """Clusters ordered by cluster_priority(), highest first (stable for ties)."""
+    return sorted(clusters, key=lambda c: cluster_priority(c, recent_days), reverse=True)
+
+
+class LLMBudget:
+    """
+    Call budget in front of every Gemini request.
+
+    Enforces a cap per run and a rolling per-minute cap. acquire() either
+    grants a call or refuses it, and callers then fall back locally
+    (provisional titles, no precomputed answer) instead of failing. Only the
+    per-minute cap can be waited out; an exhausted run budget is final until
+    start_run(). Every call's latency and prompt size is recorded for the
+    per-run report.
+    """
+
+    def __init__(
+        self,
+        max_calls_per_run: int = LLM_MAX_CALLS_PER_RUN,
+        max_calls_per_minute: int = LLM_MAX_CALLS_PER_MINUTE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.max_calls_per_run = max_calls_per_run
+        self.max_calls_per_minute = max_calls_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._window: deque = deque()
+        self.start_run()
+
+    def start_run(self):
+        """Reset the run budget and the report (the per-minute window carries over)."""
+        with self._lock:
+            self._calls = 0
+            self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _kind_stats(self, kind: str) -> Dict[str, Any]:
+        return self._stats.setdefault(kind, {"calls": 0, "denied": 0, "failed": 0, "prompt_chars": 0, "latencies": []})
+
+    @property
+    def remaining(self) -> int:
+        """Calls left in this run."""
+        with self._lock:
+            return max(0, self.max_calls_per_run - self._calls)
+
+    def acquire(self, kind: str, wait: bool = False) -> bool:
+        """
+        Take one call from the budget.
+
+        Args:
+            kind: What the call is for ("title", "answer", ...) - reported separately
+            wait: Wait for the per-minute window instead of refusing (batch work)
+
+        Returns:
+            True if the call may be made
+        """
+        while True:
+            with self._lock:
+                if self._calls >= self.max_calls_per_run:
+                    self._kind_stats(kind)["denied"] += 1
+                    return False
+                now = self._clock()
+                while self._window and now - self._window[0] >= 60.0:
+                    self._window.popleft()
+                if len(self._window) < self.max_calls_per_minute:
+                    self._window.append(now)
+                    self._calls += 1
+                    return True
+                if not wait:
+                    self._kind_stats(kind)["denied"] += 1
+                    return False
+                delay = 60.0 - (now - self._window[0])
+            self._sleep(delay)
+
+    def record(self, kind: str, latency_seconds: float, prompt_chars: int = 0, ok: bool = True):
+        """Record a finished call (granted by acquire())."""
+        with self._lock:
+            stats = self._kind_stats(kind)
+            stats["calls"] += 1
+            stats["prompt_chars"] += prompt_chars
+            stats["latencies"].append(latency_seconds)
+            if not ok:
+                stats["failed"] += 1
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Spend and latency for this run, per kind of call.
+
+        Returns:
+            kind -> calls, denied, failed, est_prompt_tokens, latency p50/p95/max (ms)
+        """
+        with self._lock:
+            stats = {kind: dict(s, latencies=list(s["latencies"])) for kind, s in self._stats.items()}
+
+        report = {}
+        for kind, s in stats.items():
+            latencies = np.asarray(s["latencies"], dtype=np.float64) * 1000.0
+            report[kind] = {
+                "calls": s["calls"],
+                "denied": s["denied"],
+                "failed": s["failed"],
+                "est_prompt_tokens": s["prompt_chars"] // CHARS_PER_TOKEN,
+                "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+                "p95_ms": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+                "max_ms": float(latencies.max()) if len(latencies) else 0.0
+            }
+        return report
+
+    def format_report(self) -> List[str]:
+        """One printable line per kind of call, plus the run total."""
+        report = self.report()
+        lines = [
+            f"{kind}: {r['calls']} calls, {r['denied']} denied, {r['failed']} failed, "
+            f"~{r['est_prompt_tokens']} prompt tokens, latency p50 {r['p50_ms']:.0f} ms / "
+            f"p95 {r['p95_ms']:.0f} ms / max {r['max_ms']:.0f} ms"
+            for kind, r in sorted(report.items())
+        ]
+        used = self.max_calls_per_run - self.remaining
+        lines.append(f"total: {used}/{self.max_calls_per_run} calls of the run budget")
+        return lines
+
+
+_llm_budget: Optional[LLMBudget] = None
+_llm_budget_lock = threading.Lock()
+
+
+def get_llm_budget() -> LLMBudget:
+    """Process-wide budget shared by every Gemini caller."""
+    global _llm_budget
+    with _llm_budget_lock:
+        if _llm_budget is None:
+            _llm_budget = LLMBudget()
+        return _llm_budget
+
+
+def start_llm_run():
+    """Start a new run budget (a pipeline run, or a new data version in the dashboard)."""
+    get_llm_budget().start_run()
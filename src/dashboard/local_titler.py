@@ -0,0 +1,202 @@
+# src/dashboard/local_titler.py
+
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from itertools import chain
+import string
+import threading
+import numpy as np
+
+from src.dashboard.keyword_index import keyword_counts, cluster_keyword_tf
+from src.dashboard.search import STOPWORDS
+
+# Key phrases per title, joined like the previous keyword titles ("A / B / C")
+TITLE_TERMS = 3
+DEFAULT_TITLE = "Emerging Technology Cluster"
+
+# Pipeline meta key holding the signal-corpus document frequencies
+DF_META_KEY = "signal_term_df"
+
+_PUNCTUATION = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _cased_tokens(text: str) -> Iterable[Tuple[str, str]]:
+    """(keyword term, surface form) pairs, tokenized like keyword_counts() but keeping case."""
+    for token in text.translate(_PUNCTUATION).split():
+        term = token.lower()
+        if len(term) >= 3 and term not in STOPWORDS:
+            yield term, token
+
+
+def _title_term(term: str) -> bool:
+    # Years, counts and version numbers make poor titles
+    return not any(ch.isdigit() for ch in term)
+
+
+class DocumentFrequencies:
+    """
+    Document frequencies over the signal corpus (one document per signal).
+
+    Updated incrementally with each ingest batch and persisted in pipeline
+    meta, so the corpus is never re-tokenized. Also remembers a cased surface
+    form for terms that appear capitalized ("nvidia" -> "Nvidia", "gpu" ->
+    "GPU"); all-lowercase terms are not stored.
+    """
+
+    def __init__(self, n_docs: int = 0, df: Optional[Dict[str, int]] = None, display: Optional[Dict[str, str]] = None):
+        self.n_docs = n_docs
+        self.df: Dict[str, int] = df or {}
+        self.display: Dict[str, str] = display or {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def add_texts(self, texts: Iterable[str]) -> "DocumentFrequencies":
+        """Count each text as one new document (mutates and returns self)."""
+        for text in texts:
+            self.n_docs += 1
+            seen = set()
+            for term, surface in _cased_tokens(text):
+                if term not in seen:
+                    seen.add(term)
+                    self.df[term] = self.df.get(term, 0) + 1
+                if surface != term and term not in self.display:
+                    self.display[term] = surface
+        return self
+
+    @classmethod
+    def from_clusters(cls, clusters: List[Dict[str, Any]]) -> "DocumentFrequencies":
+        """Build from every member signal (backfill when nothing is persisted yet)."""
+        return cls().add_texts(s.get("text", "") for c in clusters for s in c.get("signals", []))
+
+    def idf(self, terms: List[str]) -> np.ndarray:
+        """Smoothed IDF for many terms at once (unseen terms get the maximum)."""
+        df = np.fromiter((self.df.get(t, 0) for t in terms), dtype=np.float64, count=len(terms))
+        return np.log((1.0 + self.n_docs) / (1.0 + df)) + 1.0
+
+    def surface(self, term: str) -> str:
+        cased = self.display.get(term)
+        return cased if cased and not cased.islower() else term.capitalize()
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {"n_docs": self.n_docs, "df": self.df, "display": self.display}
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "DocumentFrequencies":
+        return cls(payload.get("n_docs", 0), payload.get("df", {}), payload.get("display", {}))
+
+
+class LocalTitler:
+    """
+    Keyword titles without the LLM: the cluster's top TF-IDF terms.
+
+    Term frequencies come from each cluster's persisted `keyword_tf`, IDF from
+    the signal-corpus DocumentFrequencies. All clusters are scored in one
+    vectorized pass over a sparse (cluster, term) table, so titling thousands
+    of clusters costs a few milliseconds per thousand.
+    """
+
+    def __init__(self, doc_freqs: Optional[DocumentFrequencies] = None):
+        self.doc_freqs = doc_freqs or DocumentFrequencies()
+
+    def _titles_from_tf(self, term_freqs: List[Dict[str, int]], n_terms: int) -> List[str]:
+        lengths = np.fromiter((len(tf) for tf in term_freqs), dtype=np.int64, count=len(term_freqs))
+        titles = [DEFAULT_TITLE] * len(term_freqs)
+        if not lengths.sum():
+            return titles
+
+        vocab: Dict[str, int] = {}
+        cols = np.fromiter(
+            (vocab.setdefault(t, len(vocab)) for t in chain.from_iterable(term_freqs)),
+            dtype=np.int64, count=int(lengths.sum())
+        )
+        counts = np.fromiter(chain.from_iterable(tf.values() for tf in term_freqs), dtype=np.float64, count=len(cols))
+        rows = np.repeat(np.arange(len(term_freqs)), lengths)
+
+        terms = list(vocab)
+        keep = np.fromiter((_title_term(t) for t in terms), dtype=bool, count=len(terms))[cols]
+        rows, cols, counts = rows[keep], cols[keep], counts[keep]
+
+        # Sublinear TF x IDF; best terms first within each cluster (ties: first seen)
+        scores = (1.0 + np.log(counts)) * self.doc_freqs.idf(terms)[cols]
+        order = np.lexsort((cols, -scores, rows))
+        rows, cols = rows[order], cols[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows, side="left")
+        top = rank < n_terms
+
+        picked: Dict[int, List[str]] = {}
+        for row, col in zip(rows[top].tolist(), cols[top].tolist()):
+            picked.setdefault(row, []).append(self.doc_freqs.surface(terms[col]))
+        for row, words in picked.items():
+            titles[row] = " / ".join(words)
+        return titles
+
+    def title_clusters(self, clusters: List[Dict[str, Any]], n_terms: int = TITLE_TERMS) -> Dict[str, str]:
+        """
+        Titles for many clusters in one pass.
+
+        Args:
+            clusters: Clusters with "cluster_id" and "keyword_tf" (or "signals" to tokenize)
+            n_terms: Key phrases per title
+
+        Returns:
+            cluster_id -> title
+        """
+        term_freqs = [c.get("keyword_tf") or cluster_keyword_tf(c.get("signals", [])) for c in clusters]
+        titles = self._titles_from_tf(term_freqs, n_terms)
+        return {c["cluster_id"]: title for c, title in zip(clusters, titles)}
+
+    def title_texts(self, texts: List[str], n_terms: int = TITLE_TERMS) -> str:
+        """Title for one cluster given its signal texts."""
+        term_freqs = {}
+        for text in texts:
+            for term, count in keyword_counts(text).items():
+                term_freqs[term] = term_freqs.get(term, 0) + count
+        return self._titles_from_tf([term_freqs], n_terms)[0]
+
+
+def load_document_frequencies(clusters: Optional[List[Dict[str, Any]]] = None) -> DocumentFrequencies:
+    """
+    Persisted document frequencies, or a backfill from `clusters` if none are stored yet.
+    """
+    from src.memory.meta_store import load_meta
+
+    payload = load_meta(DF_META_KEY)
+    if payload and payload.get("n_docs"):
+        return DocumentFrequencies.from_payload(payload)
+    return DocumentFrequencies.from_clusters(clusters or [])
+
+
+def save_document_frequencies(doc_freqs: DocumentFrequencies) -> bool:
+    """Persist document frequencies (Qdrant pipeline meta, local file as fallback)."""
+    from src.memory.meta_store import save_meta
+
+    return save_meta(DF_META_KEY, doc_freqs.to_payload())
+
+
+_local_titler: Optional[LocalTitler] = None
+_local_titler_lock = threading.Lock()
+
+
+def get_local_titler() -> LocalTitler:
+    """Process-wide titler over the persisted document frequencies (loaded on first use)."""
+    global _local_titler
+    with _local_titler_lock:
+        if _local_titler is None:
+            try:
+                _local_titler = LocalTitler(load_document_frequencies())
+            except Exception as e:
+                print(f"[WARNING] Could not load document frequencies: {e}")
+                _local_titler = LocalTitler()
+        return _local_titler
+
+
+def set_local_titler(titler: LocalTitler):
+    """Replace the process-wide titler (e.g., the dashboard's, built for the loaded dataset)."""
+    global _local_titler
+    with _local_titler_lock:
+        _local_titler = titler
+
+
+def local_title(texts: List[str]) -> str:
+    """Keyword title for one cluster's signal texts."""
+    return get_local_titler().title_texts(texts)
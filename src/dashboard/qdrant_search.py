@@ -0,0 +1,214 @@
+# src/dashboard/qdrant_search.py
+
+from typing import List, Dict, Any, Optional
+import zlib
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from src.dashboard.search import extract_keywords, embed_query
+from src.dashboard.keyword_index import cluster_keyword_tf
+
+# Named vectors on clusters_warm when the hybrid layout is enabled
+DENSE_VECTOR = "dense"
+LEXICAL_VECTOR = "lexical"
+
+# Same weights as search_clusters_hybrid()
+SEMANTIC_WEIGHT = 0.7
+LEXICAL_WEIGHT = 0.3
+
+# BM25 term-frequency saturation (tf=1 -> weight 1.0, repeated terms approach 1 + k1)
+BM25_K1 = 1.2
+
+
+def term_index(term: str) -> int:
+    """Stable sparse-vector dimension for a keyword (CRC32, identical across runs and processes)."""
+    return zlib.crc32(term.encode("utf-8")) & 0x7FFFFFFF
+
+
+def _sparse_from_weights(weights: Dict[int, float]) -> models.SparseVector:
+    indices = sorted(weights)
+    return models.SparseVector(indices=indices, values=[weights[i] for i in indices])
+
+
+def lexical_sparse_vector(keyword_tf: Dict[str, int], k1: float = BM25_K1) -> models.SparseVector:
+    """
+    Document-side sparse vector: BM25-saturated term frequency per keyword.
+
+    No length normalization or IDF is baked in, so stored vectors never go stale
+    as the collection grows.
+    """
+    weights: Dict[int, float] = {}
+    for term, tf in keyword_tf.items():
+        if tf > 0:
+            index = term_index(term)
+            weights[index] = weights.get(index, 0.0) + tf * (k1 + 1) / (tf + k1)
+    return _sparse_from_weights(weights)
+
+
+def query_sparse_vector(query_keywords) -> models.SparseVector:
+    """
+    Query-side sparse vector with weight 1/|q| per keyword.
+
+    For clusters mentioning each term once, the dot product equals the keyword
+    overlap ratio used by compute_lexical_score(); repeated mentions can push it
+    above 1, so search_clusters_qdrant() caps the lexical score at 1.
+    """
+    if not query_keywords:
+        return models.SparseVector(indices=[], values=[])
+    weight = 1.0 / len(query_keywords)
+    return _sparse_from_weights({term_index(term): weight for term in query_keywords})
+
+
+def collection_supports_hybrid(client: QdrantClient, collection_name: str = "clusters_warm") -> bool:
+    """True if the collection stores the named dense + sparse lexical vectors."""
+    try:
+        params = client.get_collection(collection_name).config.params
+    except Exception as e:
+        print(f"[WARNING] Could not inspect collection '{collection_name}': {e}")
+        return False
+    return (
+        isinstance(params.vectors, dict) and DENSE_VECTOR in params.vectors
+        and bool(params.sparse_vectors) and LEXICAL_VECTOR in params.sparse_vectors
+    )
+
+
+def _sparse_dot(a: Optional[models.SparseVector], b: models.SparseVector) -> float:
+    if a is None or not a.indices or not b.indices:
+        return 0.0
+    b_weights = dict(zip(b.indices, b.values))
+    return float(sum(value * b_weights.get(index, 0.0) for index, value in zip(a.indices, a.values)))
+
+
+def search_clusters_qdrant(
+    query: str,
+    client: QdrantClient,
+    embedding_model,
+    collection_name: str = "clusters_warm",
+    min_final_score: float = 0.35,
+    top_k: int = 50,
+    prefetch_limit: int = 200,
+    clusters: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Server-side hybrid search: Qdrant fuses dense and sparse lexical scores.
+
+    Runs a dense prefetch (centroid cosine) and a sparse prefetch (keyword
+    weights) and combines them inside Qdrant with a formula query:
+    final = 0.7 * semantic + 0.3 * min(lexical, 1). Only the top_k fused points are
+    returned to the dashboard, so the cost scales with the collection's
+    indexes rather than with the clusters held in memory.
+
+    Args:
+        query: User's search query
+        client: Qdrant client with a hybrid-layout collection
+        embedding_model: The embedding model to encode the query
+        collection_name: Cluster collection (named "dense" + sparse "lexical" vectors)
+        min_final_score: Minimum final score threshold (default: 0.35)
+        top_k: Maximum number of results
+        prefetch_limit: Candidates fetched per prefetch before fusion
+        clusters: Optional in-memory clusters (e.g., the time-filtered subset).
+            Results are restricted to them and carry their full fields
+            (signals, embeddings); otherwise the stored payload is used.
+            A time-filtered copy holding fewer signals than were stored is
+            re-scored from its in-window signals' keywords (the stored sparse
+            vector covers every signal, so the fused score is an upper bound).
+
+    Returns:
+        Same schema as search_clusters_hybrid(): cluster fields plus
+        semantic_score, lexical_score, final_score and cluster_type,
+        sorted by final_score, then signal_count.
+    """
+    if not query.strip():
+        return []
+
+    query_keywords = extract_keywords(query)
+
+    try:
+        query_embedding = embed_query(embedding_model, query)
+    except Exception as e:
+        print(f"Error embedding query: {e}")
+        return []
+
+    query_sparse = query_sparse_vector(query_keywords)
+    prefetch = [models.Prefetch(query=query_embedding.tolist(), using=DENSE_VECTOR, limit=prefetch_limit)]
+    if query_sparse.indices:
+        prefetch.append(models.Prefetch(query=query_sparse, using=LEXICAL_VECTOR, limit=prefetch_limit))
+
+    # Points found by only one prefetch score 0 for the other component. Repeated terms
+    # push the sparse dot product above 1, so the lexical term is capped at 1 like the
+    # overlap ratio: min(x, 1) = (x + 1 - |x - 1|) / 2 (formulas have no min expression)
+    half_lexical = LEXICAL_WEIGHT / 2
+    formula = models.FormulaQuery(
+        formula=models.SumExpression(sum=[
+            models.MultExpression(mult=[SEMANTIC_WEIGHT, "$score[0]"]),
+            models.MultExpression(mult=[half_lexical, "$score[1]"]),
+            half_lexical,
+            models.MultExpression(mult=[
+                -half_lexical,
+                models.AbsExpression(abs=models.SumExpression(sum=["$score[1]", -1.0]))
+            ])
+        ]),
+        defaults={"$score[0]": 0.0, "$score[1]": 0.0}
+    )
+
+    clusters_by_id = {c["cluster_id"]: c for c in clusters} if clusters is not None else None
+
+    try:
+        response = client.query_points(
+            collection_name=collection_name,
+            prefetch=prefetch,
+            query=formula,
+            # Over-fetch when results are restricted to a subset of the collection
+            limit=top_k if clusters_by_id is None else min(prefetch_limit * 2, top_k * 4),
+            score_threshold=min_final_score,
+            with_payload=True,
+            with_vectors=True
+        )
+    except Exception as e:
+        print(f"[WARNING] Qdrant hybrid search failed: {e}")
+        return []
+
+    query_unit = query_embedding / (np.linalg.norm(query_embedding) or 1.0)
+    results = []
+
+    for point in response.points:
+        payload = point.payload or {}
+        cluster_id = payload.get("cluster_id", str(point.id))
+
+        if clusters_by_id is not None:
+            cluster = clusters_by_id.get(cluster_id)
+            if cluster is None:
+                continue
+        else:
+            cluster = payload
+
+        # Recover both components from the returned vectors (Qdrant reports only the fused score)
+        vectors = point.vector if isinstance(point.vector, dict) else {}
+        dense = vectors.get(DENSE_VECTOR)
+        semantic_score = float(np.dot(query_unit, dense)) if dense is not None else 0.0
+        lexical_score = min(_sparse_dot(vectors.get(LEXICAL_VECTOR), query_sparse), 1.0)
+        final_score = float(point.score)
+        if clusters_by_id is not None and len(cluster.get("signals", [])) < payload.get("signal_count", 0):
+            window_sparse = lexical_sparse_vector(cluster_keyword_tf(cluster["signals"]))
+            lexical_score = min(_sparse_dot(window_sparse, query_sparse), 1.0)
+            final_score = SEMANTIC_WEIGHT * semantic_score + LEXICAL_WEIGHT * lexical_score
+
+        # Keep if: (semantic >= 0.30 OR lexical >= 0.10) AND final >= min_final_score
+        if (semantic_score >= 0.30 or lexical_score >= 0.10) and final_score >= min_final_score:
+            cluster_type = "Active" if cluster.get("signal_count", 0) >= 3 else "Candidate"
+            results.append({
+                **cluster,
+                "semantic_score": semantic_score,
+                "lexical_score": lexical_score,
+                "final_score": final_score,
+                "cluster_type": cluster_type
+            })
+
+    # Sort by final_score (desc), then signal_count (desc) as tie-breaker
+    results.sort(
+        key=lambda x: (x["final_score"], x.get("signal_count", 0)),
+        reverse=True
+    )
+
+    return results[:top_k]
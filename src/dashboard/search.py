@@ -1,6 +1,7 @@
 # src/dashboard/search.py
 
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional, Tuple
+from functools import lru_cache
 import numpy as np
 import re
 import string
@@ -106,11 +107,83 @@ def compute_lexical_score(query_keywords: Set[str], cluster_signals: List[Dict[s
     return lexical_score
 
 
+# Repeated searches reuse the query embedding instead of running the model again
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _cached_query_embedding(embedding_model, query: str) -> Tuple[float, ...]:
+    return tuple(embedding_model.embed(query))
+
+
+def embed_query(embedding_model, query: str) -> np.ndarray:
+    """
+    Embed a search query through a per-model LRU cache.
+
+    Queries are keyed after whitespace normalization, so "AWS  Trainium" and
+    "AWS Trainium" share one entry.
+    """
+    return np.asarray(_cached_query_embedding(embedding_model, " ".join(query.split())), dtype=np.float32)
+
+
+class ClusterSearchIndex:
+    """
+    Row-normalized centroid matrix for vectorized semantic scoring.
+
+    A query is scored against every cluster with one matrix-vector product.
+    Build it once per data version and reuse it across queries and time
+    filters - searches may pass any subset of the indexed clusters.
+    """
+
+    def __init__(self, clusters: List[Dict[str, Any]], embedding_model=None, version: Optional[str] = None):
+        self.version = version
+        self.cluster_ids = []
+        rows = []
+
+        for cluster in clusters:
+            centroid = cluster.get("centroid")
+
+            # Compute centroid if missing (mean of signal embeddings)
+            if centroid is None and embedding_model is not None and cluster.get("signals"):
+                try:
+                    signal_embeddings = [embedding_model.embed(s.get("text", "")) for s in cluster["signals"]]
+                    centroid = np.mean(np.array(signal_embeddings), axis=0)
+                except Exception as e:
+                    print(f"Error computing centroid for cluster {cluster.get('cluster_id', 'unknown')}: {e}")
+                    continue
+
+            # Skip clusters without centroids
+            if centroid is None:
+                continue
+
+            self.cluster_ids.append(cluster["cluster_id"])
+            rows.append(centroid)
+
+        matrix = np.asarray(rows, dtype=np.float32).reshape(len(rows), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+        self.positions = {cluster_id: i for i, cluster_id in enumerate(self.cluster_ids)}
+
+    def __len__(self) -> int:
+        return len(self.cluster_ids)
+
+    def semantic_scores(self, query_embedding) -> np.ndarray:
+        """Cosine similarity of the query to every indexed centroid."""
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        return self.matrix @ (query / norm if norm else query)
+
+
 def search_clusters_hybrid(
     query: str,
     clusters: List[Dict[str, Any]],
     embedding_model,
-    min_final_score: float = 0.35
+    min_final_score: float = 0.35,
+    keyword_index=None,
+    lexical_scoring: str = "overlap",
+    search_index: Optional[ClusterSearchIndex] = None,
+    top_k: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Hybrid search combining semantic similarity and lexical overlap.
@@ -121,11 +194,26 @@ def search_clusters_hybrid(
     - Keep if semantic_score >= 0.30 OR lexical_score >= 0.10
     - Keep if final_score >= min_final_score
     
+    Semantic scores come from one matrix-vector product over a normalized
+    centroid matrix; lexical scoring and thresholds run only on the candidate set.
+    
     Args:
         query: User's search query (e.g., "AWS Trainium3")
         clusters: List of all clusters (active + candidate)
         embedding_model: The embedding model to encode the query
         min_final_score: Minimum final score threshold (default: 0.35)
+        keyword_index: Optional KeywordIndex over the full dataset `clusters` is drawn
+            from. Lexical scores are then read from its postings instead of
+            re-tokenizing every signal per query; time-filtered copies are scored
+            from the term frequencies of their in-window signals, as without it.
+        lexical_scoring: "overlap" (keyword overlap ratio) or "bm25" (normalized BM25,
+            requires keyword_index)
+        search_index: Prebuilt ClusterSearchIndex covering `clusters` (built per call
+            if omitted). Reuse one per data version.
+        top_k: Return at most this many results. With keyword_index the final scores
+            are computed vectorized and argpartition picks the exact top_k; without
+            it, lexical scoring runs on the top_k clusters by semantic score, then only on
+            clusters whose semantic score can still reach the k-th best final score.
     
     Returns:
         List of matching clusters sorted by final_score, with metadata:
@@ -141,39 +229,81 @@ def search_clusters_hybrid(
     # Normalize query and extract keywords
     query_keywords = extract_keywords(query)
     
+    # Lexical scores from the inverted index: cost proportional to the query terms' postings
+    lexical_scores = None
+    if keyword_index is not None:
+        if lexical_scoring == "bm25":
+            lexical_scores = keyword_index.bm25_scores(query_keywords, clusters=clusters)
+        else:
+            lexical_scores = keyword_index.lexical_scores(query_keywords, clusters=clusters)
+    
     # Embed the user query
     try:
-        query_embedding = embedding_model.embed(query)
+        query_embedding = embed_query(embedding_model, query)
     except Exception as e:
         print(f"Error embedding query: {e}")
         return []
     
-    results = []
+    if search_index is None:
+        search_index = ClusterSearchIndex(clusters, embedding_model=embedding_model)
     
-    for cluster in clusters:
-        # Compute centroid if missing
-        if "centroid" not in cluster and cluster.get("signals"):
-            try:
-                signal_texts = [s.get("text", "") for s in cluster["signals"]]
-                if signal_texts:
-                    signal_embeddings = [embedding_model.embed(text) for text in signal_texts]
-                    # Compute centroid (mean of embeddings)
-                    centroid = np.mean(np.array(signal_embeddings), axis=0).tolist()
-                    cluster["centroid"] = centroid
-            except Exception as e:
-                print(f"Error computing centroid for cluster {cluster.get('cluster_id', 'unknown')}: {e}")
-                continue
-        
-        # Skip clusters without centroids
-        if "centroid" not in cluster:
-            continue
+    # Restrict to the clusters passed in (e.g., the time-filtered subset)
+    candidates = [c for c in clusters if c["cluster_id"] in search_index.positions]
+    if not candidates:
+        return []
+    rows = np.fromiter((search_index.positions[c["cluster_id"]] for c in candidates), dtype=np.int64, count=len(candidates))
+    
+    # 1. Compute semantic scores (one matrix-vector product)
+    semantic = search_index.semantic_scores(query_embedding)[rows]
+    
+    lexical_cache: Dict[int, float] = {}
+    if lexical_scores is not None:
+        # Scatter the sparse lexical scores and apply the thresholds to every cluster at once
+        local_of_row = np.full(len(search_index), -1, dtype=np.int64)
+        local_of_row[rows] = np.arange(len(candidates))
+        lexical = np.zeros(len(candidates))
+        hit_rows = [search_index.positions[cid] for cid in lexical_scores if cid in search_index.positions]
+        hit_locals = local_of_row[np.asarray(hit_rows, dtype=np.int64)]
+        hit_values = np.fromiter(
+            (lexical_scores[search_index.cluster_ids[r]] for r in hit_rows), dtype=np.float64, count=len(hit_rows)
+        )
+        lexical[hit_locals[hit_locals >= 0]] = hit_values[hit_locals >= 0]
         
-        # 1. Compute semantic score (embedding-based)
-        semantic_score = cosine_similarity(query_embedding, cluster["centroid"])
+        final = 0.7 * semantic + 0.3 * lexical
+        candidate_idx = np.flatnonzero(((semantic >= 0.30) | (lexical >= 0.10)) & (final >= min_final_score))
+        if top_k is not None and top_k < len(candidate_idx):
+            candidate_idx = candidate_idx[np.argpartition(-final[candidate_idx], top_k - 1)[:top_k]]
+    else:
+        # Lexical scores are <= 1, so final >= min_final_score needs semantic >= (min - 0.3) / 0.7
+        candidate_idx = np.flatnonzero(semantic >= (min_final_score - 0.3) / 0.7)
+        if top_k is not None and top_k < len(candidate_idx):
+            # Without an index, lexical scoring (re-tokenizing) runs on the semantic top-k first.
+            # The k-th best final score among them bounds the rest: a cluster can only
+            # overtake it if 0.7 * semantic + 0.3 (lexical = 1) reaches it - exact top-k.
+            top = candidate_idx[np.argpartition(-semantic[candidate_idx], top_k - 1)[:top_k]]
+            finals = []
+            for j in top.tolist():
+                lexical_cache[j] = compute_lexical_score(query_keywords, candidates[j].get("signals", []))
+                final = 0.7 * semantic[j] + 0.3 * lexical_cache[j]
+                if (semantic[j] >= 0.30 or lexical_cache[j] >= 0.10) and final >= min_final_score:
+                    finals.append(final)
+            if len(finals) >= top_k:
+                kth_final = np.partition(np.asarray(finals), len(finals) - top_k)[len(finals) - top_k]
+                candidate_idx = candidate_idx[0.7 * semantic[candidate_idx] + 0.3 >= kth_final]
+    
+    results = []
+    
+    for j in np.sort(candidate_idx).tolist():
+        cluster = candidates[j]
+        semantic_score = float(semantic[j])
         
         # 2. Compute lexical score (keyword-based)
-        cluster_signals = cluster.get("signals", [])
-        lexical_score = compute_lexical_score(query_keywords, cluster_signals)
+        if lexical_scores is not None:
+            lexical_score = lexical_scores.get(cluster["cluster_id"], 0.0)
+        else:
+            lexical_score = lexical_cache.get(j)
+            if lexical_score is None:
+                lexical_score = compute_lexical_score(query_keywords, cluster.get("signals", []))
         
         # 3. Compute final score (weighted combination)
         final_score = 0.7 * semantic_score + 0.3 * lexical_score
@@ -200,7 +330,7 @@ def search_clusters_hybrid(
         reverse=True
     )
     
-    return results
+    return results[:top_k] if top_k is not None else results
 
 
 # Legacy function for backward compatibility
@@ -0,0 +1,318 @@
+# src/dashboard/signal_search.py
+
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from datetime import datetime, timedelta
+import time
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from src.dashboard.search import embed_query
+from src.dashboard.time_index import TimeIndex
+
+# Probed clusters per batch between latency-budget checks and progress updates
+PROBE_BATCH_CLUSTERS = 256
+
+
+class SignalSearchIndex:
+    """
+    Inverted-file (IVF) ANN index over member signal embeddings.
+
+    The clusters themselves are the coarse lists: their (mean) member embedding
+    is the list centroid, and the members are already packed contiguously by
+    the TimeIndex. A query ranks clusters by centroid similarity, then scores
+    the members of the most promising clusters exactly, batch by batch, until
+    `n_probe` clusters are probed or the latency budget runs out.
+
+    Shares the TimeIndex embedding matrix (no second copy of the embeddings);
+    time windows reuse its per-cluster window starts.
+    """
+
+    def __init__(self, time_index: TimeIndex):
+        self.time_index = time_index
+        self.clusters = time_index.clusters
+        self.offsets = time_index.offsets
+        self._positions = {c["cluster_id"]: i for i, c in enumerate(self.clusters)}
+        self._signal_owner = None
+
+        embeddings = time_index.embeddings
+        self.searchable = time_index.has_embeddings.copy()
+        if embeddings is None or not self.searchable.any():
+            self._row_norms = None
+            self.centroids = None
+            return
+
+        norms = np.linalg.norm(embeddings, axis=1)
+        norms[norms == 0] = 1.0
+        self._row_norms = norms.astype(np.float32)
+
+        # Coarse centroids: mean of normalized member embeddings per cluster
+        normalized = embeddings / self._row_norms[:, None]
+        centroids = np.zeros((len(self.clusters), embeddings.shape[1]), dtype=np.float32)
+        non_empty = np.flatnonzero(self.searchable)
+        centroids[non_empty] = np.add.reduceat(normalized, self.offsets[non_empty], axis=0)
+        centroid_norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroid_norms[centroid_norms == 0] = 1.0
+        self.centroids = centroids / centroid_norms
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def signal_owner(self) -> Dict[str, str]:
+        """signal_id -> owning cluster_id (built lazily, for signals_hot results)."""
+        if self._signal_owner is None:
+            self._signal_owner = {
+                s.get("signal_id"): c["cluster_id"] for c in self.clusters for s in c.get("signals", [])
+            }
+        return self._signal_owner
+
+    def signal_at(self, row: int) -> Tuple[int, Dict[str, Any]]:
+        """(cluster position, signal) for a packed embedding row."""
+        i = int(np.searchsorted(self.offsets, row, side="right")) - 1
+        return i, self.time_index.signals_for(i)[row - int(self.offsets[i])]
+
+    def search(
+        self,
+        query_embedding,
+        top_k: int = 50,
+        days: Optional[int] = None,
+        cluster_ids: Optional[List[str]] = None,
+        n_probe: Optional[int] = 256,
+        budget_ms: Optional[float] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        now: Optional[datetime] = None
+    ) -> Tuple[List[Tuple[int, float]], Dict[str, Any]]:
+        """
+        Top-k most similar member signals.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of signals to return
+            days: Only signals from the last `days` days (None = all)
+            cluster_ids: Only signals of these clusters (e.g., the filtered view)
+            n_probe: Clusters (coarse lists) to scan, most similar first (None = all, exact)
+            budget_ms: Stop probing once this much time has been spent
+            progress_callback: Called with the probed fraction (0..1) after each batch
+            now: Reference time for the window (default: datetime.now())
+
+        Returns:
+            ([(embedding row, cosine score), ...] sorted by score desc, stats) where
+            stats has probed_clusters, scanned_signals, elapsed_ms and truncated.
+        """
+        started = time.perf_counter()
+        stats = {"probed_clusters": 0, "scanned_signals": 0, "elapsed_ms": 0.0, "truncated": False}
+        if self.centroids is None or top_k <= 0:
+            return [], stats
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        starts = self.time_index.window_starts(days, now) if days is not None else self.offsets[:-1]
+        ends = self.offsets[1:]
+
+        eligible = self.searchable & (ends > starts)
+        if cluster_ids is not None:
+            allowed = np.zeros(len(self.clusters), dtype=bool)
+            allowed[[self._positions[cid] for cid in cluster_ids if cid in self._positions]] = True
+            eligible &= allowed
+
+        candidates = np.flatnonzero(eligible)
+        coarse = self.centroids[candidates] @ query
+        if n_probe is not None and n_probe < len(candidates):
+            top = np.argpartition(-coarse, n_probe - 1)[:n_probe]
+            candidates, coarse = candidates[top], coarse[top]
+        probe_order = candidates[np.argsort(-coarse, kind="stable")]
+
+        embeddings = self.time_index.embeddings
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+
+        for batch_start in range(0, len(probe_order), PROBE_BATCH_CLUSTERS):
+            batch = probe_order[batch_start:batch_start + PROBE_BATCH_CLUSTERS]
+            lengths = ends[batch] - starts[batch]
+
+            # Concatenated row ranges [start, end) of the batch's in-window members
+            rows = np.repeat(starts[batch] - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            scores = (embeddings[rows] @ query) / self._row_norms[rows]
+
+            best_rows = np.concatenate([best_rows, rows])
+            best_scores = np.concatenate([best_scores, scores])
+            if len(best_scores) > top_k:
+                keep = np.argpartition(-best_scores, top_k - 1)[:top_k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+
+            stats["probed_clusters"] += len(batch)
+            stats["scanned_signals"] += int(lengths.sum())
+            if progress_callback is not None:
+                progress_callback(stats["probed_clusters"] / len(probe_order))
+
+            if budget_ms is not None and (time.perf_counter() - started) * 1000 >= budget_ms:
+                stats["truncated"] = stats["probed_clusters"] < len(probe_order)
+                break
+
+        order = np.argsort(-best_scores, kind="stable")
+        stats["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        return list(zip(best_rows[order].tolist(), best_scores[order].tolist())), stats
+
+
+def group_signal_hits(
+    hits: List[Tuple[Dict[str, Any], str, float]],
+    clusters_by_id: Dict[str, Dict[str, Any]],
+    aggregation: str = "max",
+    min_signal_score: float = 0.30
+) -> List[Dict[str, Any]]:
+    """
+    Group matching signals by owning cluster.
+
+    Args:
+        hits: (signal, cluster_id, score) tuples
+        clusters_by_id: Clusters to report (hits of other clusters are dropped)
+        aggregation: "max" (best matching signal) or "mean" (mean over matching signals)
+        min_signal_score: Ignore signals scoring below this
+
+    Returns:
+        Clusters with search metadata, sorted by final_score then signal_count:
+        - matched_signals (signal dicts with a "score", best first)
+        - max_signal_score / mean_signal_score
+        - semantic_score and final_score (the aggregated score), lexical_score (0.0)
+        - cluster_type (Active/Candidate)
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for signal, cluster_id, score in hits:
+        if score < min_signal_score or cluster_id not in clusters_by_id:
+            continue
+        grouped.setdefault(cluster_id, []).append({**signal, "score": float(score)})
+
+    results = []
+    for cluster_id, matched in grouped.items():
+        cluster = clusters_by_id[cluster_id]
+        matched.sort(key=lambda s: s["score"], reverse=True)
+        max_score = matched[0]["score"]
+        mean_score = sum(s["score"] for s in matched) / len(matched)
+        score = mean_score if aggregation == "mean" else max_score
+
+        results.append({
+            **cluster,
+            "matched_signals": matched,
+            "max_signal_score": max_score,
+            "mean_signal_score": mean_score,
+            "semantic_score": score,
+            "lexical_score": 0.0,
+            "final_score": score,
+            "cluster_type": "Active" if cluster.get("signal_count", 0) >= 3 else "Candidate"
+        })
+
+    results.sort(key=lambda x: (x["final_score"], x.get("signal_count", 0)), reverse=True)
+    return results
+
+
+def search_signals_qdrant(
+    query_embedding,
+    client: QdrantClient,
+    signal_owner: Dict[str, str],
+    top_k: int = 50,
+    days: Optional[int] = None,
+    budget_ms: Optional[float] = None,
+    collection_name: str = "signals_hot"
+) -> List[Tuple[Dict[str, Any], str, float]]:
+    """
+    Top-k signals from the signals_hot collection (Qdrant's HNSW index).
+
+    Returns (signal payload, cluster_id, score) tuples; signals that belong to
+    no known cluster are dropped.
+    """
+    query_filter = None
+    if days is not None:
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        query_filter = models.Filter(must=[
+            models.FieldCondition(key="timestamp", range=models.DatetimeRange(gte=cutoff))
+        ])
+
+    try:
+        response = client.query_points(
+            collection_name=collection_name,
+            query=np.asarray(query_embedding, dtype=np.float32).tolist(),
+            query_filter=query_filter,
+            limit=top_k,
+            with_payload=True,
+            timeout=max(1, int(np.ceil(budget_ms / 1000))) if budget_ms else None
+        )
+    except Exception as e:
+        print(f"[WARNING] Signal search on '{collection_name}' failed: {e}")
+        return []
+
+    hits = []
+    for point in response.points:
+        payload = point.payload or {}
+        cluster_id = signal_owner.get(payload.get("signal_id"))
+        if cluster_id is not None:
+            hits.append((payload, cluster_id, float(point.score)))
+    return hits
+
+
+def search_signals(
+    query: str,
+    embedding_model,
+    signal_index: SignalSearchIndex,
+    clusters: List[Dict[str, Any]],
+    top_k: int = 200,
+    days: Optional[int] = None,
+    aggregation: str = "max",
+    n_probe: Optional[int] = 256,
+    budget_ms: Optional[float] = 150.0,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    client: Optional[QdrantClient] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Signal-level search: find the top-k matching signals, grouped by cluster.
+
+    A query that matches one specific signal inside a broad cluster is not
+    diluted by the cluster centroid.
+
+    Args:
+        query: User's search query
+        embedding_model: The embedding model to encode the query
+        signal_index: SignalSearchIndex over the full dataset
+        clusters: Clusters to report (e.g., the time-filtered view)
+        top_k: Signals retrieved before grouping
+        days: Only signals from the last `days` days
+        aggregation: "max" or "mean" over each cluster's matching signals
+        n_probe: Clusters probed by the local IVF index (None = exact)
+        budget_ms: Latency budget for the local index
+        progress_callback: Called with the probed fraction (0..1)
+        client: Query signals_hot on this Qdrant client instead of the local index
+
+    Returns:
+        (grouped cluster results, stats)
+    """
+    if not query.strip():
+        return [], {}
+
+    try:
+        query_embedding = embed_query(embedding_model, query)
+    except Exception as e:
+        print(f"Error embedding query: {e}")
+        return [], {}
+
+    clusters_by_id = {c["cluster_id"]: c for c in clusters}
+
+    if client is not None:
+        started = time.perf_counter()
+        hits = search_signals_qdrant(
+            query_embedding, client, signal_index.signal_owner(),
+            top_k=top_k, days=days, budget_ms=budget_ms
+        )
+        if progress_callback is not None:
+            progress_callback(1.0)
+        stats = {"elapsed_ms": (time.perf_counter() - started) * 1000, "truncated": False}
+    else:
+        rows, stats = signal_index.search(
+            query_embedding, top_k=top_k, days=days, cluster_ids=list(clusters_by_id),
+            n_probe=n_probe, budget_ms=budget_ms, progress_callback=progress_callback
+        )
+        hits = []
+        for row, score in rows:
+            i, signal = signal_index.signal_at(row)
+            hits.append((signal, signal_index.clusters[i]["cluster_id"], score))
+
+    return group_signal_hits(hits, clusters_by_id, aggregation=aggregation), stats
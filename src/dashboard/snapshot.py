@@ -0,0 +1,148 @@
+# src/dashboard/snapshot.py
+
+from typing import List, Dict, Any, Optional
+from datetime import datetime, UTC
+import uuid
+
+from src.dashboard.feed import build_emerging_feed
+from src.memory.meta_store import save_meta, load_meta
+from src.scoring.grounding_agent import compute_cluster_grounding
+
+SNAPSHOT_KEY = "dashboard_snapshot"
+
+# Bump whenever the snapshot layout changes; older snapshots are ignored by the app
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# Number of most recent signals kept per cluster for previews
+TOP_SIGNAL_PREVIEWS = 5
+
+
+def build_dashboard_snapshot(
+    clusters: List[Dict[str, Any]],
+    titles: Dict[str, str],
+    recent_days: int = 30,
+    top_n_signals: int = TOP_SIGNAL_PREVIEWS
+) -> Dict[str, Any]:
+    """
+    Precompute everything the dashboard renders for the unfiltered cluster set.
+
+    The snapshot is a read-optimized view of the last pipeline run: feed order,
+    emergence, grounding, critic/controller badges, titles and signal previews.
+    It is only valid for the full time window - the app recomputes live when the
+    user narrows the time range.
+
+    Args:
+        clusters: All candidate clusters (active + quiet) after evaluation
+        titles: Mapping of cluster_id -> human-readable title
+        recent_days: Emergence window used for the feed (default: 30)
+        top_n_signals: Number of most recent signals to keep as previews
+
+    Returns:
+        Versioned snapshot dictionary (JSON-serialisable)
+    """
+    feed = build_emerging_feed(clusters, recent_days=recent_days)
+    feed_by_id = {item["cluster_id"]: item for item in feed}
+
+    views = {}
+    for cluster in clusters:
+        cluster_id = cluster["cluster_id"]
+        item = feed_by_id[cluster_id]
+
+        # Grounding uses the emergence growth ratio, same as the live dashboard
+        grounding = compute_cluster_grounding({**cluster, "growth_ratio": item["growth_ratio"]})
+
+        recent_signals = sorted(cluster["signals"], key=lambda s: s["timestamp"], reverse=True)
+        views[cluster_id] = {
+            "cluster_id": cluster_id,
+            "title": titles.get(cluster_id),
+            "signal_count": cluster["signal_count"],
+            "emergence_level": item["emergence_level"],
+            "growth_ratio": item["growth_ratio"],
+            "grounding": {
+                "coherence": float(grounding["coherence"]),
+                "explanation": grounding["explanation"]
+            },
+            "critic_report": cluster.get("critic_report"),
+            "controller_decision": cluster.get("controller_decision"),
+            "top_signals": [
+                {
+                    "signal_id": s["signal_id"],
+                    "text": s["text"],
+                    "timestamp": s["timestamp"]
+                }
+                for s in recent_signals[:top_n_signals]
+            ]
+        }
+
+    return {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "snapshot_id": str(uuid.uuid4()),
+        "generated_at": datetime.now(UTC).isoformat(),
+        "recent_days": recent_days,
+        "feed": [
+            {
+                "cluster_id": item["cluster_id"],
+                "signal_count": item["signal_count"],
+                "emergence_level": item["emergence_level"],
+                "growth_ratio": item["growth_ratio"],
+                "created_at": item["created_at"],
+                "representative_title": item["representative_title"]
+            }
+            for item in feed
+        ],
+        "clusters": views
+    }
+
+
+def save_dashboard_snapshot(snapshot: Dict[str, Any]) -> bool:
+    """Persist the snapshot to Qdrant Cloud (preferred) and a local JSON file."""
+    return save_meta(SNAPSHOT_KEY, snapshot)
+
+
+def load_dashboard_snapshot() -> Optional[Dict[str, Any]]:
+    """Load the latest snapshot, or None if missing or written by an older schema."""
+    snapshot = load_meta(SNAPSHOT_KEY)
+    if not snapshot or snapshot.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+        return None
+    return snapshot
+
+
+def snapshot_covers(snapshot: Optional[Dict[str, Any]], time_range_days: int, max_days: int) -> bool:
+    """
+    Check whether the snapshot can serve the current filter state.
+
+    The snapshot is computed over all history, so it only applies while the
+    time slider is at its maximum. Signal-count thresholds and display modes
+    are plain subsets of the snapshot and are always covered.
+    """
+    return snapshot is not None and time_range_days >= max_days
+
+
+def get_snapshot_view(snapshot: Optional[Dict[str, Any]], cluster: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return the precomputed view for a cluster, or None if it is missing or stale.
+
+    A view is stale when the cluster gained signals after the snapshot was written.
+    """
+    if not snapshot:
+        return None
+    view = snapshot["clusters"].get(cluster["cluster_id"])
+    if view is None or view["signal_count"] != cluster["signal_count"]:
+        return None
+    return view
+
+
+def snapshot_feed(snapshot: Optional[Dict[str, Any]], clusters: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Serve the emerging feed for `clusters` from the snapshot's precomputed order.
+
+    Returns:
+        Feed items in snapshot order, or None if any cluster is not covered
+        (the caller should then rebuild the feed live)
+    """
+    if not snapshot:
+        return None
+    if any(get_snapshot_view(snapshot, c) is None for c in clusters):
+        return None
+    wanted = {c["cluster_id"] for c in clusters}
+    return [dict(item) for item in snapshot["feed"] if item["cluster_id"] in wanted]
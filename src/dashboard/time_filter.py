@@ -1,15 +1,24 @@
 # src/dashboard/time_filter.py
 
-from typing import List, Dict, Any, Tuple
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Tuple, Optional
+from datetime import datetime
 
+from src.dashboard.time_index import TimeIndex
+from src.scoring.time_histogram import HistogramIndex
 
-def compute_time_slider_bounds(clusters: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+
+def compute_time_slider_bounds(
+    clusters: List[Dict[str, Any]],
+    histogram_index: Optional[HistogramIndex] = None
+) -> Tuple[int, int, int]:
     """
     Compute dynamic time slider bounds based on actual data.
     
     Args:
         clusters: List of cluster dictionaries with signals containing timestamps
+        histogram_index: Optional HistogramIndex over `clusters`; when given, the
+            oldest signal day comes from the global day histogram instead of
+            parsing every timestamp
     
     Returns:
         Tuple of (min_value, max_value, default_value) in days
@@ -21,6 +30,12 @@ def compute_time_slider_bounds(clusters: List[Dict[str, Any]]) -> Tuple[int, int
         # Fallback for empty dataset
         return (1, 30, 7)
     
+    if histogram_index is not None:
+        oldest_day = histogram_index.oldest_day()
+        if oldest_day is None:
+            return (1, 30, 7)
+        return _bounds_from_oldest(datetime.combine(oldest_day, datetime.min.time()))
+    
     # Extract all timestamps from all signals
     all_timestamps = []
     for cluster in clusters:
@@ -38,7 +53,11 @@ def compute_time_slider_bounds(clusters: List[Dict[str, Any]]) -> Tuple[int, int
         return (1, 30, 7)
     
     # Find oldest and newest timestamps
-    oldest_timestamp = min(all_timestamps)
+    return _bounds_from_oldest(min(all_timestamps))
+
+
+def _bounds_from_oldest(oldest_timestamp: datetime) -> Tuple[int, int, int]:
+    """Slider bounds (min, max, default) in days for the given oldest signal."""
     now = datetime.now()
     
     # Compute max_days (days between oldest signal and now)
@@ -59,7 +78,9 @@ def compute_time_slider_bounds(clusters: List[Dict[str, Any]]) -> Tuple[int, int
 
 def filter_clusters_by_time(
     clusters: List[Dict[str, Any]],
-    days: int
+    days: int,
+    time_index: Optional[TimeIndex] = None,
+    mask=None
 ) -> List[Dict[str, Any]]:
     """
     Filter clusters to show only signals from the last N days.
@@ -67,62 +88,20 @@ def filter_clusters_by_time(
     Args:
         clusters: List of cluster dictionaries
         days: Number of days to look back
+        time_index: Prebuilt TimeIndex over `clusters` (built on the fly if omitted).
+            Reusing one index makes repeated filtering a vectorized lookup.
+        mask: Optional boolean array over `clusters` (e.g., from FacetIndex.resolve)
+            restricting which clusters are returned
     
     Returns:
         List of filtered clusters with updated signal_count and growth metrics.
-        Only includes clusters with at least 2 signals in the time window.
+        Only includes clusters with at least 1 signal in the time window.
+        Signals are returned in timestamp order and embeddings as array views.
     """
     if not clusters:
         return []
     
-    now = datetime.now()
-    cutoff_time = now - timedelta(days=days)
-    
-    filtered_clusters = []
-    
-    for cluster in clusters:
-        original_signals = cluster.get("signals", [])
-        original_count = len(original_signals)
-        
-        # Filter signals by timestamp
-        recent_signals = []
-        for signal in original_signals:
-            timestamp_str = signal.get("timestamp")
-            if timestamp_str:
-                try:
-                    timestamp = datetime.fromisoformat(timestamp_str)
-                    if timestamp >= cutoff_time:
-                        recent_signals.append(signal)
-                except (ValueError, TypeError):
-                    # If timestamp is invalid, include the signal
-                    recent_signals.append(signal)
-            else:
-                # If no timestamp, include the signal
-                recent_signals.append(signal)
-        
-        filtered_signal_count = len(recent_signals)
-        
-        # Only keep clusters with at least 1 signal in the time window
-        if filtered_signal_count >= 1:
-            # Create a copy of the cluster with filtered data
-            filtered_cluster = {**cluster}
-            filtered_cluster["signals"] = recent_signals
-            filtered_cluster["signal_count"] = filtered_signal_count
-            
-            # Compute growth ratio (recent / total)
-            growth_ratio = filtered_signal_count / original_count if original_count > 0 else 0.0
-            filtered_cluster["growth_ratio"] = growth_ratio
-            
-            # Also filter embeddings if present
-            if "embeddings" in cluster and len(cluster["embeddings"]) == original_count:
-                # Map filtered signals to their original indices by signal_id
-                recent_signal_ids = {s.get("signal_id") for s in recent_signals}
-                filtered_embeddings = []
-                for i, signal in enumerate(original_signals):
-                    if signal.get("signal_id") in recent_signal_ids:
-                        filtered_embeddings.append(cluster["embeddings"][i])
-                filtered_cluster["embeddings"] = filtered_embeddings
-            
-            filtered_clusters.append(filtered_cluster)
+    if time_index is None:
+        time_index = TimeIndex(clusters)
     
-    return filtered_clusters
+    return time_index.filter(days, mask=mask)
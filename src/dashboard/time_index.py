@@ -0,0 +1,177 @@
+# src/dashboard/time_index.py
+
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
+import gc
+import numpy as np
+
+# Naive timestamps are compared against naive datetime.now(), as in the original filter
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_seconds(timestamp_str: Optional[str]) -> float:
+    """
+    Convert an ISO timestamp to seconds since the (naive) epoch.
+
+    Missing or invalid timestamps map to +inf so they are always inside the
+    time window (the filter has always kept such signals).
+    """
+    if not timestamp_str:
+        return np.inf
+    try:
+        timestamp = datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError):
+        return np.inf
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return (timestamp - _EPOCH).total_seconds()
+
+
+class TimeIndex:
+    """
+    CSR-packed timestamp index over all cluster members.
+
+    All signal timestamps live in one array, sorted within each cluster, with
+    `offsets[i]:offsets[i + 1]` delimiting cluster i. A time window then resolves
+    to one start index per cluster with a single vectorized `searchsorted` over
+    composite (cluster, time) keys - no per-signal parsing when the slider moves.
+
+    Member embeddings (when present and aligned with the signals) are packed into
+    one float32 matrix in the same order, so filtered embeddings are row-slice views.
+
+    Build once per dataset version; the index never mutates the input clusters.
+    """
+
+    def __init__(self, clusters: List[Dict[str, Any]]):
+        self.clusters = clusters
+        n_clusters = len(clusters)
+
+        lengths = np.array([len(c.get("signals", [])) for c in clusters], dtype=np.int64)
+        self.offsets = np.zeros(n_clusters + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.totals = lengths
+
+        raw = np.fromiter(
+            (_to_seconds(s.get("timestamp")) for c in clusters for s in c.get("signals", [])),
+            dtype=np.float64,
+            count=int(self.offsets[-1])
+        )
+
+        # Sort within each cluster (stable, so already-ordered clusters keep their order)
+        segment_ids = np.repeat(np.arange(n_clusters, dtype=np.int64), lengths)
+        self._order = np.lexsort((raw, segment_ids))
+        self.timestamps = raw[self._order]
+
+        # Composite keys: segment * span + clipped relative time, globally sorted
+        finite = self.timestamps[np.isfinite(self.timestamps)]
+        self._t0 = float(finite.min()) if finite.size else 0.0
+        self._span = (float(finite.max()) - self._t0 + 2.0) if finite.size else 2.0
+        relative = np.clip(self.timestamps - self._t0, 0.0, self._span - 1.0)
+        self._keys = segment_ids[self._order] * self._span + relative
+        self._segment_bases = np.arange(n_clusters, dtype=np.float64) * self._span
+
+        # Local position (within its cluster's signal list) of each sorted entry
+        self._local_order = self._order - self.offsets[segment_ids[self._order]]
+
+        self._sorted_signals = [None] * n_clusters
+        self._embeddings, self._has_embeddings = self._pack_embeddings()
+
+    def _pack_embeddings(self) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        has_embeddings = np.zeros(len(self.clusters), dtype=bool)
+        dim = None
+        for i, cluster in enumerate(self.clusters):
+            embeddings = cluster.get("embeddings")
+            if embeddings is not None and len(embeddings) == self.totals[i] and self.totals[i] > 0:
+                row_dim = len(embeddings[0])
+                if dim is None:
+                    dim = row_dim
+                has_embeddings[i] = row_dim == dim
+
+        if dim is None:
+            return None, has_embeddings
+
+        matrix = np.zeros((int(self.offsets[-1]), dim), dtype=np.float32)
+        for i in np.flatnonzero(has_embeddings):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            rows = np.asarray(self.clusters[i]["embeddings"], dtype=np.float32)
+            matrix[start:end] = rows[self._local_order[start:end]]
+        return matrix, has_embeddings
+
+    @property
+    def embeddings(self) -> Optional[np.ndarray]:
+        """Packed member embeddings (float32, CSR order), or None if no cluster has aligned embeddings."""
+        return self._embeddings
+
+    @property
+    def has_embeddings(self) -> np.ndarray:
+        """Per-cluster flag: True if the cluster's rows in `embeddings` are populated."""
+        return self._has_embeddings
+
+    def signals_for(self, i: int) -> List[Dict[str, Any]]:
+        """Signals of cluster i in timestamp order (built lazily, then reused)."""
+        if self._sorted_signals[i] is None:
+            signals = self.clusters[i].get("signals", [])
+            start, end = self.offsets[i], self.offsets[i + 1]
+            self._sorted_signals[i] = [signals[j] for j in self._local_order[start:end].tolist()]
+        return self._sorted_signals[i]
+
+    def window_starts(self, days: int, now: Optional[datetime] = None) -> np.ndarray:
+        """
+        First in-window position (global CSR index) for every cluster.
+
+        Signals at positions [start_i, offsets[i + 1]) are from the last `days` days.
+        """
+        now = now or datetime.now()
+        cutoff = ((now - timedelta(days=days)) - _EPOCH).total_seconds()
+        relative_cutoff = min(max(cutoff - self._t0, 0.0), self._span - 1.0)
+        return np.searchsorted(self._keys, self._segment_bases + relative_cutoff, side="left")
+
+    def window_counts(self, days: int, now: Optional[datetime] = None) -> np.ndarray:
+        """Number of signals per cluster inside the time window."""
+        return self.offsets[1:] - self.window_starts(days, now)
+
+    def growth_ratios(self, days: int, now: Optional[datetime] = None) -> np.ndarray:
+        """Vectorized recent / total ratio per cluster (0.0 for empty clusters)."""
+        counts = self.window_counts(days, now)
+        return np.divide(counts, self.totals, out=np.zeros(len(counts)), where=self.totals > 0)
+
+    def filter(self, days: int, now: Optional[datetime] = None, mask: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """
+        Clusters with at least one signal in the window, as shallow copies with
+        filtered signals, signal_count, growth_ratio and embeddings (array views).
+
+        `mask` (boolean, one entry per cluster) further restricts the result,
+        e.g. to the clusters selected by facet bitmaps.
+        """
+        starts = self.window_starts(days, now)
+        counts = self.offsets[1:] - starts
+        keep = counts >= 1 if mask is None else (counts >= 1) & mask
+
+        # Plain Python ints in the loop - NumPy scalar indexing dominates otherwise
+        offsets = self.offsets.tolist()
+        starts_list = starts.tolist()
+        has_embeddings = self._has_embeddings.tolist()
+
+        # Building tens of thousands of acyclic dicts triggers repeated full GC passes
+        # over the whole (large, long-lived) dataset; pause the collector meanwhile
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            filtered_clusters = []
+            for i in np.flatnonzero(keep).tolist():
+                start, end = starts_list[i], offsets[i + 1]
+                signals = self.signals_for(i)
+                local_start = start - offsets[i]
+
+                filtered_cluster = {**self.clusters[i]}
+                filtered_cluster["signals"] = signals if local_start == 0 else signals[local_start:]
+                filtered_cluster["signal_count"] = end - start
+                filtered_cluster["growth_ratio"] = (end - start) / (end - offsets[i])
+                if has_embeddings[i]:
+                    filtered_cluster["embeddings"] = self._embeddings[start:end]
+                filtered_clusters.append(filtered_cluster)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        return filtered_clusters
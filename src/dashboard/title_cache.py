@@ -0,0 +1,369 @@
+# src/dashboard/title_cache.py
+
+from typing import Any, Dict, Optional
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+# Payload-only collection (no vectors) holding cluster_id -> title
+TITLE_COLLECTION = "cluster_titles_kv"
+
+# Previous layout: same payload plus a dummy 384-dim vector per title (migrated on load)
+LEGACY_TITLE_COLLECTION = "cluster_titles"
+
+# Persistent cache file (fallback only)
+CACHE_FILE = Path("cluster_title_cache.json")
+
+# Dirty titles are written at most this often (and at exit)
+TITLE_FLUSH_INTERVAL_SECONDS = 30.0
+
+# Points per upsert request when flushing
+TITLE_FLUSH_BATCH_SIZE = 256
+
+
+def get_cache_client() -> Optional[Any]:
+    """Get Qdrant Cloud client if credentials available."""
+    if os.getenv("QDRANT_URL") and os.getenv("QDRANT_API_KEY"):
+        try:
+            # Imported here so importing the cache stays cheap
+            from qdrant_client import QdrantClient
+            return QdrantClient(
+                url=os.getenv("QDRANT_URL"),
+                api_key=os.getenv("QDRANT_API_KEY"),
+                timeout=30
+            )
+        except Exception as e:
+            print(f"[WARNING] Failed to connect to Qdrant: {e}")
+            return None
+    return None
+
+
+def _is_uuid(key: str) -> bool:
+    """Cluster ids are UUIDs (valid Qdrant point ids); signal-hash keys stay local."""
+    try:
+        uuid.UUID(key)
+        return True
+    except ValueError:
+        return False
+
+
+class TitleCache:
+    """
+    Write-behind cache for cluster titles.
+
+    Reads are served from memory. Writes only mark the title dirty; a
+    background timer flushes dirty titles in batched upserts (one request per
+    TITLE_FLUSH_BATCH_SIZE titles), and a final flush runs at interpreter
+    exit. Titles live in a payload-only Qdrant collection - no vectors - with
+    the local JSON file as fallback, rewritten once per flush rather than once
+    per title.
+
+    Each title can carry its source - the centroid and signal count it was
+    generated from (see title_drift) - so drifted clusters can be retitled
+    without regenerating every title. Fallback titles written when the LLM
+    budget or Gemini gave none are marked provisional, so they are upgraded
+    once budget is available instead of being served forever.
+
+    Nothing is loaded on construction: the first read or write loads the
+    cache (ensure_loaded), and preload() starts that load on a background
+    thread so it overlaps other startup work.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        cache_file: Path = CACHE_FILE,
+        flush_interval: float = TITLE_FLUSH_INTERVAL_SECONDS
+    ):
+        self._client = client
+        self.cache_file = cache_file
+        self.flush_interval = flush_interval
+        self._titles: Dict[str, str] = {}
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._provisional = set()
+        self._dirty = set()
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._collection_ready = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    @property
+    def client(self) -> Optional[Any]:
+        # One client per cache (not per read or write)
+        if self._client is None:
+            self._client = get_cache_client()
+        return self._client
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def ensure_loaded(self):
+        """Load the cache once; concurrent callers (e.g., a running preload) wait for it."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self.load()
+
+    def preload(self) -> Optional[threading.Thread]:
+        """Start loading on a background thread (no-op if loaded or already loading)."""
+        with self._lock:
+            if self._loaded or self._preload_thread is not None:
+                return self._preload_thread
+            self._preload_thread = threading.Thread(target=self.ensure_loaded, name="title-cache-preload", daemon=True)
+            self._preload_thread.start()
+            return self._preload_thread
+
+    def __contains__(self, key: str) -> bool:
+        self.ensure_loaded()
+        return key in self._titles
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._titles)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        self.ensure_loaded()
+        return self._titles.get(key, default)
+
+    def get_source(self, key: str) -> Optional[Dict[str, Any]]:
+        """Centroid / signal count the cached title was generated from (None if unknown)."""
+        self.ensure_loaded()
+        return self._sources.get(key)
+
+    def is_provisional(self, key: str) -> bool:
+        """Whether the cached title is a local fallback waiting for an LLM title."""
+        self.ensure_loaded()
+        return key in self._provisional
+
+    def set(self, key: str, title: str, source: Optional[Dict[str, Any]] = None, provisional: bool = False):
+        """
+        Store a title (and optionally its source) in memory; it reaches Qdrant / disk with the next flush.
+
+        Args:
+            key: Cluster id (or signal-based key)
+            title: Title to cache
+            source: title_source() the title was generated from
+            provisional: Local fallback title, to be replaced by an LLM title later
+        """
+        self.ensure_loaded()
+        with self._lock:
+            if (self._titles.get(key) == title and (source is None or self._sources.get(key) == source)
+                    and (key in self._provisional) == provisional):
+                return
+            self._titles[key] = title
+            if provisional:
+                self._provisional.add(key)
+            else:
+                self._provisional.discard(key)
+            if source is not None:
+                self._sources[key] = source
+            elif key in self._sources:
+                # A new title without a source must not inherit the old one
+                del self._sources[key]
+            self._dirty.add(key)
+            self._schedule_flush()
+
+    def update(self, titles: Dict[str, str]):
+        for key, title in titles.items():
+            self.set(key, title)
+
+    def clear(self):
+        with self._lock:
+            self._titles.clear()
+            self._sources.clear()
+            self._provisional.clear()
+            self._dirty.clear()
+
+    def _schedule_flush(self):
+        if self._timer is None and self.flush_interval is not None:
+            self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def _ensure_collection(self, client: Any) -> bool:
+        """Ensure the payload-only title collection exists."""
+        if self._collection_ready:
+            return True
+        try:
+            client.get_collection(TITLE_COLLECTION)
+        except Exception:
+            try:
+                client.create_collection(collection_name=TITLE_COLLECTION, vectors_config={})
+            except Exception as e:
+                print(f"[WARNING] Could not create title collection: {e}")
+                return False
+        self._collection_ready = True
+        return True
+
+    def _scroll_titles(self, client: Any, collection_name: str) -> Dict[str, Dict[str, Any]]:
+        """cluster_id -> {"title", "source", "provisional"} for every point in the collection."""
+        titles = {}
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                limit=256,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False
+            )
+            for point in points:
+                cluster_id = point.payload.get("cluster_id")
+                title = point.payload.get("title")
+                if cluster_id and title:
+                    titles[cluster_id] = {
+                        "title": title,
+                        "source": point.payload.get("source"),
+                        "provisional": point.payload.get("provisional", False)
+                    }
+            if not points or offset is None:
+                return titles
+
+    def load(self) -> int:
+        """
+        Load titles from Qdrant (preferred) or the local file.
+
+        Titles found only in the legacy vector collection are marked dirty, so
+        the next flush migrates them into the payload-only collection.
+
+        Returns:
+            Number of titles loaded
+        """
+        client = self.client
+        if client and self._ensure_collection(client):
+            try:
+                titles = self._scroll_titles(client, TITLE_COLLECTION)
+                legacy = {}
+                try:
+                    if client.collection_exists(LEGACY_TITLE_COLLECTION):
+                        legacy = self._scroll_titles(client, LEGACY_TITLE_COLLECTION)
+                except Exception as e:
+                    print(f"[WARNING] Could not read legacy title collection: {e}")
+
+                with self._lock:
+                    for key, entry in legacy.items():
+                        if key not in titles:
+                            self._store(key, entry)
+                            self._dirty.add(key)
+                    for key, entry in titles.items():
+                        self._store(key, entry)
+                    if self._dirty:
+                        self._schedule_flush()
+
+                migrated = len([k for k in legacy if k not in titles])
+                if migrated:
+                    print(f"[INFO] Migrating {migrated} titles from '{LEGACY_TITLE_COLLECTION}' to '{TITLE_COLLECTION}'")
+                print(f"[INFO] Loaded {len(self._titles)} titles from Qdrant Cloud cache")
+                self._loaded = True
+                return len(self._titles)
+            except Exception as e:
+                print(f"[WARNING] Could not load cache from Qdrant: {e}")
+
+        # Fallback to local file
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    titles = json.load(f)
+                with self._lock:
+                    for key, entry in titles.items():
+                        if key not in self._titles:
+                            # Older files store plain titles, newer ones {"title", "source", "provisional"}
+                            self._store(key, entry if isinstance(entry, dict) else {"title": entry})
+                print(f"[INFO] Loaded {len(titles)} titles from local cache file")
+            except Exception as e:
+                print(f"[WARNING] Could not load title cache from file: {e}")
+        self._loaded = True
+        return len(self._titles)
+
+    def _store(self, key: str, entry: Dict[str, Any]):
+        self._titles[key] = entry["title"]
+        if entry.get("source"):
+            self._sources[key] = entry["source"]
+        if entry.get("provisional"):
+            self._provisional.add(key)
+
+    def _payload(self, key: str) -> Dict[str, Any]:
+        payload = {"title": self._titles[key]}
+        if key in self._sources:
+            payload["source"] = self._sources[key]
+        if key in self._provisional:
+            payload["provisional"] = True
+        return payload
+
+    def flush(self) -> int:
+        """
+        Write all dirty titles now.
+
+        Cluster-id titles go to Qdrant in batched upserts; if Qdrant is not
+        available (or a batch fails) the local file is written instead and
+        the titles stay dirty for the next flush.
+
+        Returns:
+            Number of titles written to Qdrant
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty = {key: self._payload(key) for key in self._dirty if key in self._titles}
+            self._dirty.clear()
+        if not dirty:
+            return 0
+
+        remote = [(key, payload) for key, payload in dirty.items() if _is_uuid(key)]
+        written = set()
+        client = self.client if remote else None
+        if client and self._ensure_collection(client):
+            from qdrant_client.http.models import PointStruct
+            for start in range(0, len(remote), TITLE_FLUSH_BATCH_SIZE):
+                batch = remote[start:start + TITLE_FLUSH_BATCH_SIZE]
+                try:
+                    client.upsert(
+                        collection_name=TITLE_COLLECTION,
+                        points=[
+                            PointStruct(
+                                id=cluster_id,
+                                vector={},
+                                payload={"cluster_id": cluster_id, **payload, "updated_at": time.time()}
+                            )
+                            for cluster_id, payload in batch
+                        ]
+                    )
+                    written.update(cluster_id for cluster_id, _ in batch)
+                except Exception as e:
+                    print(f"[WARNING] Could not save {len(batch)} titles to Qdrant cache: {e}")
+
+        if len(written) < len(dirty):
+            self._save_file()
+        if client and len(written) < len(remote):
+            # Retry the titles that did not reach Qdrant on the next flush
+            with self._lock:
+                self._dirty.update(key for key, _ in remote if key not in written)
+        return len(written)
+
+    def _save_file(self):
+        """Save the whole cache to the local file (fallback only)."""
+        try:
+            with self._lock:
+                snapshot = {
+                    key: self._payload(key) if key in self._sources or key in self._provisional else title
+                    for key, title in self._titles.items()
+                }
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"[WARNING] Could not save title cache: {e}")
@@ -0,0 +1,82 @@
+# src/dashboard/title_drift.py
+
+from typing import List, Dict, Any, Optional
+import os
+import numpy as np
+
+# Regenerate a title once the cluster centroid moved this far (cosine distance)
+# from the centroid the title was generated from
+TITLE_DRIFT_THRESHOLD = float(os.getenv("TITLE_DRIFT_THRESHOLD", "0.15"))
+
+# ... or once the cluster grew by this fraction (1.0 = doubled) since then
+TITLE_GROWTH_THRESHOLD = float(os.getenv("TITLE_GROWTH_THRESHOLD", "1.0"))
+
+# Stored centroids are rounded - drift is compared against thresholds of ~0.1
+TITLE_SOURCE_DECIMALS = 4
+
+
+def _cluster_centroid(cluster: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Centroid, or mean member embedding when no centroid is stored."""
+    if cluster.get("centroid") is not None:
+        return np.asarray(cluster["centroid"], dtype=np.float32)
+    embeddings = cluster.get("embeddings")
+    if embeddings is not None and len(embeddings):
+        return np.mean(np.asarray(embeddings, dtype=np.float32), axis=0)
+    return None
+
+
+def title_source(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    What a title was generated from: the cluster centroid and signal count.
+
+    Stored next to the cached title so later runs can tell how far the
+    cluster moved since.
+    """
+    centroid = _cluster_centroid(cluster)
+    return {
+        "centroid": None if centroid is None else np.round(centroid, TITLE_SOURCE_DECIMALS).tolist(),
+        "signal_count": len(cluster["signals"])
+    }
+
+
+def centroid_drift(a: List[float], b: List[float]) -> float:
+    """Cosine distance between two centroids (0 = same direction)."""
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+    if norm == 0:
+        return 0.0
+    return 1.0 - float(np.dot(a, b)) / norm
+
+
+def title_refresh_reason(
+    source: Optional[Dict[str, Any]],
+    cluster: Dict[str, Any],
+    drift_threshold: float = TITLE_DRIFT_THRESHOLD,
+    growth_threshold: float = TITLE_GROWTH_THRESHOLD
+) -> Optional[str]:
+    """
+    Why a cached title should be regenerated, if it should.
+
+    Args:
+        source: title_source() recorded with the cached title (None if unknown)
+        cluster: Current cluster
+        drift_threshold: Cosine distance between the recorded and current centroid
+        growth_threshold: Relative growth of the signal count
+
+    Returns:
+        "drift", "growth", or None (title still describes the cluster, or no
+        recorded source to compare against)
+    """
+    if not source:
+        return None
+
+    current = title_source(cluster)
+    if source.get("centroid") is not None and current["centroid"] is not None:
+        if centroid_drift(source["centroid"], current["centroid"]) >= drift_threshold:
+            return "drift"
+
+    recorded_count = source.get("signal_count") or 0
+    if recorded_count and (current["signal_count"] - recorded_count) / recorded_count >= growth_threshold:
+        return "growth"
+    return None
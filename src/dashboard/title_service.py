@@ -0,0 +1,312 @@
+# src/dashboard/title_service.py
+
+from typing import List, Dict, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from src.dashboard.llm_budget import LLMBudget, get_llm_budget
+
+# Gemini REST endpoint (override GEMINI_API_BASE to point at a local stand-in)
+DEFAULT_API_BASE = "https://generativelanguage.googleapis.com"
+TITLE_MODEL = "gemini-2.5-flash-lite"
+
+# Clusters per prompt and concurrent requests
+TITLE_BATCH_SIZE = 8
+TITLE_MAX_WORKERS = 4
+
+# Shared request budget across all workers (requests per minute)
+TITLE_REQUESTS_PER_MINUTE = int(os.getenv("TITLE_REQUESTS_PER_MINUTE", "30"))
+
+# Retries for 429/5xx and network errors; backoff doubles from the base delay
+TITLE_MAX_RETRIES = 4
+TITLE_BACKOFF_SECONDS = 1.0
+TITLE_TIMEOUT_SECONDS = 30
+
+# Same sampling as the single-cluster prompt: 5 signals, 150 chars each
+SIGNALS_PER_CLUSTER = 5
+SIGNAL_CHARS = 150
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# Structured output: one {index, title} object per cluster in the prompt
+TITLE_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "index": {"type": "INTEGER"},
+            "title": {"type": "STRING"}
+        },
+        "required": ["index", "title"]
+    }
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all title workers.
+
+    Tokens refill at `rate` per second up to `capacity`. A 429 response pauses
+    the whole bucket (every worker holds off), not just the failing request.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return waited
+                    wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float):
+        """Hold off every caller for `seconds` (e.g., a 429 Retry-After) and drain the bucket."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After header in seconds (only the delta-seconds form is used by the API)."""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def clean_title(title: str) -> str:
+    """Strip quotes and cap the length like generate_human_cluster_title()."""
+    title = title.strip().strip('"').strip("'").strip()
+    if len(title.split()) > 12:
+        title = " ".join(title.split()[:10]) + "..."
+    return title
+
+
+def build_batch_prompt(batch: List[Tuple[str, List[str]]]) -> str:
+    """One prompt for several clusters; clusters are numbered 1..n (ids never leave the process)."""
+    sections = []
+    for index, (_, signals) in enumerate(batch, start=1):
+        sample = signals[:SIGNALS_PER_CLUSTER] or [""]
+        lines = "\n".join(f"- {s[:SIGNAL_CHARS]}" for s in sample)
+        sections.append(f"Cluster {index}:\n{lines}")
+
+    clusters_text = "\n\n".join(sections)
+    return f"""Analyze each cluster of emerging technology signals and create a single, clear title that explains what trend is emerging.
+
+{clusters_text}
+
+Requirements for every title:
+- Maximum 8-10 words
+- Non-technical language
+- Describes the trend, not just keywords
+- Understandable by non-technical users
+- Avoid jargon
+
+Return a JSON array with one object per cluster: {{"index": <cluster number>, "title": <title>}}."""
+
+
+def parse_batch_titles(text: str, batch: List[Tuple[str, List[str]]]) -> Dict[str, str]:
+    """
+    Map the model's JSON output back to cluster ids.
+
+    Unknown indexes and empty titles are ignored; clusters missing from the
+    output are simply absent from the result.
+    """
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("titles", [])
+
+    titles = {}
+    for item in data if isinstance(data, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("index"))
+        except (TypeError, ValueError):
+            continue
+        title = clean_title(str(item.get("title") or ""))
+        if 1 <= index <= len(batch) and title:
+            titles[batch[index - 1][0]] = title
+    return titles
+
+
+class TitleService:
+    """
+    Batched, concurrent, rate-limited cluster title generation.
+
+    Several clusters share one prompt (structured JSON output), batches run
+    concurrently on a thread pool, and every request first takes a token from
+    a shared bucket. 429 responses pause the bucket for Retry-After (or an
+    exponential backoff); 5xx and network errors are retried with backoff.
+    Every attempt also takes a call from the LLM budget; once the run budget
+    is spent the remaining batches are skipped (callers fall back locally).
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = TITLE_MODEL,
+        api_base: Optional[str] = None,
+        batch_size: int = TITLE_BATCH_SIZE,
+        max_workers: int = TITLE_MAX_WORKERS,
+        requests_per_minute: float = TITLE_REQUESTS_PER_MINUTE,
+        max_retries: int = TITLE_MAX_RETRIES,
+        backoff_seconds: float = TITLE_BACKOFF_SECONDS,
+        timeout: float = TITLE_TIMEOUT_SECONDS,
+        budget: Optional[LLMBudget] = None
+    ):
+        self.api_key = api_key if api_key is not None else os.getenv("GEMINI_API_KEY")
+        self.model = model
+        self.api_base = (api_base or os.getenv("GEMINI_API_BASE") or DEFAULT_API_BASE).rstrip("/")
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.bucket = TokenBucket(requests_per_minute / 60.0, capacity=max_workers)
+        self.budget = budget or get_llm_budget()
+        self.stats = {"requests": 0, "rate_limited": 0, "retries": 0, "failed_batches": 0, "over_budget": 0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _post(self, prompt: str) -> str:
+        """One generateContent call; returns the model's text output."""
+        body = json.dumps({
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "responseMimeType": "application/json",
+                "responseSchema": TITLE_RESPONSE_SCHEMA
+            }
+        }).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.api_base}/v1beta/models/{self.model}:generateContent",
+            data=body,
+            headers={"Content-Type": "application/json", "x-goog-api-key": self.api_key},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+        return payload["candidates"][0]["content"]["parts"][0]["text"]
+
+    def _budgeted_post(self, prompt: str) -> str:
+        """_post() with its latency and prompt size recorded in the LLM budget."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            text = self._post(prompt)
+            ok = True
+            return text
+        finally:
+            self.budget.record("title", time.perf_counter() - start, len(prompt), ok=ok)
+
+    def _backoff(self, attempt: int) -> float:
+        # Exponential backoff with jitter so workers don't retry in lockstep
+        return self.backoff_seconds * (2 ** attempt) * (1.0 + 0.25 * random.random())
+
+    def _request_batch(self, batch: List[Tuple[str, List[str]]]) -> Dict[str, str]:
+        prompt = build_batch_prompt(batch)
+        for attempt in range(self.max_retries + 1):
+            if not self.budget.acquire("title", wait=True):
+                self._count("over_budget")
+                return {}
+            self.bucket.acquire()
+            self._count("requests")
+            try:
+                return parse_batch_titles(self._budgeted_post(prompt), batch)
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRYABLE_STATUS or attempt == self.max_retries:
+                    raise
+                delay = _retry_after_seconds(e.headers.get("Retry-After") if e.headers else None)
+                delay = delay if delay is not None else self._backoff(attempt)
+                if e.code == 429:
+                    self._count("rate_limited")
+                    self.bucket.pause(delay)
+                else:
+                    time.sleep(delay)
+            except (urllib.error.URLError, TimeoutError, KeyError, IndexError, ValueError):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+            self._count("retries")
+        return {}
+
+    def generate_titles(self, items: List[Tuple[str, List[str]]]) -> Dict[str, str]:
+        """
+        Generate titles for many clusters.
+
+        Args:
+            items: (cluster_id, signal texts) pairs
+
+        Returns:
+            cluster_id -> title. Clusters whose batch failed (after retries),
+            did not fit the LLM budget, or that the model skipped are absent -
+            callers fall back locally.
+        """
+        if not items or not self.available:
+            return {}
+
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        titles: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            for future in [pool.submit(self._request_batch, batch) for batch in batches]:
+                try:
+                    titles.update(future.result())
+                except Exception as e:
+                    self._count("failed_batches")
+                    print(f"[WARNING] Title batch failed: {e}")
+        return titles
+
+
+_default_service: Optional[TitleService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_title_service() -> TitleService:
+    """Process-wide service, so every caller shares one rate limiter."""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = TitleService()
+        return _default_service
@@ -0,0 +1,111 @@
+# src/dashboard/title_worker.py
+
+from typing import List, Dict, Tuple, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+import time
+
+from src.dashboard.title_service import TITLE_BATCH_SIZE, TITLE_MAX_WORKERS
+
+# Clusters handed to one generate() call (the TitleService splits them into
+# TITLE_BATCH_SIZE-cluster prompts and runs those concurrently)
+TITLE_WORKER_CHUNK = TITLE_BATCH_SIZE * TITLE_MAX_WORKERS
+
+# Background jobs in flight; requests beyond that wait in the pool's queue
+TITLE_WORKER_THREADS = 2
+
+# A job stays open for this long after it is picked up, so the one-cluster
+# submissions of a page render coalesce into one job (and full prompts)
+TITLE_WORKER_COALESCE_SECONDS = 0.05
+
+
+class TitleWorker:
+    """
+    Background title generation for the dashboard.
+
+    Page renders never wait on Gemini: they show a local fallback title and
+    submit the clusters without a cached title here. Jobs run on a small
+    thread pool, in submission order (current page before prefetched pages),
+    and `generate` stores its results in the shared title cache, so they show
+    up on the next rerun. A cluster is queued at most once while pending.
+
+    Submissions are appended to the newest job that has not started yet (up
+    to chunk_size clusters), and a job waits `coalesce_seconds` before it
+    takes its clusters: a render that submits clusters one at a time still
+    sends TITLE_BATCH_SIZE clusters per prompt.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[List[Tuple[str, List[str]]]], Dict[str, str]],
+        chunk_size: int = TITLE_WORKER_CHUNK,
+        max_workers: int = TITLE_WORKER_THREADS,
+        coalesce_seconds: float = TITLE_WORKER_COALESCE_SECONDS
+    ):
+        self.generate = generate
+        self.chunk_size = chunk_size
+        self.coalesce_seconds = coalesce_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="title-worker")
+        self._pending = set()
+        # Jobs (item list, future) still accepting clusters, oldest first
+        self._open_jobs: List[Tuple[List[Tuple[str, List[str]]], Future]] = []
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "generated": 0, "failed_jobs": 0}
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def is_pending(self, cluster_id: str) -> bool:
+        with self._lock:
+            return cluster_id in self._pending
+
+    def submit(self, items: Iterable[Tuple[str, List[str]]]) -> List[Future]:
+        """
+        Queue (cluster_id, signal texts) pairs that are not already pending.
+
+        Returns:
+            The futures of the jobs the new clusters joined (empty if everything
+            was already pending)
+        """
+        futures = []
+        with self._lock:
+            for cluster_id, signals in items:
+                if cluster_id in self._pending:
+                    continue
+                self._pending.add(cluster_id)
+                self.stats["submitted"] += 1
+                if not self._open_jobs or len(self._open_jobs[-1][0]) >= self.chunk_size:
+                    # The job cannot take its items before we release the lock
+                    job: List[Tuple[str, List[str]]] = []
+                    self._open_jobs.append((job, self._pool.submit(self._run, job)))
+                job, future = self._open_jobs[-1]
+                job.append((cluster_id, signals))
+                if future not in futures:
+                    futures.append(future)
+        return futures
+
+    def _run(self, job: List[Tuple[str, List[str]]]) -> Dict[str, str]:
+        if self.coalesce_seconds:
+            time.sleep(self.coalesce_seconds)
+        with self._lock:
+            self._open_jobs = [(j, f) for j, f in self._open_jobs if j is not job]
+            items = list(job)
+
+        try:
+            titles = self.generate(items)
+            with self._lock:
+                self.stats["generated"] += len(titles)
+            return titles
+        except Exception as e:
+            with self._lock:
+                self.stats["failed_jobs"] += 1
+            print(f"[WARNING] Background title job failed: {e}")
+            return {}
+        finally:
+            with self._lock:
+                self._pending.difference_update(cluster_id for cluster_id, _ in items)
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
@@ -1,6 +1,7 @@
 # src/dashboard/utils.py
 
 from datetime import datetime
+from urllib.parse import urlparse
 
 
 def format_signal_date(timestamp: str) -> str:
@@ -20,4 +21,15 @@ def format_signal_date(timestamp: str) -> str:
         dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
         return dt.strftime("%b %d, %Y")
     except (ValueError, TypeError):
-        return "Unknown date"
\ No newline at end of file
+        return "Unknown date"
+
+def format_facet_value(value: str) -> str:
+    """
+    Format a facet value for display.
+
+    Feed URLs are shown by host (e.g., "rss.arxiv.org"); snake_case values are
+    shown as words (e.g., "keep_candidate" -> "keep candidate").
+    """
+    if value.startswith(("http://", "https://")):
+        return urlparse(value).netloc or value
+    return value.replace("_", " ")
@@ -115,8 +115,15 @@ def load_candidates_from_qdrant() -> List[Dict[str, Any]]:
                     "signal_count": len(signals),
                     "created_at": point.payload.get("created_at"),
                     "last_updated": point.payload.get("last_updated", point.payload.get("created_at")),
-                    "centroid": point.vector,  # Load centroid vector
+                    # Load centroid vector (named "dense" vector in the hybrid layout)
+                    "centroid": point.vector.get("dense") if isinstance(point.vector, dict) else point.vector,
                     "growth_ratio": point.payload.get("growth_ratio", 1.0),
+                    "day_histogram": point.payload.get("day_histogram", {}),
+                    "keyword_tf": point.payload.get("keyword_tf", {}),
+                    # Sparse kNN neighbor lists maintained at ingest time (graph edges)
+                    "signal_neighbors": point.payload.get("signal_neighbors"),
+                    "cluster_neighbors": point.payload.get("cluster_neighbors"),
+                    "neighbors_updated_at": point.payload.get("neighbors_updated_at"),
                     # Load critic and controller evaluation metadata
                     "critic_report": point.payload.get("critic_report"),
                     "controller_decision": point.payload.get("controller_decision")
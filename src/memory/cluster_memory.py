@@ -1,15 +1,29 @@
 # src/memory/cluster_memory.py
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TYPE_CHECKING
+import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams, PointStruct
+from qdrant_client.http.models import Distance, VectorParams, PointStruct, SparseVectorParams
 
-from src.embeddings.embedding_model import EmbeddingModel
+if TYPE_CHECKING:
+    # Annotation only: any model with embed() works, and sentence-transformers stays optional here
+    from src.embeddings.embedding_model import EmbeddingModel
+from src.dashboard.keyword_index import ensure_keyword_tf
+from src.dashboard.qdrant_search import DENSE_VECTOR, LEXICAL_VECTOR, lexical_sparse_vector, collection_supports_hybrid
 
 
 class ClusterMemory:
-    def __init__(self, collection_name: str, vector_size: int, use_cloud: bool = True):
+    def __init__(self, collection_name: str, vector_size: int, use_cloud: bool = True, hybrid_vectors: bool = False):
+        """
+        Args:
+            collection_name: Qdrant collection for clusters
+            vector_size: Embedding dimension
+            use_cloud: Connect to Qdrant Cloud when credentials are set
+            hybrid_vectors: Store named "dense" + sparse "lexical" vectors for
+                server-side hybrid search. Only applies when the collection is
+                created; existing collections keep their layout.
+        """
         # Use Qdrant Cloud if credentials available, otherwise fallback to in-memory
         if use_cloud and os.getenv("QDRANT_URL") and os.getenv("QDRANT_API_KEY"):
             self.client = QdrantClient(
@@ -27,29 +41,61 @@ class ClusterMemory:
         try:
             self.client.get_collection(collection_name)
             print(f"[INFO] Collection '{collection_name}' already exists")
+            self.hybrid_vectors = collection_supports_hybrid(self.client, collection_name)
+            if hybrid_vectors and not self.hybrid_vectors:
+                print(f"[WARNING] Collection '{collection_name}' uses a single unnamed vector; "
+                      "recreate it to enable server-side hybrid search")
         except Exception:
             print(f"[INFO] Creating collection '{collection_name}'")
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=vector_size,
-                    distance=Distance.COSINE
+            self.hybrid_vectors = hybrid_vectors
+            if hybrid_vectors:
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config={
+                        DENSE_VECTOR: VectorParams(size=vector_size, distance=Distance.COSINE)
+                    },
+                    sparse_vectors_config={LEXICAL_VECTOR: SparseVectorParams()}
                 )
-            )
+            else:
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=VectorParams(
+                        size=vector_size,
+                        distance=Distance.COSINE
+                    )
+                )
+
+    @staticmethod
+    def _dense_vector(proto_cluster: Dict[str, Any], embedding_model: "EmbeddingModel") -> List[float]:
+        """Centroid, else mean member embedding, else the embedding of the joined texts."""
+        if proto_cluster.get("centroid") is not None:
+            return np.asarray(proto_cluster["centroid"], dtype=np.float32).tolist()
+        embeddings = proto_cluster.get("embeddings")
+        if embeddings is not None and len(embeddings):
+            return np.mean(np.asarray(embeddings, dtype=np.float32), axis=0).tolist()
+        return embedding_model.embed(" ".join(s["text"] for s in proto_cluster["signals"]))
 
     def upsert_cluster(
         self,
         proto_cluster: Dict[str, Any],
-        embedding_model: EmbeddingModel
+        embedding_model: "EmbeddingModel"
     ):
-        texts = [s["text"] for s in proto_cluster["signals"]]
-        combined_text = " ".join(texts)
-
-        vector = embedding_model.embed(combined_text)
-
         # Use cluster UUID directly as string ID (Qdrant supports UUID strings)
         cluster_id_str = proto_cluster["cluster_id"]
 
+        if self.hybrid_vectors:
+            # Dense vector = the cluster centroid (mean member embedding), the vector the
+            # in-memory search scores, so server-side semantic scores match it
+            vector = {
+                DENSE_VECTOR: self._dense_vector(proto_cluster, embedding_model),
+                LEXICAL_VECTOR: lexical_sparse_vector(ensure_keyword_tf(proto_cluster))
+            }
+        else:
+            texts = [s["text"] for s in proto_cluster["signals"]]
+            combined_text = " ".join(texts)
+
+            vector = embedding_model.embed(combined_text)
+
         point = PointStruct(
             id=cluster_id_str,  # Use UUID directly as string ID
             vector=vector,
@@ -60,6 +106,11 @@ class ClusterMemory:
                 "last_updated": proto_cluster.get("last_updated", proto_cluster.get("created_at")),
                 "member_signal_ids": [s["signal_id"] for s in proto_cluster["signals"]],
                 "growth_ratio": proto_cluster.get("growth_ratio", 1.0),
+                "day_histogram": proto_cluster.get("day_histogram", {}),
+                "keyword_tf": proto_cluster.get("keyword_tf", {}),
+                "signal_neighbors": proto_cluster.get("signal_neighbors"),
+                "cluster_neighbors": proto_cluster.get("cluster_neighbors"),
+                "neighbors_updated_at": proto_cluster.get("neighbors_updated_at"),
                 "critic_report": proto_cluster.get("critic_report"),
                 "controller_decision": proto_cluster.get("controller_decision")
             }
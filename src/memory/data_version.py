@@ -0,0 +1,35 @@
+# src/memory/data_version.py
+
+from typing import Optional
+from datetime import datetime, UTC
+import uuid
+
+from src.memory.meta_store import save_meta, load_meta
+
+DATA_VERSION_KEY = "data_version"
+
+
+def new_data_version() -> str:
+    """Create a new, sortable data version stamp (e.g., "20260116T154255-1a2b3c4d")."""
+    return f"{datetime.now(UTC).strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def publish_data_version(version: str) -> bool:
+    """
+    Publish the data version stamp for the current ingest run.
+
+    Call this last, after clusters and the dashboard snapshot are written, so
+    readers never see a version whose data is not yet available.
+    """
+    return save_meta(DATA_VERSION_KEY, {
+        "version": version,
+        "published_at": datetime.now(UTC).isoformat()
+    })
+
+
+def get_data_version() -> Optional[str]:
+    """Return the latest published data version, or None if none was published yet."""
+    stamp = load_meta(DATA_VERSION_KEY)
+    if not stamp:
+        return None
+    return stamp.get("version")
@@ -0,0 +1,131 @@
+# src/memory/meta_store.py
+
+import json
+import os
+import time
+import uuid
+from typing import Dict, Any, Optional
+from dotenv import load_dotenv
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import PointStruct
+
+# Load environment variables
+load_dotenv()
+
+# Payload-only collection holding pipeline metadata (snapshots, version stamps, ...)
+META_COLLECTION = "pipeline_meta"
+
+# Local fallback: one JSON file per key, written next to candidate_clusters.json
+META_FILE_TEMPLATE = "{key}.json"
+
+# Stable namespace so each key maps to the same Qdrant point ID on every run
+_META_NAMESPACE = uuid.UUID("6f1c2d0e-8a4b-4c55-9d3e-2b7a1f0c9e41")
+
+
+def _get_qdrant_client():
+    """Get Qdrant Cloud client if credentials available."""
+    if os.getenv("QDRANT_URL") and os.getenv("QDRANT_API_KEY"):
+        try:
+            return QdrantClient(
+                url=os.getenv("QDRANT_URL"),
+                api_key=os.getenv("QDRANT_API_KEY"),
+                timeout=30
+            )
+        except Exception as e:
+            print(f"[WARNING] Failed to connect to Qdrant: {e}")
+            return None
+    return None
+
+
+def _ensure_meta_collection(client: QdrantClient) -> bool:
+    """Ensure the payload-only meta collection exists (no vectors stored)."""
+    try:
+        client.get_collection(META_COLLECTION)
+        return True
+    except Exception:
+        try:
+            client.create_collection(
+                collection_name=META_COLLECTION,
+                vectors_config={}
+            )
+            return True
+        except Exception as e:
+            print(f"[WARNING] Could not create meta collection: {e}")
+            return False
+
+
+def _point_id(key: str) -> str:
+    return str(uuid.uuid5(_META_NAMESPACE, key))
+
+
+def save_meta(key: str, payload: Dict[str, Any], client: Optional[QdrantClient] = None) -> bool:
+    """
+    Store a JSON-serialisable payload under `key`.
+
+    Writes to the Qdrant meta collection when credentials are available and
+    always keeps a local JSON copy as fallback.
+
+    Args:
+        key: Metadata key (e.g., "dashboard_snapshot")
+        payload: JSON-serialisable dictionary
+        client: Optional Qdrant client (defaults to Qdrant Cloud from env)
+
+    Returns:
+        True if the payload reached Qdrant, False if only the local copy was written
+    """
+    try:
+        with open(META_FILE_TEMPLATE.format(key=key), "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"[WARNING] Could not write local meta file for '{key}': {e}")
+
+    client = client or _get_qdrant_client()
+    if not client or not _ensure_meta_collection(client):
+        return False
+
+    try:
+        client.upsert(
+            collection_name=META_COLLECTION,
+            points=[PointStruct(
+                id=_point_id(key),
+                vector={},
+                payload={"key": key, "updated_at": time.time(), "value": payload}
+            )]
+        )
+        return True
+    except Exception as e:
+        print(f"[WARNING] Could not save '{key}' to Qdrant meta collection: {e}")
+        return False
+
+
+def load_meta(key: str, client: Optional[QdrantClient] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load the payload stored under `key` from Qdrant (preferred) or the local file.
+
+    Returns:
+        The stored dictionary, or None if nothing has been saved yet
+    """
+    client = client or _get_qdrant_client()
+    if client:
+        try:
+            points = client.retrieve(
+                collection_name=META_COLLECTION,
+                ids=[_point_id(key)],
+                with_payload=True,
+                with_vectors=False
+            )
+            if points:
+                return points[0].payload.get("value")
+        except Exception as e:
+            print(f"[WARNING] Could not load '{key}' from Qdrant meta collection: {e}")
+
+    path = META_FILE_TEMPLATE.format(key=key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARNING] Could not read local meta file for '{key}': {e}")
+        return None
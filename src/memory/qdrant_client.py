@@ -1,12 +1,16 @@
 # src/memory/qdrant_client.py
 
 import os
-from typing import List, Dict, Any
+import uuid
+from typing import List, Dict, Any, Optional
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams, PointStruct
+from qdrant_client.http.models import Distance, VectorParams, PointStruct, QueryRequest
 
 from src.ingestion.signal import Signal
 
+# Query vectors per query_batch_points request
+SEARCH_BATCH_SIZE = 64
+
 
 class QdrantMemory:
     def __init__(self, collection_name: str, vector_size: int, use_cloud: bool = True):
@@ -38,26 +42,12 @@ class QdrantMemory:
             )
 
     def upsert_signals(self, signals: List[Signal], embeddings: List[List[float]]):
-        # Get current max ID to avoid overwriting existing signals
-        try:
-            # Scroll to get any point to check collection size
-            scroll_result = self.client.scroll(
-                collection_name=self.collection_name,
-                limit=1,
-                with_payload=False,
-                with_vectors=False
-            )
-            # Get collection info to find next available ID
-            collection_info = self.client.get_collection(self.collection_name)
-            current_count = collection_info.points_count
-            start_id = current_count + 1
-        except Exception:
-            start_id = 1
-        
+        # Point ID derived from the signal ID: re-upserts overwrite the same point, and
+        # deletions (cold-tier eviction) can't make a counter hand out IDs still in use
         points = []
-        for i, (signal, vector) in enumerate(zip(signals, embeddings)):
+        for signal, vector in zip(signals, embeddings):
             point = PointStruct(
-                id=start_id + i,  # Auto-increment from last ID
+                id=str(uuid.uuid5(uuid.NAMESPACE_URL, signal.signal_id)),
                 vector=vector,
                 payload=signal.to_dict()
             )
@@ -67,18 +57,56 @@ class QdrantMemory:
             collection_name=self.collection_name,
             points=points
         )
-        print(f"[INFO] Upserted {len(points)} signals to Qdrant (IDs {start_id}-{start_id + len(points) - 1})")
+        print(f"[INFO] Upserted {len(points)} signals to Qdrant")
 
     def search_similar_signals(
         self,
         embedding: List[float],
-        top_k: int = 10
+        top_k: int = 10,
+        score_threshold: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         results = self.client.query_points(
             collection_name=self.collection_name,
             query=embedding,
             limit=top_k,
+            score_threshold=score_threshold,
             with_payload=True
         )
 
-        return [res.payload for res in results.points]
\ No newline at end of file
+        return [res.payload for res in results.points]
+
+    def search_similar_signals_batch(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 10,
+        score_threshold: Optional[float] = None,
+        batch_size: int = SEARCH_BATCH_SIZE
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        kNN search for many query vectors with one query_batch_points request per `batch_size` vectors.
+
+        Args:
+            embeddings: Query vectors (e.g., the embeddings computed for a new batch)
+            top_k: Neighbors per query
+            score_threshold: Minimum cosine similarity (None = no threshold)
+            batch_size: Query vectors per request
+
+        Returns:
+            Payloads of the similar signals, one list per query vector (same order)
+        """
+        results = []
+        for start in range(0, len(embeddings), batch_size):
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    QueryRequest(
+                        query=list(embedding),
+                        limit=top_k,
+                        score_threshold=score_threshold,
+                        with_payload=True
+                    )
+                    for embedding in embeddings[start:start + batch_size]
+                ]
+            )
+            results.extend([point.payload for point in response.points] for response in responses)
+        return results
\ No newline at end of file
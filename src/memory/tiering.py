@@ -0,0 +1,563 @@
+# src/memory/tiering.py
+
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from datetime import datetime, date
+from pathlib import Path
+import gzip
+import json
+import os
+import tempfile
+import threading
+import uuid
+import numpy as np
+
+from src.scoring.time_histogram import ensure_day_histogram
+
+# Cold tier: Qdrant collection holding each archived cluster's full record
+# (signals, embeddings, centroid, evaluation) as payload and its centroid as
+# vector, so archived clusters survive ephemeral runners (e.g., CI ingest runs)
+COLD_COLLECTION = "clusters_cold"
+
+# Local fallback (runs without Qdrant credentials): compressed JSON-lines archive
+# plus a small centroid index, so matching new batches never reads the archive itself
+COLD_STORE_FILE = Path("cold_clusters.jsonl.gz")
+COLD_INDEX_FILE = Path("cold_clusters_index.npz")
+
+# Archived clusters per upsert request, and batch centroids per match request
+COLD_UPSERT_BATCH_SIZE = 64
+COLD_MATCH_BATCH_SIZE = 64
+
+# Archived clusters returned per batch centroid by a Qdrant match
+TIER_REVIVE_LIMIT = 20
+
+# Clusters without a new signal for this many days leave the working set
+TIER_DORMANT_HORIZON_DAYS = int(os.getenv("TIER_DORMANT_HORIZON_DAYS", "90"))
+
+# New batch clusters this similar to an archived centroid bring it back
+# (same threshold main.py uses to merge batch clusters into candidates)
+TIER_REVIVE_THRESHOLD = 0.40
+
+# gzip level for the archive (level 9 archives ~1.6x slower for ~1% smaller files)
+COLD_COMPRESSION_LEVEL = 6
+
+
+def last_signal_day(cluster: Dict[str, Any]) -> Optional[date]:
+    """Day of the cluster's newest signal (from the day histogram), None if no signal is dated."""
+    histogram = ensure_day_histogram(cluster)
+    return date.fromisoformat(max(histogram)) if histogram else None
+
+
+def split_by_tier(
+    clusters: List[Dict[str, Any]],
+    horizon_days: int = TIER_DORMANT_HORIZON_DAYS,
+    today: Optional[date] = None,
+    keep_ids: Optional[set] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split clusters into the working set and clusters dormant beyond the horizon.
+
+    Clusters without dated signals, and clusters in `keep_ids` (e.g., those
+    that received signals this run, whatever their publication dates), stay
+    in the working set.
+
+    Returns:
+        (working, dormant)
+    """
+    cutoff = (today or datetime.utcnow().date()).toordinal() - horizon_days
+    keep_ids = keep_ids or set()
+    working, dormant = [], []
+    for cluster in clusters:
+        last_day = last_signal_day(cluster)
+        if cluster["cluster_id"] not in keep_ids and last_day is not None and last_day.toordinal() < cutoff:
+            dormant.append(cluster)
+        else:
+            working.append(cluster)
+    return working, dormant
+
+
+# Point ids of archived clusters (cluster ids are not guaranteed to be UUIDs)
+_COLD_NAMESPACE = uuid.UUID("9b1f0c0e-6a7d-4f8e-9a51-0c3d2b7e4a11")
+
+
+def _point_id(cluster_id: str) -> str:
+    return str(uuid.uuid5(_COLD_NAMESPACE, cluster_id))
+
+
+def _get_qdrant_client():
+    """Get Qdrant Cloud client if credentials available."""
+    if os.getenv("QDRANT_URL") and os.getenv("QDRANT_API_KEY"):
+        try:
+            # Imported here so the local fallback never needs qdrant-client
+            from qdrant_client import QdrantClient
+            return QdrantClient(
+                url=os.getenv("QDRANT_URL"),
+                api_key=os.getenv("QDRANT_API_KEY"),
+                timeout=30
+            )
+        except Exception as e:
+            print(f"[WARNING] Failed to connect to Qdrant: {e}")
+            return None
+    return None
+
+
+def _atomic_write(path: Path, write: Callable[[Any], None], mode: str = "wb"):
+    """Write `path` via a temporary file in the same directory and os.replace (never half-written)."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+def _cluster_vector(cluster: Dict[str, Any]) -> Optional[List[float]]:
+    """Centroid, or mean member embedding when no centroid is stored."""
+    if cluster.get("centroid") is not None:
+        return [float(x) for x in cluster["centroid"]]
+    embeddings = cluster.get("embeddings")
+    if embeddings is not None and len(embeddings):
+        return np.asarray(embeddings, dtype=np.float64).mean(axis=0).tolist()
+    return None
+
+
+def _normalized(centroids: List[Optional[List[float]]], dim: int) -> np.ndarray:
+    """Row-normalized centroid matrix (missing centroids become zero rows that never match)."""
+    matrix = np.zeros((len(centroids), dim), dtype=np.float32)
+    for i, centroid in enumerate(centroids):
+        if centroid is not None and len(centroid) == dim:
+            matrix[i] = centroid
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class ColdStore:
+    """
+    Cold tier for clusters evicted from the working set.
+
+    With Qdrant credentials (or an explicit client), archived clusters live in
+    the clusters_cold collection: one point per cluster with its centroid as
+    vector and the full record as payload, so match() is a batched vector
+    search and nothing is kept on the (possibly ephemeral) local disk.
+    Without Qdrant, archive() appends records to a gzip JSON-lines file (no
+    rewrite) and adds their centroids to a local index. Nothing is read on
+    construction: the index is loaded for match(), the archive itself only
+    for restore() and on-demand search().
+
+    Restoring is two-phase so a crash never loses a cluster: restore()
+    returns the records and leaves them archived until commit_restore(),
+    which the caller runs once the working set holding them is saved.
+    Local files are only ever replaced atomically.
+    """
+
+    def __init__(
+        self,
+        path: Path = COLD_STORE_FILE,
+        index_path: Path = COLD_INDEX_FILE,
+        client: Optional[Any] = None,
+        collection_name: str = COLD_COLLECTION,
+        use_qdrant: bool = True
+    ):
+        self.path = Path(path)
+        self.index_path = Path(index_path)
+        self.collection_name = collection_name
+        self._client = client
+        self._client_resolved = client is not None or not use_qdrant
+        self._collection_dim: Optional[int] = None
+        self._ids: Optional[List[str]] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._clusters: Optional[List[Dict[str, Any]]] = None
+        self._search_indexes: Optional[Tuple[Any, Any]] = None
+        self._pending_restore = set()
+        self._lock = threading.RLock()
+
+    @property
+    def client(self) -> Optional[Any]:
+        # Resolved once per store; None means the local fallback
+        if not self._client_resolved:
+            self._client = _get_qdrant_client()
+            self._client_resolved = True
+        return self._client
+
+    def _collection_exists(self) -> bool:
+        try:
+            return self.client.collection_exists(self.collection_name)
+        except Exception as e:
+            print(f"[WARNING] Could not inspect collection '{self.collection_name}': {e}")
+            return False
+
+    def _ensure_collection(self, dim: int) -> Optional[int]:
+        """Vector size of the cold collection, creating it for `dim` if needed (None on failure)."""
+        if self._collection_dim is not None:
+            return self._collection_dim
+        from qdrant_client.http import models
+        try:
+            if self.client.collection_exists(self.collection_name):
+                vectors = self.client.get_collection(self.collection_name).config.params.vectors
+                self._collection_dim = vectors.size
+            else:
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=models.VectorParams(size=dim, distance=models.Distance.COSINE)
+                )
+                self._collection_dim = dim
+                print(f"[INFO] Created cold tier collection '{self.collection_name}'")
+        except Exception as e:
+            print(f"[WARNING] Could not prepare collection '{self.collection_name}': {e}")
+        return self._collection_dim
+
+    def _load_index(self):
+        if self._ids is not None:
+            return
+        self._ids, self._centroids = [], np.zeros((0, 0), dtype=np.float32)
+        if self.index_path.exists():
+            try:
+                with np.load(self.index_path, allow_pickle=False) as data:
+                    self._ids = data["ids"].tolist()
+                    self._centroids = data["centroids"]
+            except Exception as e:
+                print(f"[WARNING] Could not load cold store index: {e}")
+
+    def _save_index(self):
+        try:
+            _atomic_write(
+                self.index_path,
+                lambda f: np.savez(f, ids=np.array(self._ids, dtype=str), centroids=self._centroids)
+            )
+        except Exception as e:
+            print(f"[WARNING] Could not save cold store index: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self.client is not None:
+                if not self._collection_exists():
+                    return 0
+                try:
+                    return self.client.count(self.collection_name, exact=True).count
+                except Exception as e:
+                    print(f"[WARNING] Could not count cold tier: {e}")
+                    return 0
+            self._load_index()
+            return len(self._ids)
+
+    def __contains__(self, cluster_id: str) -> bool:
+        with self._lock:
+            if self.client is not None:
+                if not self._collection_exists():
+                    return False
+                try:
+                    return bool(self.client.retrieve(self.collection_name, ids=[_point_id(cluster_id)]))
+                except Exception as e:
+                    print(f"[WARNING] Could not look up cold tier: {e}")
+                    return False
+            self._load_index()
+            return cluster_id in self._ids
+
+    def archive(self, clusters: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store clusters in the cold tier (re-archived clusters replace their record).
+
+        Returns:
+            Ids of the clusters stored; the others (e.g., a failed Qdrant request,
+            or no vector in Qdrant mode) should stay in the working set
+        """
+        if not clusters:
+            return []
+        with self._lock:
+            archived = self._archive_qdrant(clusters) if self.client is not None else self._archive_local(clusters)
+            # A cluster restored earlier in this run and archived again stays archived
+            self._pending_restore.difference_update(archived)
+            self._clusters = None
+            self._search_indexes = None
+        return archived
+
+    def _archive_qdrant(self, clusters: List[Dict[str, Any]]) -> List[str]:
+        from qdrant_client.http import models
+
+        vectors = [_cluster_vector(c) for c in clusters]
+        if all(vector is None for vector in vectors):
+            return []
+        dim = self._ensure_collection(next(len(v) for v in vectors if v is not None))
+        if not dim:
+            return []
+        archived_at = datetime.utcnow().isoformat()
+        points = [
+            models.PointStruct(
+                id=_point_id(cluster["cluster_id"]),
+                vector=vector,
+                payload={"cluster_id": cluster["cluster_id"], "archived_at": archived_at, "cluster": cluster}
+            )
+            for cluster, vector in zip(clusters, vectors)
+            if vector is not None and len(vector) == dim
+        ]
+
+        archived = []
+        for i in range(0, len(points), COLD_UPSERT_BATCH_SIZE):
+            batch = points[i:i + COLD_UPSERT_BATCH_SIZE]
+            try:
+                self.client.upsert(collection_name=self.collection_name, points=batch, wait=True)
+                archived.extend(point.payload["cluster_id"] for point in batch)
+            except Exception as e:
+                print(f"[WARNING] Could not archive {len(batch)} clusters to '{self.collection_name}': {e}")
+        return archived
+
+    def _archive_local(self, clusters: List[Dict[str, Any]]) -> List[str]:
+        self._load_index()
+        try:
+            with gzip.open(self.path, "at", compresslevel=COLD_COMPRESSION_LEVEL, encoding="utf-8") as f:
+                for cluster in clusters:
+                    f.write(json.dumps(cluster, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"[WARNING] Could not write cold store: {e}")
+            return []
+
+        # Re-archived clusters replace their index row (the archive keeps the latest record)
+        archived = {c["cluster_id"] for c in clusters}
+        keep = [i for i, cluster_id in enumerate(self._ids) if cluster_id not in archived]
+        index_dim = self._centroids.shape[1] if self._ids else 0
+        dim = index_dim or next((len(c["centroid"]) for c in clusters if c.get("centroid") is not None), 0)
+        kept = self._centroids[keep] if index_dim else np.zeros((0, dim), dtype=np.float32)
+        self._ids = [self._ids[i] for i in keep] + [c["cluster_id"] for c in clusters]
+        self._centroids = np.vstack([kept, _normalized([c.get("centroid") for c in clusters], dim)])
+        self._save_index()
+        return [c["cluster_id"] for c in clusters]
+
+    def _read_archive(self) -> Dict[str, Dict[str, Any]]:
+        """cluster_id -> latest archived record, for clusters still in the index."""
+        self._load_index()
+        indexed = set(self._ids)
+        records = {}
+        if not self.path.exists():
+            return records
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    cluster = json.loads(line)
+                    if cluster["cluster_id"] in indexed:
+                        records[cluster["cluster_id"]] = cluster
+        except Exception as e:
+            print(f"[WARNING] Could not read cold store: {e}")
+        return records
+
+    def _scroll_qdrant(self) -> List[Dict[str, Any]]:
+        if not self._collection_exists():
+            return []
+        clusters, offset = [], None
+        try:
+            while True:
+                points, offset = self.client.scroll(
+                    collection_name=self.collection_name,
+                    limit=COLD_UPSERT_BATCH_SIZE,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                clusters.extend(point.payload["cluster"] for point in points)
+                if offset is None:
+                    return clusters
+        except Exception as e:
+            print(f"[WARNING] Could not read cold tier from '{self.collection_name}': {e}")
+            return clusters
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Every archived cluster (read once, then kept until the archive changes)."""
+        with self._lock:
+            if self._clusters is None:
+                if self.client is not None:
+                    self._clusters = self._scroll_qdrant()
+                else:
+                    self._clusters = list(self._read_archive().values())
+            return self._clusters
+
+    def match(self, centroids: List[List[float]], threshold: float = TIER_REVIVE_THRESHOLD) -> List[str]:
+        """
+        Archived clusters whose centroid is at least `threshold` similar to any of `centroids`.
+
+        Returns:
+            Matching cluster ids (centroids only - archived records are not read)
+        """
+        if not len(centroids):
+            return []
+        with self._lock:
+            if self.client is not None:
+                return self._match_qdrant(centroids, threshold)
+            self._load_index()
+            if not self._ids:
+                return []
+            queries = _normalized(list(centroids), self._centroids.shape[1])
+            best = (queries @ self._centroids.T).max(axis=0)
+            return [self._ids[i] for i in np.flatnonzero(best >= threshold)]
+
+    def _match_qdrant(self, centroids: List[List[float]], threshold: float) -> List[str]:
+        from qdrant_client.http import models
+
+        if not self._collection_exists() or not self._ensure_collection(0):
+            return []
+        queries = [
+            [float(x) for x in centroid] for centroid in centroids
+            if centroid is not None and len(centroid) == self._collection_dim
+        ]
+        matched = {}
+        for i in range(0, len(queries), COLD_MATCH_BATCH_SIZE):
+            requests = [
+                models.QueryRequest(
+                    query=query,
+                    limit=TIER_REVIVE_LIMIT,
+                    score_threshold=threshold,
+                    with_payload=["cluster_id"]
+                )
+                for query in queries[i:i + COLD_MATCH_BATCH_SIZE]
+            ]
+            try:
+                responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+            except Exception as e:
+                print(f"[WARNING] Cold tier match failed: {e}")
+                continue
+            for response in responses:
+                for point in response.points:
+                    matched.setdefault(point.payload["cluster_id"], None)
+        return list(matched)
+
+    def restore(self, cluster_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read clusters to bring back into the working set (e.g., dormant topics
+        that became active again).
+
+        They stay archived until commit_restore(), so call that once the
+        working set holding them has been saved.
+
+        Returns:
+            The restored cluster records
+        """
+        if not cluster_ids:
+            return []
+        with self._lock:
+            if self.client is not None:
+                restored = self._retrieve_qdrant(cluster_ids)
+            else:
+                records = self._read_archive()
+                restored = [records[cluster_id] for cluster_id in cluster_ids if cluster_id in records]
+            self._pending_restore.update(c["cluster_id"] for c in restored)
+        return restored
+
+    def _retrieve_qdrant(self, cluster_ids: List[str]) -> List[Dict[str, Any]]:
+        try:
+            points = self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=[_point_id(cluster_id) for cluster_id in cluster_ids],
+                with_payload=True
+            )
+        except Exception as e:
+            print(f"[WARNING] Could not restore {len(cluster_ids)} clusters from '{self.collection_name}': {e}")
+            return []
+        by_id = {point.payload["cluster_id"]: point.payload["cluster"] for point in points}
+        return [by_id[cluster_id] for cluster_id in cluster_ids if cluster_id in by_id]
+
+    def commit_restore(self) -> int:
+        """
+        Drop the clusters returned by restore() from the cold tier.
+
+        Returns:
+            Number of clusters removed (0 if the removal failed - they are
+            removed on a later commit or replaced when archived again)
+        """
+        with self._lock:
+            wanted = set(self._pending_restore)
+            if not wanted:
+                return 0
+            try:
+                if self.client is not None:
+                    from qdrant_client.http import models
+                    self.client.delete(
+                        collection_name=self.collection_name,
+                        points_selector=models.PointIdsList(points=[_point_id(cluster_id) for cluster_id in wanted]),
+                        wait=True
+                    )
+                else:
+                    records = self._read_archive()
+
+                    def write(f):
+                        with gzip.open(f, "wt", compresslevel=COLD_COMPRESSION_LEVEL, encoding="utf-8") as archive:
+                            for cluster_id, cluster in records.items():
+                                if cluster_id not in wanted:
+                                    archive.write(json.dumps(cluster, ensure_ascii=False) + "\n")
+
+                    # Index first: a crash in between leaves records the index no longer lists (ignored)
+                    keep = [i for i, cluster_id in enumerate(self._ids) if cluster_id not in wanted]
+                    self._ids = [self._ids[i] for i in keep]
+                    self._centroids = self._centroids[keep]
+                    self._save_index()
+                    _atomic_write(self.path, write)
+            except Exception as e:
+                print(f"[WARNING] Could not remove {len(wanted)} restored clusters from the cold tier: {e}")
+                return 0
+            self._pending_restore.clear()
+            self._clusters = None
+            self._search_indexes = None
+        return len(wanted)
+
+    def search(self, query: str, embedding_model, top_k: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Hybrid search over the archived clusters (same scoring as the working set).
+
+        The archive and its search indexes are built on the first search and
+        reused until the archive changes.
+
+        Returns:
+            Matching archived clusters sorted by final_score, marked "tier": "cold"
+        """
+        from src.dashboard.keyword_index import KeywordIndex
+        from src.dashboard.search import ClusterSearchIndex, search_clusters_hybrid
+
+        clusters = self.load_all()
+        if not clusters:
+            return []
+        with self._lock:
+            if self._search_indexes is None:
+                self._search_indexes = (KeywordIndex.from_clusters(clusters), ClusterSearchIndex(clusters))
+            keyword_index, search_index = self._search_indexes
+
+        results = search_clusters_hybrid(
+            query=query,
+            clusters=clusters,
+            embedding_model=embedding_model,
+            keyword_index=keyword_index,
+            search_index=search_index,
+            top_k=top_k,
+            **kwargs
+        )
+        return [dict(result, tier="cold") for result in results]
+
+
+def evict_from_qdrant(
+    clusters: List[Dict[str, Any]],
+    cluster_client: Optional[Any] = None,
+    signal_client: Optional[Any] = None,
+    cluster_collection: str = "clusters_warm",
+    signal_collection: str = "signals_hot"
+):
+    """Delete archived clusters and their member signals from the working-set collections."""
+    from qdrant_client.http import models
+
+    cluster_ids = [c["cluster_id"] for c in clusters]
+    signal_ids = [s["signal_id"] for c in clusters for s in c.get("signals", [])]
+    deletes = [
+        (cluster_client, cluster_collection, "cluster_id", cluster_ids),
+        (signal_client, signal_collection, "signal_id", signal_ids)
+    ]
+    for client, collection_name, key, values in deletes:
+        if client is None or not values:
+            continue
+        try:
+            client.delete(
+                collection_name=collection_name,
+                points_selector=models.FilterSelector(filter=models.Filter(must=[
+                    models.FieldCondition(key=key, match=models.MatchAny(any=values))
+                ]))
+            )
+        except Exception as e:
+            print(f"[WARNING] Could not evict {len(values)} points from '{collection_name}': {e}")
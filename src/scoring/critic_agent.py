@@ -11,6 +11,7 @@ def evaluate_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
     - Signal count (evidence breadth)
     - Source diversity (cross-validation)
     - Semantic coherence (cluster tightness)
+    - Historical persistence (signals with similar past signals at ingest)
     
     Args:
         cluster: Cluster dict with signals, embeddings, signal_count
@@ -30,11 +31,16 @@ def evaluate_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
     coherence = cluster.get("coherence", 0.0)
     
     # If coherence not pre-computed, estimate from embeddings
-    if coherence == 0.0 and cluster.get("embeddings"):
+    embeddings = cluster.get("embeddings")
+    if coherence == 0.0 and embeddings is not None and len(embeddings) > 0:
         from src.scoring.grounding_agent import compute_cluster_grounding
         grounding = compute_cluster_grounding(cluster)
         coherence = grounding.get("coherence", 0.0)
     
+    # Historical persistence, recorded per signal by the ingest contextualization step
+    checked = [s for s in signals if "is_persistent" in s]
+    persistent_signals = sum(1 for s in checked if s["is_persistent"])
+    
     # Evaluation flags
     flags = []
     
@@ -58,6 +64,13 @@ def evaluate_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
     elif signal_count >= 10:
         flags.append("strong evidence")
     
+    # Persistence flags (only for clusters whose signals were checked)
+    if checked:
+        if persistent_signals == 0:
+            flags.append("no historical precedent")
+        elif persistent_signals * 2 >= len(checked):
+            flags.append("historically persistent")
+    
     # Confidence classification
     confidence = _classify_confidence(signal_count, coherence, unique_sources)
     
@@ -71,7 +84,9 @@ def evaluate_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
         "metrics": {
             "signal_count": signal_count,
             "source_diversity": unique_sources,
-            "coherence": coherence
+            "coherence": coherence,
+            "persistent_signals": persistent_signals,
+            "persistence_checked": len(checked)
         }
     }
 
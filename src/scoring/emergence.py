@@ -3,21 +3,29 @@
 from typing import Dict, Any
 from datetime import datetime, timedelta
 
+from src.scoring.time_histogram import histogram_covers, recent_count_from_histogram
+
 
 def compute_emergence(
     proto_cluster: Dict[str, Any],
     recent_days: int = 30
 ) -> Dict[str, Any]:
     now = datetime.utcnow()
-    cutoff = now - timedelta(days=recent_days)
 
-    timestamps = [
-        datetime.fromisoformat(signal["timestamp"])
-        for signal in proto_cluster["signals"]
-    ]
+    if histogram_covers(proto_cluster):
+        # O(buckets) from the persisted day histogram (day granularity)
+        recent_count = recent_count_from_histogram(proto_cluster["day_histogram"], recent_days, today=now.date())
+        total_count = len(proto_cluster["signals"])
+    else:
+        cutoff = now - timedelta(days=recent_days)
+
+        timestamps = [
+            datetime.fromisoformat(signal["timestamp"])
+            for signal in proto_cluster["signals"]
+        ]
 
-    recent_count = sum(1 for ts in timestamps if ts >= cutoff)
-    total_count = len(timestamps)
+        recent_count = sum(1 for ts in timestamps if ts >= cutoff)
+        total_count = len(timestamps)
 
     growth_ratio = recent_count / total_count if total_count > 0 else 0.0
 
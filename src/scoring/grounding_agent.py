@@ -46,23 +46,25 @@ def compute_cluster_grounding(cluster: Dict[str, Any], recent_days: int = 30) ->
     source_diversity = len(unique_sources)
     
     # 4. Semantic Coherence - average cosine similarity to centroid
-    embeddings = cluster.get("embeddings", [])
+    # Embeddings may be lists or NumPy arrays (time-filtered views)
+    embeddings = cluster.get("embeddings")
+    if embeddings is None:
+        embeddings = []
     centroid = cluster.get("centroid")
     
     # Compute centroid if missing but embeddings are available
-    if not centroid and embeddings:
-        centroid = np.mean(np.array(embeddings), axis=0).tolist()
+    if (centroid is None or len(centroid) == 0) and len(embeddings) > 0:
+        centroid = np.mean(np.asarray(embeddings, dtype=float), axis=0)
     
     coherence = 0.0
-    if centroid and embeddings and len(embeddings) > 0:
+    if centroid is not None and len(centroid) > 0 and len(embeddings) > 0:
         try:
-            similarities = []
-            for embedding in embeddings:
-                sim = cosine_similarity(embedding, centroid)
-                similarities.append(sim)
+            matrix = np.asarray(embeddings, dtype=float)
+            center = np.asarray(centroid, dtype=float)
+            similarities = (matrix @ center) / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(center))
             
             # Average similarity to centroid
-            coherence = round(np.mean(similarities), 2) if similarities else 0.0
+            coherence = round(float(np.mean(similarities)), 2)
         except Exception as e:
             # If coherence computation fails, log and default to 0.0
             print(f"[WARNING] Coherence computation failed for cluster {cluster.get('cluster_id', 'unknown')}: {e}")
@@ -0,0 +1,135 @@
+# src/scoring/time_histogram.py
+
+from typing import List, Dict, Any, Optional
+from datetime import datetime, date
+import numpy as np
+
+
+def day_bucket(timestamp_str: Optional[str]) -> Optional[str]:
+    """Map an ISO timestamp to its day bucket ("YYYY-MM-DD"), or None if invalid."""
+    if not timestamp_str:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp_str).date().isoformat()
+    except (ValueError, TypeError):
+        return None
+
+
+def build_day_histogram(signals: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Count signals per day bucket. Signals without a valid timestamp are skipped."""
+    return add_signals_to_histogram({}, signals)
+
+
+def add_signals_to_histogram(histogram: Dict[str, int], signals: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Incrementally add signals to a day histogram (mutates and returns it)."""
+    for signal in signals:
+        bucket = day_bucket(signal.get("timestamp"))
+        if bucket:
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+    return histogram
+
+
+def ensure_day_histogram(cluster: Dict[str, Any]) -> Dict[str, int]:
+    """Backfill the day histogram for clusters stored before histograms existed."""
+    if not cluster.get("day_histogram"):
+        cluster["day_histogram"] = build_day_histogram(cluster.get("signals", []))
+    return cluster["day_histogram"]
+
+
+def histogram_covers(cluster: Dict[str, Any]) -> bool:
+    """True if the cluster's histogram accounts for every one of its signals."""
+    histogram = cluster.get("day_histogram")
+    return bool(histogram) and sum(histogram.values()) == len(cluster.get("signals", []))
+
+
+def recent_count_from_histogram(histogram: Dict[str, int], recent_days: int, today: Optional[date] = None) -> int:
+    """Signals in buckets no older than `recent_days` days - O(buckets), no timestamp parsing."""
+    today = today or datetime.utcnow().date()
+    cutoff = today.toordinal() - recent_days
+    return sum(count for day, count in histogram.items() if date.fromisoformat(day).toordinal() >= cutoff)
+
+
+class HistogramIndex:
+    """
+    Per-cluster and global day-bucketed signal counts for the whole dataset.
+
+    Each cluster's buckets are stored CSR-style (sorted day ordinals with suffix
+    sums), so recent counts for any window are one vectorized searchsorted over
+    the buckets - independent of the number of signals. Windows are resolved at
+    day granularity (the whole cutoff day counts as recent).
+
+    `covered` flags clusters whose stored histogram accounts for every signal
+    (histogram_covers); only their per-cluster counts match compute_emergence().
+    Histograms missing from the input are built from the signals unless
+    `build_missing` is False, in which case those clusters get no buckets.
+    """
+
+    def __init__(self, clusters: List[Dict[str, Any]], build_missing: bool = True):
+        stored = np.array([bool(c.get("day_histogram")) for c in clusters], dtype=bool)
+        n_signals = np.array([len(c.get("signals", [])) for c in clusters], dtype=np.int64)
+
+        # Flat (cluster, day, count) entries; day strings repeat across clusters, so each is parsed once
+        ordinals: Dict[str, int] = {}
+        segments, days, counts = [], [], []
+        for i, cluster in enumerate(clusters):
+            histogram = cluster.get("day_histogram")
+            if not histogram:
+                histogram = build_day_histogram(cluster.get("signals", [])) if build_missing else {}
+            for day, count in histogram.items():
+                ordinal = ordinals.get(day)
+                if ordinal is None:
+                    ordinal = ordinals[day] = date.fromisoformat(day).toordinal()
+                segments.append(i)
+                days.append(ordinal)
+                counts.append(count)
+
+        segment_ids = np.array(segments, dtype=np.int64)
+        days = np.array(days, dtype=np.int64)
+        counts = np.array(counts, dtype=np.int64)
+        order = np.lexsort((days, segment_ids))
+        segment_ids, days, counts = segment_ids[order], days[order], counts[order]
+
+        self.offsets = np.zeros(len(clusters) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(segment_ids, minlength=len(clusters)), out=self.offsets[1:])
+
+        # Reverse cumulative sums: _tail[k] = signals at buckets k.. (across all clusters);
+        # signals of cluster i on or after bucket k = _tail[k] - _tail[offsets[i + 1]]
+        self._tail = np.append(np.cumsum(counts[::-1])[::-1], 0)
+        self.totals = self._tail[self.offsets[:-1]] - self._tail[self.offsets[1:]]
+
+        # Same test as histogram_covers(): a stored histogram accounting for every signal
+        self.covered = stored & (self.totals == n_signals)
+
+        # Composite keys (cluster, day) are globally sorted for one searchsorted per query
+        self._min_day = int(days.min()) if days.size else 0
+        self._span = (int(days.max()) - self._min_day + 2) if days.size else 2
+        self._keys = segment_ids * self._span + (days - self._min_day)
+        self._segment_bases = np.arange(len(clusters), dtype=np.int64) * self._span
+
+        # Global histogram (all clusters combined)
+        self.global_days, inverse = np.unique(days, return_inverse=True)
+        self.global_counts = np.bincount(inverse, weights=counts).astype(np.int64) if days.size else counts
+
+    def recent_counts(self, recent_days: int, today: Optional[date] = None) -> np.ndarray:
+        """Signals per cluster in the last `recent_days` days (day granularity)."""
+        today = today or datetime.utcnow().date()
+        cutoff = today.toordinal() - recent_days
+        relative = min(max(cutoff - self._min_day, 0), self._span - 1)
+        positions = np.searchsorted(self._keys, self._segment_bases + relative, side="left")
+        return self._tail[positions] - self._tail[self.offsets[1:]]
+
+    def growth_ratios(self, recent_days: int, today: Optional[date] = None) -> np.ndarray:
+        """Vectorized recent / total ratio per cluster (0.0 for empty clusters)."""
+        recent = self.recent_counts(recent_days, today)
+        return np.divide(recent, self.totals, out=np.zeros(len(recent)), where=self.totals > 0)
+
+    def emergence_levels(self, recent_days: int, today: Optional[date] = None) -> np.ndarray:
+        """Emergence level per cluster, using the same thresholds as compute_emergence()."""
+        ratios = self.growth_ratios(recent_days, today)
+        return np.select([ratios >= 0.6, ratios >= 0.3], ["rapid", "stable"], default="dormant")
+
+    def oldest_day(self) -> Optional[date]:
+        """Day of the oldest signal in the dataset, from the global histogram."""
+        if not self.global_days.size:
+            return None
+        return date.fromordinal(int(self.global_days[0]))
@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from qdrant_client import QdrantClient
+
+import src.dashboard.gemini_explainer as gemini_explainer
+from src.dashboard.title_cache import TitleCache
+from tests.llm_stub import LLMStub
+
+
+@pytest.fixture
+def title_cache(tmp_path, monkeypatch):
+    """In-memory (Qdrant ":memory:") title cache installed as the explainer's cache, with a dummy Gemini key."""
+    cache = TitleCache(client=QdrantClient(":memory:"), cache_file=tmp_path / "titles.json", flush_interval=None)
+    monkeypatch.setattr(gemini_explainer, "_title_cache", cache)
+    monkeypatch.setattr(gemini_explainer, "GEMINI_API_KEY", "test")
+    return cache
+
+
+@pytest.fixture
+def llm_stub():
+    """Running LLMStub (local Gemini endpoint)."""
+    with LLMStub() as stub:
+        yield stub
+
+
+@pytest.fixture
+def make_cluster():
+    """
+    Factory for minimal clusters: make_cluster(name, n, centroid=[1.0, 0.0], age_days=None).
+
+    The cluster id is a uuid5 of the name (stable across calls); signals get
+    timestamps `age_days` ago when given.
+    """
+    def make(name, n, centroid=(1.0, 0.0), age_days=None):
+        signal = {}
+        if age_days is not None:
+            signal["timestamp"] = (datetime.utcnow() - timedelta(days=age_days)).isoformat()
+        return {
+            "cluster_id": str(uuid.uuid5(uuid.NAMESPACE_DNS, name)),
+            "centroid": list(centroid),
+            "signals": [{"text": f"{name} signal {i}", **signal} for i in range(n)]
+        }
+    return make
@@ -0,0 +1,22 @@
+"""Deterministic stand-in for the sentence-transformers embedding model, so search and tiering tests run offline."""
+
+import numpy as np
+
+DIM = 8
+
+TOPICS = {
+    "chips": 0,
+    "power": 1,
+    "quantum": 2,
+}
+
+
+class TopicEmbeddingModel:
+    """Embeds text onto one axis per known topic word (deterministic, no model download)."""
+
+    def embed(self, text):
+        vector = np.full(DIM, 0.05, dtype=np.float32)
+        for word, axis in TOPICS.items():
+            if word in text.lower():
+                vector[axis] += 1.0
+        return vector
@@ -0,0 +1,111 @@
+"""Local stand-in for the Gemini generateContent REST endpoint, so title tests and benchmarks run offline."""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CLUSTER_HEADER = re.compile(r"^Cluster (\d+):\n- (.*)$", re.MULTILINE)
+
+
+class LLMStub:
+    """
+    Serves POST /v1beta/models/<model>:generateContent on localhost.
+
+    Batch prompts get a JSON array with one {index, title} per "Cluster n:"
+    section (title = "Title: " + the cluster's first signal); other prompts
+    get a plain-text title. Optional latency, leading 429 responses with a
+    Retry-After header, and skipped indexes simulate the real service.
+
+    Usage:
+        with LLMStub(latency=0.05) as stub:
+            service = TitleService(api_key="test", api_base=stub.url)
+    """
+
+    def __init__(self, latency=0.0, rate_limit_first=0, retry_after=0, skip_indexes=()):
+        self.latency = latency
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.skip_indexes = set(skip_indexes)
+        self.requests = 0
+        self.rate_limited = 0
+        self.prompts = []
+        self.max_concurrency = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                status, headers, payload = stub._respond(body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _respond(self, body):
+        with self._lock:
+            self.requests += 1
+            self._active += 1
+            self.max_concurrency = max(self.max_concurrency, self._active)
+            limited = self.rate_limited < self.rate_limit_first
+            if limited:
+                self.rate_limited += 1
+        try:
+            if limited:
+                return 429, {"Retry-After": str(self.retry_after)}, {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED"}}
+
+            if self.latency:
+                time.sleep(self.latency)
+
+            prompt = body["contents"][0]["parts"][0]["text"]
+            with self._lock:
+                self.prompts.append(prompt)
+
+            clusters = CLUSTER_HEADER.findall(prompt)
+            if clusters:
+                text = json.dumps([
+                    {"index": int(index), "title": f"Title: {first_signal}"}
+                    for index, first_signal in clusters if int(index) not in self.skip_indexes
+                ])
+            else:
+                text = "Stub answer"
+            return 200, {}, {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        finally:
+            with self._lock:
+                self._active -= 1
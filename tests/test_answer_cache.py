@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+from qdrant_client import QdrantClient
+
+import src.dashboard.gemini_explainer as gemini_explainer
+import src.dashboard.llm_budget as llm_budget
+from src.dashboard.answer_cache import AnswerCache, content_version
+from src.dashboard.llm_budget import LLMBudget
+from src.dashboard.time_index import TimeIndex
+
+SIGNALS = [{"signal_id": "s1", "text": "Signal one"}, {"signal_id": "s2", "text": "Signal two"}]
+VERSION = content_version(SIGNALS)
+
+
+def _cache(tmp_path, client=None, **kwargs):
+    return AnswerCache(client=client, cache_file=tmp_path / "answers.json", flush_interval=None, **kwargs)
+
+
+def test_normalized_question_hits_and_member_change_misses(tmp_path, monkeypatch):
+    monkeypatch.delenv("QDRANT_URL", raising=False)
+    cache = _cache(tmp_path)
+    cache.set(VERSION, "Why is this emerging?", "Because.")
+
+    assert cache.get(VERSION, "  why is this   EMERGING ") == "Because."
+    assert cache.get(content_version(SIGNALS[::-1]), "why is this emerging") == "Because."
+    grown = SIGNALS + [{"signal_id": "s3", "text": "Signal three"}]
+    assert cache.get(content_version(grown), "Why is this emerging?") is None
+
+
+def test_lru_and_ttl(tmp_path, monkeypatch):
+    monkeypatch.delenv("QDRANT_URL", raising=False)
+    now = [1000.0]
+    cache = _cache(tmp_path, max_entries=2, ttl_seconds=60, clock=lambda: now[0])
+    cache.set(VERSION, "a", "A")
+    cache.set(VERSION, "b", "B")
+    cache.get(VERSION, "a")
+    cache.set(VERSION, "c", "C")
+
+    assert cache.get(VERSION, "b") is None
+    assert cache.get(VERSION, "a") == "A"
+
+    now[0] += 61
+    assert cache.get(VERSION, "c") is None
+    assert cache.stats["evicted"] == 1 and cache.stats["expired"] == 1
+
+
+def test_answers_are_shared_through_qdrant(tmp_path):
+    client = QdrantClient(":memory:")
+    dashboard = _cache(tmp_path, client=client)
+    dashboard.ensure_loaded()
+
+    ingest = _cache(tmp_path, client=client)
+    ingest.set(VERSION, "Who should care?", "Investors.")
+    assert ingest.flush() == 1
+
+    # Loaded before the answer existed: found with a single lookup by id
+    assert dashboard.get(VERSION, "Who should care?") == "Investors."
+    assert dashboard.stats["remote_hits"] == 1
+    assert _cache(tmp_path, client=client).get(VERSION, "who should care") == "Investors."
+
+
+class _FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeGenai:
+    """Stands in for google.generativeai: records prompts, streams one answer."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def GenerativeModel(self, name):
+        return self
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return [_FakeChunk(f"Answer {len(self.prompts)}")]
+
+
+def test_precomputed_answers_are_served_to_the_filtered_dashboard_cluster(tmp_path, monkeypatch):
+    genai = _FakeGenai()
+    monkeypatch.setattr(gemini_explainer, "GEMINI_API_KEY", "test")
+    monkeypatch.setattr(gemini_explainer, "_get_genai", lambda: genai)
+    monkeypatch.setattr(gemini_explainer, "_answer_cache", _cache(tmp_path, client=QdrantClient(":memory:")))
+    monkeypatch.setattr(llm_budget, "_llm_budget", LLMBudget(max_calls_per_minute=1000))
+
+    # Stored newest-first with more than EXPLAIN_CONTEXT_SIGNALS members
+    now = datetime.utcnow()
+    signals = [
+        {"signal_id": f"s{i}", "text": f"Signal {i}", "timestamp": (now - timedelta(days=i)).isoformat()}
+        for i in range(14)
+    ]
+    cluster = {"cluster_id": "c1", "signals": signals, "signal_count": len(signals)}
+
+    stats = gemini_explainer.precompute_cluster_answers([cluster])
+    assert stats["generated"] == len(gemini_explainer.PRESET_QUESTIONS)
+
+    # The dashboard renders the TimeIndex copy (signals re-sorted oldest first)
+    filtered = TimeIndex([cluster]).filter(days=365)[0]
+    assert [s["signal_id"] for s in filtered["signals"]] != [s["signal_id"] for s in signals]
+    for question in gemini_explainer.PRESET_QUESTIONS:
+        answer = "".join(gemini_explainer.stream_cluster_explanation(filtered["signals"], question, cluster_id="c1"))
+        assert answer.startswith("Answer ")
+    assert len(genai.prompts) == len(gemini_explainer.PRESET_QUESTIONS)
+    assert "Signal 0" in genai.prompts[0] and "Signal 13" not in genai.prompts[0]
+
+    # A new member (beyond the first ten in any order) changes the content version
+    grown = signals + [{"signal_id": "s99", "text": "Signal 99", "timestamp": (now - timedelta(days=30)).isoformat()}]
+    "".join(gemini_explainer.stream_cluster_explanation(grown, gemini_explainer.PRESET_QUESTIONS[0]))
+    assert len(genai.prompts) == len(gemini_explainer.PRESET_QUESTIONS) + 1
@@ -0,0 +1,58 @@
+import random
+from datetime import datetime, timedelta
+
+from src.dashboard.catalog import ClusterCatalog
+from src.dashboard.feed import build_emerging_feed
+
+
+def _clusters(seed=31, n_clusters=50):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    clusters = []
+    for c in range(n_clusters):
+        signals = [
+            {"text": f"signal {c}-{i}", "timestamp": (now - timedelta(days=rng.uniform(0, 80))).isoformat()}
+            for i in range(rng.randint(1, 8))
+        ]
+        clusters.append({
+            "cluster_id": f"c{c}", "signals": signals, "signal_count": len(signals), "created_at": signals[0]["timestamp"]
+        })
+    return clusters
+
+
+def test_lookups_return_the_clusters_passed_in():
+    clusters = _clusters()
+    catalog = ClusterCatalog(clusters)
+
+    assert len(catalog) == len(clusters) and list(catalog) == clusters
+    assert "c7" in catalog and "missing" not in catalog
+    assert catalog.get("c7") is clusters[7]
+    assert catalog.get("missing") is None
+
+
+def test_select_matches_a_list_comprehension():
+    clusters = _clusters()
+    catalog = ClusterCatalog(clusters)
+
+    for min_signals, max_signals in [(None, None), (3, None), (None, 3), (2, 5), (9, None), (4, 4)]:
+        expected = [
+            c for c in clusters
+            if (min_signals is None or c["signal_count"] >= min_signals)
+            and (max_signals is None or c["signal_count"] < max_signals)
+        ]
+        selected = catalog.select(min_signals, max_signals)
+        assert [c["cluster_id"] for c in selected] == [c["cluster_id"] for c in expected]
+        assert all(a is b for a, b in zip(selected, expected))
+
+
+def test_emerging_feed_matches_the_feed_over_the_selected_clusters():
+    clusters = _clusters(seed=37)
+    catalog = ClusterCatalog(clusters)
+
+    for min_signals, max_signals in [(None, None), (3, None), (None, 3)]:
+        expected = build_emerging_feed(catalog.select(min_signals, max_signals))
+        assert catalog.emerging_feed(min_signals, max_signals) == expected
+
+    # Items are copies: callers may annotate them without changing the catalog's feed
+    catalog.emerging_feed()[0]["title"] = "changed"
+    assert "title" not in catalog.emerging_feed()[0]
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import numpy as np
+
+from src.clustering.persistence import check_persistence_batch
+from src.ingestion.signal import Signal
+from src.memory.qdrant_client import QdrantMemory
+from src.scoring.critic_agent import evaluate_cluster
+
+
+def _signal(i):
+    return Signal(f"sig-{i}", f"signal {i}", datetime(2026, 1, 1), "test", "emerging_technology", "ai")
+
+
+def test_batch_search_matches_single_searches_and_checks_persistence():
+    rng = np.random.default_rng(0)
+    memory = QdrantMemory(collection_name="signals_hot", vector_size=8, use_cloud=False)
+    past = rng.normal(size=(40, 8))
+    memory.upsert_signals([_signal(i) for i in range(40)], past.tolist())
+
+    # Two new signals next to past ones, one pointing away from everything stored
+    queries = [(past[0] + 0.01).tolist(), (past[1] + 0.01).tolist(), (-past.sum(axis=0)).tolist()]
+
+    batched = memory.search_similar_signals_batch(queries, top_k=5, batch_size=2)
+    single = [memory.search_similar_signals(q, top_k=5) for q in queries]
+    assert [[p["signal_id"] for p in r] for r in batched] == [[p["signal_id"] for p in r] for r in single]
+
+    similar = memory.search_similar_signals_batch(queries, top_k=5, score_threshold=0.99)
+    assert [[p["signal_id"] for p in r] for r in similar] == [["sig-0"], ["sig-1"], []]
+
+    contextualized = [{"similar_count": len(r), "similar_signals": r} for r in similar]
+    persistence = check_persistence_batch(contextualized, min_similar=1)
+    assert (persistence["persistent"], persistence["noise"]) == (2, 1)
+    assert [r["is_persistent"] for r in persistence["results"]] == [True, True, False]
+
+
+def test_critic_flags_persistence_recorded_on_signals():
+    def cluster(flags):
+        signals = [{"text": f"s{i}", "source": "test", "is_persistent": f} for i, f in enumerate(flags)]
+        return {"signals": signals, "signal_count": len(signals), "coherence": 0.5}
+
+    persistent = evaluate_cluster(cluster([True, True, False]))
+    assert "historically persistent" in persistent["flags"]
+    assert persistent["metrics"]["persistent_signals"] == 2
+    assert "no historical precedent" in evaluate_cluster(cluster([False, False, False]))["flags"]
+
+    unchecked = evaluate_cluster({"signals": [{"text": "s", "source": "test"}] * 3, "signal_count": 3, "coherence": 0.5})
+    assert not {"historically persistent", "no historical precedent"} & set(unchecked["flags"])
@@ -0,0 +1,98 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from src.dashboard.facets import FACETS, FacetIndex
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+VALUES = {
+    "domain": ["emerging_technology", "energy"],
+    "subdomain": ["ai", "compute", "energy"],
+    "source": ["arxiv", "semianalysis", "dcd"],
+    "critic_confidence": ["high", "medium", "low"],
+    "controller_action": ["promote", "keep_candidate", "demote_wait"],
+}
+
+
+def _clusters(seed=23, n_clusters=80):
+    rng = random.Random(seed)
+    clusters = []
+    for c in range(n_clusters):
+        signals = [{
+            "signal_id": f"{c}-{i}",
+            "timestamp": (NOW - timedelta(days=rng.uniform(0, 90))).isoformat() if rng.random() > 0.05 else None,
+            "domain": rng.choice(VALUES["domain"]),
+            "subdomain": rng.choice(VALUES["subdomain"]),
+            "source": rng.choice(VALUES["source"]),
+        } for i in range(rng.randint(1, 6))]
+        cluster = {"cluster_id": f"c{c}", "signals": signals}
+        if rng.random() > 0.2:
+            cluster["critic_report"] = {"confidence": rng.choice(VALUES["critic_confidence"])}
+            cluster["controller_decision"] = {"final_action": rng.choice(VALUES["controller_action"])}
+        clusters.append(cluster)
+    return clusters
+
+
+def _naive_values(cluster, days):
+    """Facet values of one cluster under the time window (None if it has no signal in the window)."""
+    cutoff = NOW - timedelta(days=days)
+    recent_cutoff = NOW - timedelta(days=min(days, 30))
+    in_window = [s for s in cluster["signals"] if not s["timestamp"] or datetime.fromisoformat(s["timestamp"]) >= cutoff]
+    if not in_window:
+        return None
+    recent = [s for s in in_window if not s["timestamp"] or datetime.fromisoformat(s["timestamp"]) >= recent_cutoff]
+    ratio = len(recent) / len(in_window)
+    return {
+        "domain": {s["domain"] for s in cluster["signals"]},
+        "subdomain": {s["subdomain"] for s in cluster["signals"]},
+        "source": {s["source"] for s in cluster["signals"]},
+        "critic_confidence": {(cluster.get("critic_report") or {}).get("confidence")} - {None},
+        "controller_action": {(cluster.get("controller_decision") or {}).get("final_action")} - {None},
+        "emergence": {"rapid" if ratio >= 0.6 else "stable" if ratio >= 0.3 else "dormant"},
+    }
+
+
+def _matches(values, selections, skip=None):
+    return all(
+        not selected or values[name] & set(selected)
+        for name, selected in selections.items() if name != skip
+    )
+
+
+def test_resolve_matches_a_cluster_scan():
+    clusters = _clusters()
+    index = FacetIndex(clusters)
+    rng = random.Random(4)
+
+    for days in (7, 30, 60):
+        values = [_naive_values(c, days) for c in clusters]
+        for _ in range(10):
+            selections = {
+                name: rng.sample(VALUES.get(name, ["rapid", "stable", "dormant"]), rng.randint(0, 2))
+                for name in FACETS
+            }
+            mask, counts = index.resolve(selections, days, now=NOW)
+
+            expected = [v is not None and bool(_matches(v, selections)) for v in values]
+            assert mask.tolist() == expected
+
+            for name in FACETS:
+                expected_counts = {}
+                for v in values:
+                    if v is not None and _matches(v, selections, skip=name):
+                        for value in v[name]:
+                            expected_counts[value] = expected_counts.get(value, 0) + 1
+                assert {value: n for value, n in counts[name].items() if n} == expected_counts
+
+
+def test_shared_index_serves_each_window_its_own_bitmaps():
+    clusters = _clusters()
+    index = FacetIndex(clusters)
+    expected = {days: index.resolve({}, days, now=NOW)[0].tolist() for days in (7, 30, 60)}
+
+    # Sessions with different windows interleave on the shared (cached) index
+    windows = [7, 30, 60] * 20
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda days: index.resolve({}, days, now=NOW)[0].tolist(), windows))
+    assert results == [expected[days] for days in windows]
@@ -0,0 +1,16 @@
+import re
+
+from pyvis.network import Network
+
+from src.dashboard.graph import _inline_local_assets
+
+
+def test_graph_html_loads_no_external_assets():
+    net = Network(height="600px", bgcolor="#0e1117", font_color="white")
+    net.add_node("a")
+    html = _inline_local_assets(net.generate_html())
+
+    # pyvis' template keeps a commented-out node_modules link; ignore comments
+    active = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    assert not re.findall(r'(?:src|href)="[^"]+"', active)
+    assert "vis.Network" in html and ".vis-network" in html
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.dashboard.graph_layout import GraphLayout
+
+
+def _clusters(rng, n_clusters, offset=0):
+    return [
+        {
+            "cluster_id": f"c{offset + c}",
+            "centroid": rng.normal(size=8).tolist(),
+            "signals": [{"signal_id": f"c{offset + c}-0"}],
+        }
+        for c in range(n_clusters)
+    ]
+
+
+def _window(clusters, n_signals):
+    """Time-filtered copy: fewer signals, same stored centroid."""
+    return [{**c, "signals": c["signals"][-n_signals:]} for c in clusters]
+
+
+def test_window_changes_and_alternating_callers_reuse_the_layout():
+    rng = np.random.default_rng(3)
+    layout = GraphLayout()
+    clusters = _clusters(rng, 40)
+    for cluster in clusters:
+        cluster["signals"] = [{"signal_id": f"{cluster['cluster_id']}-{i}"} for i in range(3)]
+    wide = layout.cluster_positions(clusters)
+    basis = layout._basis
+
+    # A narrower window keeps fewer signals and drops clusters; a facet session sees another subset
+    narrow = layout.cluster_positions(_window(clusters[:25], 1))
+    facet = layout.cluster_positions(_window(clusters[20:], 2))
+    again = layout.cluster_positions(clusters)
+
+    assert layout._basis is basis
+    assert again == wide
+    assert all(narrow[cid] == wide[cid] for cid in narrow)
+    assert all(facet[cid] == wide[cid] for cid in facet)
+
+
+def test_new_clusters_avoid_cells_of_idle_anchors():
+    rng = np.random.default_rng(5)
+    layout = GraphLayout()
+    clusters = _clusters(rng, 40)
+    wide = layout.cluster_positions(clusters)
+
+    positions = layout.cluster_positions(clusters[:30] + _clusters(rng, 3, offset=100))
+    idle = {wide[c["cluster_id"]] for c in clusters[30:]}
+    assert not idle & {positions[f"c{100 + c}"] for c in range(3)}
+    assert len(layout._anchors) == 43
+
+
+def test_idle_anchors_are_bounded():
+    rng = np.random.default_rng(3)
+    layout = GraphLayout(max_idle_anchors=4)
+    old = _clusters(rng, 20)
+    layout.cluster_positions(old)
+
+    current = old[:16] + _clusters(rng, 3, offset=100)
+    positions = layout.cluster_positions(current)
+
+    assert set(positions) == {c["cluster_id"] for c in current}
+    assert set(layout._anchors) == set(layout._fingerprints)
+    assert len(layout._anchors) == len(current) + 4
+
+
+def test_concurrent_callers_get_consistent_layouts():
+    rng = np.random.default_rng(8)
+    layout = GraphLayout()
+    batches = [_clusters(rng, 30, offset=1000 * b) for b in range(4)] * 8
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(layout.cluster_positions, batches))
+
+    for batch, positions in zip(batches, results):
+        assert set(positions) == {c["cluster_id"] for c in batch}
+        # Anchors of one call never overlap
+        assert len(set(positions.values())) == len(batch)
@@ -0,0 +1,99 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.dashboard.keyword_index import KeywordIndex, cluster_keyword_tf
+from src.dashboard.search import compute_lexical_score, extract_keywords, search_clusters_hybrid
+from src.dashboard.time_index import TimeIndex
+from tests.embedding_stub import TopicEmbeddingModel
+
+WORDS = ["chips", "power", "quantum", "grid", "datacenter", "Trainium", "encryption", "the", "of", "GPU", "demand"]
+
+
+def _clusters(seed=5, n_clusters=30):
+    rng = random.Random(seed)
+    clusters = []
+    for c in range(n_clusters):
+        signals = [
+            {"signal_id": f"{c}-{i}", "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 8)))}
+            for i in range(rng.randint(1, 6))
+        ]
+        clusters.append({"cluster_id": f"c{c}", "signals": signals, "signal_count": len(signals)})
+    return clusters
+
+
+QUERIES = ["power grid", "quantum chips GPU", "Trainium", "the of", "datacenter power demand encryption"]
+
+
+def test_lexical_scores_match_the_tokenizing_scorer():
+    clusters = _clusters()
+    index = KeywordIndex.from_clusters(clusters)
+    for query in QUERIES:
+        keywords = extract_keywords(query)
+        scores = index.lexical_scores(keywords)
+        for cluster in clusters:
+            assert scores.get(cluster["cluster_id"], 0.0) == pytest.approx(compute_lexical_score(keywords, cluster["signals"]))
+
+
+def test_incremental_updates_match_a_rebuilt_index():
+    clusters = _clusters(seed=9)
+    index = KeywordIndex.from_clusters([{**c, "signals": c["signals"][:1]} for c in clusters])
+    for cluster in clusters:
+        index.add_signals(cluster["cluster_id"], cluster["signals"][1:])
+    index.remove_cluster("c3")
+    index.add_cluster("c4", cluster_keyword_tf(clusters[4]["signals"]))
+
+    rebuilt = KeywordIndex.from_clusters([c for c in clusters if c["cluster_id"] != "c3"])
+    assert index.postings == rebuilt.postings
+    assert index.doc_lengths == rebuilt.doc_lengths
+    for query in QUERIES:
+        keywords = extract_keywords(query)
+        assert index.bm25_scores(keywords) == pytest.approx(rebuilt.bm25_scores(keywords))
+        assert all(0.0 <= score <= 1.0 for score in index.bm25_scores(keywords).values())
+
+
+def test_hybrid_search_with_the_index_matches_the_tokenizing_path():
+    clusters = _clusters(seed=13)
+    model = TopicEmbeddingModel()
+    for cluster in clusters:
+        cluster["centroid"] = model.embed(" ".join(s["text"] for s in cluster["signals"])).tolist()
+    index = KeywordIndex.from_clusters(clusters)
+
+    for query in QUERIES:
+        expected = search_clusters_hybrid(query, clusters, model, min_final_score=0.6)
+        indexed = search_clusters_hybrid(query, clusters, model, min_final_score=0.6, keyword_index=index)
+        assert [r["cluster_id"] for r in indexed] == [r["cluster_id"] for r in expected]
+        assert [r["final_score"] for r in indexed] == pytest.approx([r["final_score"] for r in expected])
+
+
+def test_time_filtered_clusters_are_scored_from_their_in_window_signals():
+    clusters = _clusters(seed=17)
+    now = datetime.now()
+    rng = random.Random(3)
+    model = TopicEmbeddingModel()
+    for cluster in clusters:
+        cluster["centroid"] = model.embed(" ".join(s["text"] for s in cluster["signals"])).tolist()
+        for signal in cluster["signals"]:
+            signal["timestamp"] = (now - timedelta(days=rng.uniform(0, 60))).isoformat()
+    # The index covers the full dataset, the dashboard searches the 30-day copies
+    index = KeywordIndex.from_clusters(clusters)
+    filtered = TimeIndex(clusters).filter(days=30, now=now)
+    assert any(len(c["signals"]) < len(clusters[int(c["cluster_id"][1:])]["signals"]) for c in filtered)
+
+    for query in QUERIES:
+        keywords = extract_keywords(query)
+        scores = index.lexical_scores(keywords, clusters=filtered)
+        for cluster in filtered:
+            assert scores.get(cluster["cluster_id"], 0.0) == pytest.approx(compute_lexical_score(keywords, cluster["signals"]))
+
+        expected = search_clusters_hybrid(query, filtered, model, min_final_score=0.4)
+        indexed = search_clusters_hybrid(query, filtered, model, min_final_score=0.4, keyword_index=index)
+        assert [r["cluster_id"] for r in indexed] == [r["cluster_id"] for r in expected]
+        assert [r["lexical_score"] for r in indexed] == pytest.approx([r["lexical_score"] for r in expected])
+
+    # BM25 over a copy holding every signal is unchanged; a windowed copy uses its own term frequencies
+    full = index.bm25_scores(extract_keywords("power grid"))
+    assert index.bm25_scores(extract_keywords("power grid"), clusters=clusters) == pytest.approx(full)
+    windowed = index.bm25_scores(extract_keywords("power grid"), clusters=filtered)
+    assert set(windowed) <= {c["cluster_id"] for c in filtered}
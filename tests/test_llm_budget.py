@@ -0,0 +1,62 @@
+import src.dashboard.gemini_explainer as gemini_explainer
+from src.dashboard.llm_budget import LLMBudget, rank_by_priority
+from src.dashboard.title_cache import TitleCache
+from src.dashboard.title_service import TitleService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_run_and_minute_limits():
+    clock = FakeClock()
+    budget = LLMBudget(max_calls_per_run=5, max_calls_per_minute=2, clock=clock, sleep=clock.sleep)
+
+    assert budget.acquire("title") and budget.acquire("title")
+    assert not budget.acquire("answer")
+    assert budget.acquire("title", wait=True) and clock.now == 60.0
+    assert budget.acquire("title") and budget.acquire("title", wait=True)
+    assert budget.remaining == 0 and not budget.acquire("title", wait=True)
+
+    budget.record("title", 0.2, prompt_chars=400)
+    budget.record("title", 0.4, ok=False)
+    report = budget.report()
+    assert report["title"]["calls"] == 2 and report["title"]["failed"] == 1 and report["title"]["denied"] == 1
+    assert report["title"]["est_prompt_tokens"] == 100 and report["title"]["max_ms"] == 400.0
+    assert report["answer"]["denied"] == 1
+
+    budget.start_run()
+    assert budget.remaining == 5 and budget.report() == {}
+
+
+def test_budget_goes_to_emergent_clusters_and_provisional_titles_are_upgraded(title_cache, llm_stub, make_cluster):
+    old = make_cluster("old", 9, age_days=90)
+    small, large = make_cluster("small", 3, age_days=1), make_cluster("large", 6, age_days=1)
+    assert [c["cluster_id"] for c in rank_by_priority([old, small, large])] == [
+        large["cluster_id"], small["cluster_id"], old["cluster_id"]
+    ]
+
+    budget = LLMBudget(max_calls_per_run=1, max_calls_per_minute=100)
+    service = TitleService(api_key="test", api_base=llm_stub.url, batch_size=1, requests_per_minute=6000, budget=budget)
+    titles, stats = gemini_explainer.refresh_cluster_titles([old, small, large], service=service)
+    assert llm_stub.requests == 1 and stats["new"] == 3
+    assert titles[large["cluster_id"]] == "Title: large signal 0"
+    assert title_cache.is_provisional(small["cluster_id"]) and title_cache.is_provisional(old["cluster_id"])
+    assert not title_cache.is_provisional(large["cluster_id"])
+
+    budget.start_run()
+    titles, stats = gemini_explainer.refresh_cluster_titles([old, small, large], service=service)
+
+    assert stats["provisional"] == 2 and stats["unchanged"] == 1 and llm_stub.requests == 2
+    assert titles[small["cluster_id"]] == "Title: small signal 0"
+    assert not title_cache.is_provisional(small["cluster_id"]) and title_cache.is_provisional(old["cluster_id"])
+    title_cache.flush()
+    reloaded = TitleCache(client=title_cache.client, cache_file=title_cache.cache_file, flush_interval=None)
+    assert reloaded.is_provisional(old["cluster_id"]) and not reloaded.is_provisional(small["cluster_id"])
@@ -0,0 +1,35 @@
+from src.dashboard.local_titler import DEFAULT_TITLE, DocumentFrequencies, LocalTitler
+
+CORPUS = [
+    "New report on Nvidia GPU supply in 2025",
+    "New report on datacenter power",
+    "New study of quantum encryption",
+    "New GPU shortage hits Nvidia partners",
+]
+
+
+def test_incremental_frequencies_match_full_build():
+    full = DocumentFrequencies().add_texts(CORPUS)
+    incremental = DocumentFrequencies().add_texts(CORPUS[:2]).add_texts(CORPUS[2:])
+    assert (incremental.n_docs, incremental.df) == (full.n_docs, full.df)
+    assert full.df["new"] == 4 and full.df["nvidia"] == 2
+
+
+def test_idf_ranks_distinctive_terms_with_original_case():
+    titler = LocalTitler(DocumentFrequencies().add_texts(CORPUS))
+    title = titler.title_texts([CORPUS[0], CORPUS[3]])
+    assert title.split(" / ")[:2] == ["Nvidia", "GPU"]
+    assert "New" not in title and "2025" not in title
+
+
+def test_batch_titles_match_single_titles():
+    titler = LocalTitler(DocumentFrequencies().add_texts(CORPUS))
+    clusters = [
+        {"cluster_id": "a", "signals": [{"text": CORPUS[0]}, {"text": CORPUS[3]}]},
+        {"cluster_id": "b", "signals": [{"text": CORPUS[2]}]},
+        {"cluster_id": "c", "signals": []},
+    ]
+    titles = titler.title_clusters(clusters)
+    assert titles["a"] == titler.title_texts([CORPUS[0], CORPUS[3]])
+    assert titles["b"] == titler.title_texts([CORPUS[2]])
+    assert titles["c"] == DEFAULT_TITLE
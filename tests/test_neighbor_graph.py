@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from src.clustering.neighbor_graph import (
+    cluster_edges,
+    compact_neighbor_graph,
+    update_neighbor_graph,
+)
+
+DIM = 8
+SIGNAL_THRESHOLD = 0.65
+CLUSTER_THRESHOLD = 0.7
+
+
+def _clusters(rng, n_clusters=12, n_topics=4):
+    topics = rng.normal(size=(n_topics, DIM))
+    clusters = []
+    for c in range(n_clusters):
+        topic = topics[c % n_topics]
+        embeddings = (topic + 0.6 * rng.normal(size=(rng.integers(2, 7), DIM))).tolist()
+        clusters.append({
+            "cluster_id": f"c{c}",
+            "signals": [{"signal_id": f"c{c}-{i}"} for i in range(len(embeddings))],
+            "embeddings": embeddings,
+            "centroid": np.mean(embeddings, axis=0).tolist()
+        })
+    return clusters
+
+
+def _cosine_matrix(vectors):
+    matrix = np.asarray(vectors, dtype=np.float64)
+    matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    scores = matrix @ matrix.T
+    np.fill_diagonal(scores, -np.inf)
+    return scores
+
+
+def _brute_force(ids, vectors, k, threshold):
+    """id -> {neighbor id: similarity} for the k most similar above threshold."""
+    scores = _cosine_matrix(vectors)
+    neighbors = {}
+    for i, node_id in enumerate(ids):
+        order = [j for j in np.argsort(-scores[i])[:k] if scores[i, j] > threshold]
+        neighbors[node_id] = {ids[j]: scores[i, j] for j in order}
+    return neighbors
+
+
+def _assert_lists_match(stored, expected):
+    assert set(stored) == set(expected)
+    for node_id, entries in stored.items():
+        assert {n for n, _ in entries} == set(expected[node_id])
+        for neighbor_id, similarity in entries:
+            assert similarity == pytest.approx(expected[node_id][neighbor_id], abs=1e-3)
+
+
+def _check_against_brute_force(clusters, k_signals, k_clusters):
+    signal_ids = [s["signal_id"] for c in clusters for s in c["signals"]]
+    embeddings = [e for c in clusters for e in c["embeddings"]]
+    stored = {sid: entries for c in clusters for sid, entries in c["signal_neighbors"].items()}
+    _assert_lists_match(stored, _brute_force(signal_ids, embeddings, k_signals, SIGNAL_THRESHOLD))
+
+    cluster_ids = [c["cluster_id"] for c in clusters]
+    stored = {c["cluster_id"]: c["cluster_neighbors"] for c in clusters}
+    _assert_lists_match(stored, _brute_force(cluster_ids, [c["centroid"] for c in clusters], k_clusters, CLUSTER_THRESHOLD))
+
+
+def test_incremental_updates_match_all_pairs_knn():
+    rng = np.random.default_rng(31)
+    clusters = _clusters(rng)
+    # Cluster lists are exact while k covers every cluster: an unchanged cluster
+    # that loses a neighbor does not rescan for its (k + 1)-th best
+    k_signals, k_clusters = 3, len(clusters) + 4
+
+    stats = update_neighbor_graph(clusters, k_signals=k_signals, k_clusters=k_clusters)
+    assert stats["new_signals"] == sum(len(c["signals"]) for c in clusters)
+    _check_against_brute_force(clusters, k_signals, k_clusters)
+
+    # A new batch lands in some clusters (and moves their centroids) plus one new cluster
+    new_ids = set()
+    for c in (1, 4, 7):
+        cluster = clusters[c]
+        for i in range(2):
+            signal_id = f"c{c}-new{i}"
+            cluster["signals"].append({"signal_id": signal_id})
+            cluster["embeddings"].append((np.asarray(clusters[(c + 1) % len(clusters)]["centroid"])
+                                          + 0.3 * rng.normal(size=DIM)).tolist())
+            new_ids.add(signal_id)
+        cluster["centroid"] = np.mean(cluster["embeddings"], axis=0).tolist()
+    clusters.append({
+        "cluster_id": "c-new",
+        "signals": [{"signal_id": "c-new-0"}],
+        "embeddings": [clusters[0]["centroid"]],
+        "centroid": clusters[0]["centroid"]
+    })
+    new_ids.add("c-new-0")
+
+    stats = update_neighbor_graph(clusters, new_signal_ids=new_ids, k_signals=k_signals, k_clusters=k_clusters)
+    assert stats["new_signals"] == len(new_ids) and stats["changed_clusters"] == 4
+    _check_against_brute_force(clusters, k_signals, k_clusters)
+
+    rows_i, rows_j, similarities = cluster_edges(clusters, threshold=CLUSTER_THRESHOLD)
+    scores = _cosine_matrix([c["centroid"] for c in clusters])
+    expected = [(i, j) for i in range(len(clusters)) for j in range(i + 1, len(clusters)) if scores[i, j] > CLUSTER_THRESHOLD]
+    assert list(zip(rows_i.tolist(), rows_j.tolist())) == expected
+    assert similarities.tolist() == pytest.approx([scores[i, j] for i, j in expected], abs=1e-3)
+
+
+def test_compaction_drops_dangling_entries():
+    rng = np.random.default_rng(5)
+    clusters = _clusters(rng)
+    update_neighbor_graph(clusters)
+    before = {sid: entries for c in clusters for sid, entries in c["signal_neighbors"].items()}
+
+    # Drop a cluster and a member signal, and plant a self-loop and a duplicate
+    removed = clusters.pop(2)
+    removed_signal = clusters[0]["signals"].pop()["signal_id"]
+    clusters[0]["embeddings"].pop()
+    sid = clusters[1]["signals"][0]["signal_id"]
+    clusters[1]["signal_neighbors"][sid] = clusters[1]["signal_neighbors"][sid] + [[sid, 1.0], [sid, 1.0]]
+
+    stats = compact_neighbor_graph(clusters)
+    assert stats["entries_after"] < stats["entries_before"]
+
+    gone = {s["signal_id"] for s in removed["signals"]} | {removed_signal}
+    for cluster in clusters:
+        assert set(cluster["signal_neighbors"]) == {s["signal_id"] for s in cluster["signals"]}
+        for signal_id, entries in cluster["signal_neighbors"].items():
+            ids = [n for n, _ in entries]
+            assert len(ids) == len(set(ids)) and signal_id not in ids and not gone & set(ids)
+            assert [n for n, _ in before[signal_id] if n not in gone] == ids
+        assert removed["cluster_id"] not in {n for n, _ in cluster["cluster_neighbors"]}
@@ -0,0 +1,141 @@
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from src.dashboard.keyword_index import cluster_keyword_tf
+from src.dashboard.qdrant_search import (
+    DENSE_VECTOR,
+    LEXICAL_VECTOR,
+    collection_supports_hybrid,
+    lexical_sparse_vector,
+    search_clusters_qdrant,
+)
+from src.dashboard.search import compute_lexical_score, extract_keywords, search_clusters_hybrid
+from src.memory.cluster_memory import ClusterMemory
+from tests.embedding_stub import DIM, TopicEmbeddingModel
+
+
+def _cluster(cluster_id, texts):
+    signals = [{"signal_id": f"{cluster_id}-{i}", "text": t, "timestamp": None} for i, t in enumerate(texts)]
+    return {"cluster_id": cluster_id, "signals": signals, "signal_count": len(signals)}
+
+
+CLUSTERS = [
+    _cluster("00000000-0000-0000-0000-000000000001", ["New chips for AI training", "Trainium chips ship"]),
+    _cluster("00000000-0000-0000-0000-000000000002", ["Datacenter power demand grows", "Grid power limits", "Power deals"]),
+    _cluster("00000000-0000-0000-0000-000000000003", ["Quantum encryption breakthrough"]),
+]
+
+
+def _hybrid_collection(model):
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        collection_name="clusters_warm",
+        vectors_config={DENSE_VECTOR: models.VectorParams(size=DIM, distance=models.Distance.COSINE)},
+        sparse_vectors_config={LEXICAL_VECTOR: models.SparseVectorParams()},
+    )
+    client.upsert(
+        collection_name="clusters_warm",
+        points=[
+            models.PointStruct(
+                id=c["cluster_id"],
+                vector={
+                    DENSE_VECTOR: model.embed(" ".join(s["text"] for s in c["signals"])).tolist(),
+                    LEXICAL_VECTOR: lexical_sparse_vector(cluster_keyword_tf(c["signals"])),
+                },
+                payload={"cluster_id": c["cluster_id"], "signal_count": c["signal_count"]},
+            )
+            for c in CLUSTERS
+        ],
+    )
+    return client
+
+
+def test_collection_layout_detection():
+    model = TopicEmbeddingModel()
+    assert collection_supports_hybrid(_hybrid_collection(model))
+
+    legacy = QdrantClient(":memory:")
+    legacy.create_collection(
+        collection_name="clusters_warm",
+        vectors_config=models.VectorParams(size=DIM, distance=models.Distance.COSINE),
+    )
+    assert not collection_supports_hybrid(legacy)
+
+
+def test_server_side_fusion_matches_result_schema():
+    model = TopicEmbeddingModel()
+    client = _hybrid_collection(model)
+
+    results = search_clusters_qdrant("power grid", client, model, min_final_score=0.35, top_k=5)
+
+    assert results[0]["cluster_id"] == CLUSTERS[1]["cluster_id"]
+    for result in results:
+        for key in ("cluster_id", "signal_count", "semantic_score", "lexical_score", "final_score", "cluster_type"):
+            assert key in result
+        # Repeated mentions ("Power" x3) saturate above 1 before the cap
+        assert 0.0 <= result["lexical_score"] <= 1.0
+        # Qdrant's fused score equals the 0.7/0.3 blend of the recovered components
+        assert abs(result["final_score"] - (0.7 * result["semantic_score"] + 0.3 * result["lexical_score"])) < 1e-4
+    assert [r["final_score"] for r in results] == sorted((r["final_score"] for r in results), reverse=True)
+    assert results[0]["cluster_type"] == "Active"
+
+
+def test_lexical_score_equals_overlap_for_single_mentions():
+    model = TopicEmbeddingModel()
+    client = _hybrid_collection(model)
+
+    results = search_clusters_qdrant("quantum encryption", client, model, min_final_score=0.0, top_k=5)
+    quantum = next(r for r in results if r["cluster_id"] == CLUSTERS[2]["cluster_id"])
+
+    expected = compute_lexical_score(extract_keywords("quantum encryption"), CLUSTERS[2]["signals"])
+    assert abs(quantum["lexical_score"] - expected) < 1e-6
+
+
+def test_results_restricted_to_given_clusters():
+    model = TopicEmbeddingModel()
+    client = _hybrid_collection(model)
+
+    subset = [CLUSTERS[0], CLUSTERS[2]]
+    results = search_clusters_qdrant("power grid chips", client, model, min_final_score=0.0, clusters=subset)
+
+    assert {r["cluster_id"] for r in results} <= {c["cluster_id"] for c in subset}
+    # In-memory cluster fields (signals) are carried into the results
+    assert all("signals" in r for r in results)
+
+
+def test_time_filtered_clusters_are_rescored_from_their_in_window_signals():
+    model = TopicEmbeddingModel()
+    client = _hybrid_collection(model)
+
+    # Window keeps only "Power deals": the stored vector still covers "Datacenter power demand grows"
+    power = CLUSTERS[1]
+    window = {**power, "signals": power["signals"][2:], "signal_count": 1}
+    results = search_clusters_qdrant("datacenter demand", client, model, min_final_score=0.0, top_k=5, clusters=[window])
+    full = search_clusters_qdrant("datacenter demand", client, model, min_final_score=0.0, top_k=5, clusters=[power])
+
+    assert full[0]["lexical_score"] == 1.0
+    expected = compute_lexical_score(extract_keywords("datacenter demand"), window["signals"])
+    assert [r["lexical_score"] for r in results] == [expected] == [0.0]
+    assert results[0]["final_score"] == results[0]["semantic_score"] * 0.7
+
+
+def test_cluster_memory_dense_vectors_match_in_memory_semantic_scores():
+    model = TopicEmbeddingModel()
+    # Mixed topics: the mean embedding leans to chips, the joined text weighs both topics equally
+    mixed = _cluster("00000000-0000-0000-0000-000000000004", ["Chips ship", "Chips supply", "Chips prices", "Power deal"])
+    clusters = []
+    for c in CLUSTERS + [mixed]:
+        embeddings = [model.embed(s["text"]) for s in c["signals"]]
+        clusters.append({**c, "embeddings": embeddings, "centroid": np.mean(embeddings, axis=0).tolist(),
+                         "created_at": "2026-01-01T00:00:00"})
+    memory = ClusterMemory("clusters_warm", vector_size=DIM, use_cloud=False, hybrid_vectors=True)
+    for cluster in clusters:
+        memory.upsert_cluster(cluster, model)
+
+    query = "chips"
+    server = {r["cluster_id"]: r["semantic_score"] for r in search_clusters_qdrant(query, memory.client, model, min_final_score=0.0)}
+    local = {r["cluster_id"]: r["semantic_score"] for r in search_clusters_hybrid(query, clusters, model, min_final_score=0.0)}
+    assert server and set(server) <= set(local)
+    for cluster_id, score in server.items():
+        assert abs(score - local[cluster_id]) < 1e-4
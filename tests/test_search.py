@@ -0,0 +1,83 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.dashboard.keyword_index import KeywordIndex
+from src.dashboard.search import (
+    ClusterSearchIndex,
+    compute_lexical_score,
+    cosine_similarity,
+    extract_keywords,
+    search_clusters_hybrid,
+)
+from tests.embedding_stub import DIM, TopicEmbeddingModel
+
+WORDS = ["chips", "power", "quantum", "grid", "datacenter", "cooling", "fab"]
+QUERIES = ["power grid", "quantum chips", "datacenter cooling", "fab"]
+
+
+def _clusters(seed=21, n_clusters=60):
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    clusters = []
+    for c in range(n_clusters):
+        signals = [
+            {"signal_id": f"{c}-{i}", "text": " ".join(rng.choice(WORDS) for _ in range(4))}
+            for i in range(rng.randint(1, 5))
+        ]
+        cluster = {"cluster_id": f"c{c}", "signals": signals, "signal_count": len(signals)}
+        if c % 10:
+            cluster["centroid"] = np_rng.normal(size=DIM).tolist()
+        clusters.append(cluster)
+    return clusters
+
+
+def _naive_search(query, clusters, model, min_final_score):
+    """The per-cluster scoring loop ClusterSearchIndex replaced (clusters without a centroid are skipped)."""
+    keywords = extract_keywords(query)
+    query_embedding = model.embed(query)
+    results = []
+    for cluster in clusters:
+        if "centroid" not in cluster:
+            continue
+        semantic = cosine_similarity(query_embedding, cluster["centroid"])
+        lexical = compute_lexical_score(keywords, cluster["signals"])
+        final = 0.7 * semantic + 0.3 * lexical
+        if (semantic >= 0.30 or lexical >= 0.10) and final >= min_final_score:
+            results.append((cluster["cluster_id"], final, cluster["signal_count"]))
+    results.sort(key=lambda r: (r[1], r[2]), reverse=True)
+    return results
+
+
+@pytest.mark.parametrize("use_keyword_index", [False, True])
+def test_indexed_top_k_matches_the_scoring_loop(use_keyword_index):
+    clusters = _clusters()
+    model = TopicEmbeddingModel()
+    index = ClusterSearchIndex(clusters)
+    keyword_index = KeywordIndex.from_clusters(clusters) if use_keyword_index else None
+    assert len(index) == len([c for c in clusters if "centroid" in c])
+
+    # Searches may pass any subset of the indexed clusters (e.g., a time-filtered view)
+    subset = clusters[::2]
+    for query in QUERIES:
+        expected = _naive_search(query, subset, model, min_final_score=0.2)
+        assert expected
+        for top_k in (None, 1, 5, len(subset)):
+            results = search_clusters_hybrid(
+                query, subset, model, min_final_score=0.2,
+                search_index=index, keyword_index=keyword_index, top_k=top_k
+            )
+            wanted = expected if top_k is None else expected[:top_k]
+            assert [r["cluster_id"] for r in results] == [cluster_id for cluster_id, _, _ in wanted]
+            assert [r["final_score"] for r in results] == pytest.approx([final for _, final, _ in wanted], abs=1e-6)
+
+
+def test_semantic_scores_are_cosine_similarities():
+    clusters = _clusters(seed=4, n_clusters=20)
+    index = ClusterSearchIndex(clusters)
+    query = TopicEmbeddingModel().embed("power chips")
+    scores = index.semantic_scores(query)
+    for cluster_id, score in zip(index.cluster_ids, scores.tolist()):
+        centroid = next(c["centroid"] for c in clusters if c["cluster_id"] == cluster_id)
+        assert score == pytest.approx(cosine_similarity(query, centroid), abs=1e-6)
@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.dashboard.signal_search import SignalSearchIndex, group_signal_hits
+from src.dashboard.time_index import TimeIndex
+
+NOW = datetime(2026, 6, 1, 12, 0)
+DIM = 6
+
+
+def _clusters(seed=17, n_clusters=50):
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    clusters = []
+    for c in range(n_clusters):
+        n = rng.randint(0, 9)
+        signals = [{
+            "signal_id": f"{c}-{i}",
+            "text": f"signal {c}-{i}",
+            "timestamp": (NOW - timedelta(days=rng.uniform(0, 120))).isoformat() if rng.random() > 0.1 else None
+        } for i in range(n)]
+        cluster = {"cluster_id": f"c{c}", "signals": signals, "signal_count": n}
+        if c % 7:
+            cluster["embeddings"] = np_rng.normal(size=(n, DIM)).tolist()
+        clusters.append(cluster)
+    return clusters
+
+
+def _brute_force(clusters, query, days=None, cluster_ids=None):
+    """(signal_id, cosine) for every searchable in-window signal, best first."""
+    query = np.asarray(query) / np.linalg.norm(query)
+    cutoff = NOW - timedelta(days=days) if days is not None else None
+    scored = []
+    for cluster in clusters:
+        if "embeddings" not in cluster or (cluster_ids is not None and cluster["cluster_id"] not in cluster_ids):
+            continue
+        for signal, embedding in zip(cluster["signals"], cluster["embeddings"]):
+            if cutoff is not None and signal["timestamp"] and datetime.fromisoformat(signal["timestamp"]) < cutoff:
+                continue
+            embedding = np.asarray(embedding)
+            scored.append((signal["signal_id"], float(embedding @ query / np.linalg.norm(embedding))))
+    return sorted(scored, key=lambda x: x[1], reverse=True)
+
+
+def _ids_and_scores(index, rows):
+    hits = [(index.signal_at(row)[1]["signal_id"], score) for row, score in rows]
+    return [signal_id for signal_id, _ in hits], [score for _, score in hits]
+
+
+@pytest.mark.parametrize("days,cluster_ids", [(None, None), (30, None), (60, ["c1", "c2", "c5", "c9", "c13"])])
+def test_exact_probe_matches_brute_force(days, cluster_ids):
+    clusters = _clusters()
+    index = SignalSearchIndex(TimeIndex(clusters))
+    query = np.random.default_rng(1).normal(size=DIM)
+
+    expected = _brute_force(clusters, query, days, cluster_ids)[:20]
+    rows, stats = index.search(query, top_k=20, days=days, cluster_ids=cluster_ids, n_probe=None, now=NOW)
+    ids, scores = _ids_and_scores(index, rows)
+    assert ids == [signal_id for signal_id, _ in expected]
+    assert scores == pytest.approx([score for _, score in expected], abs=1e-5)
+    assert not stats["truncated"]
+
+
+def test_partial_probe_returns_true_scores_of_probed_signals():
+    clusters = _clusters(seed=2)
+    index = SignalSearchIndex(TimeIndex(clusters))
+    query = np.random.default_rng(3).normal(size=DIM)
+    exact = dict(_brute_force(clusters, query))
+
+    rows, stats = index.search(query, top_k=10, n_probe=5, now=NOW)
+    assert stats["probed_clusters"] == 5
+    ids, scores = _ids_and_scores(index, rows)
+    assert scores == sorted(scores, reverse=True)
+    assert scores == pytest.approx([exact[signal_id] for signal_id in ids], abs=1e-5)
+
+
+def test_rows_map_back_to_their_signals_and_owners():
+    clusters = _clusters(seed=8)
+    index = SignalSearchIndex(TimeIndex(clusters))
+    owner = index.signal_owner()
+    for row in range(len(index)):
+        i, signal = index.signal_at(row)
+        assert owner[signal["signal_id"]] == clusters[i]["cluster_id"]
+        if index.searchable[i]:
+            original = clusters[i]["embeddings"][clusters[i]["signals"].index(signal)]
+            assert np.allclose(index.time_index.embeddings[row], original)
+
+
+def test_grouping_aggregates_per_cluster():
+    clusters = {c: {"cluster_id": c, "signal_count": n} for c, n in (("a", 5), ("b", 1))}
+    hits = [({"signal_id": "a1"}, "a", 0.9), ({"signal_id": "a2"}, "a", 0.5), ({"signal_id": "b1"}, "b", 0.8),
+            ({"signal_id": "a3"}, "a", 0.1), ({"signal_id": "x1"}, "x", 0.99)]
+
+    by_max = group_signal_hits(hits, clusters, aggregation="max")
+    assert [r["cluster_id"] for r in by_max] == ["a", "b"]
+    assert [s["signal_id"] for s in by_max[0]["matched_signals"]] == ["a1", "a2"]
+    assert by_max[0]["final_score"] == 0.9 and by_max[0]["mean_signal_score"] == pytest.approx(0.7)
+
+    by_mean = group_signal_hits(hits, clusters, aggregation="mean")
+    assert [r["cluster_id"] for r in by_mean] == ["b", "a"]
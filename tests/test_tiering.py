@@ -0,0 +1,168 @@
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+from qdrant_client import QdrantClient
+
+from src.ingestion.signal import Signal
+from src.memory.qdrant_client import QdrantMemory
+from src.memory.tiering import ColdStore, evict_from_qdrant, split_by_tier
+from tests.embedding_stub import TopicEmbeddingModel
+
+TODAY = date(2026, 6, 1)
+
+
+def _cluster(name, day, text, centroid):
+    signals = [{
+        "signal_id": f"{name}-{i}", "text": f"{text} {i}", "timestamp": f"{day}T12:00:00",
+        "source": "test", "domain": "emerging_technology", "subdomain": "ai", "metadata": {}
+    } for i in range(2)]
+    return {"cluster_id": name, "signals": signals, "signal_count": 2, "centroid": centroid}
+
+
+def test_dormant_clusters_leave_the_working_set_unless_touched():
+    fresh = _cluster("fresh", "2026-05-20", "chips", [1.0, 0, 0])
+    old = _cluster("old", "2026-01-01", "power", [0, 1.0, 0])
+    old_touched = _cluster("old-touched", "2026-01-01", "quantum", [0, 0, 1.0])
+
+    working, dormant = split_by_tier([fresh, old, old_touched], horizon_days=90, today=TODAY, keep_ids={"old-touched"})
+    assert [c["cluster_id"] for c in working] == ["fresh", "old-touched"]
+    assert [c["cluster_id"] for c in dormant] == ["old"]
+
+
+def _local_store(tmp_path):
+    return ColdStore(tmp_path / "cold.jsonl.gz", tmp_path / "cold_index.npz", use_qdrant=False)
+
+
+def _qdrant_store(tmp_path, client):
+    # The local files must never be written in Qdrant mode
+    return ColdStore(tmp_path / "cold.jsonl.gz", tmp_path / "cold_index.npz", client=client)
+
+
+@pytest.fixture(params=["local", "qdrant"])
+def make_store(request, tmp_path):
+    """Factory for ColdStore instances over the same storage (local files or one Qdrant client)."""
+    if request.param == "local":
+        return lambda: _local_store(tmp_path)
+    client = QdrantClient(":memory:")
+    return lambda: _qdrant_store(tmp_path, client)
+
+
+def test_cold_store_archive_match_search_and_restore(make_store, tmp_path):
+    store = make_store()
+    model = TopicEmbeddingModel()
+    power = _cluster("power", "2026-01-01", "Datacenter power demand", model.embed("power").tolist())
+    quantum = _cluster("quantum", "2026-01-02", "Quantum encryption", model.embed("quantum").tolist())
+    assert store.archive([power]) == ["power"]
+    store.archive([quantum])
+
+    # A fresh instance reads the persisted tier
+    store = make_store()
+    assert len(store) == 2 and "power" in store
+    assert store.match([model.embed("grid power limits")], threshold=0.9) == ["power"]
+    assert store.match([model.embed("chips")], threshold=0.9) == []
+
+    results = store.search("quantum encryption", model, min_final_score=0.35)
+    assert results[0]["cluster_id"] == "quantum" and results[0]["tier"] == "cold"
+
+    restored = store.restore(["power"])
+    assert [c["cluster_id"] for c in restored] == ["power"] and restored[0]["signals"] == power["signals"]
+    # Nothing is dropped before the working set is saved (commit_restore)
+    assert len(make_store()) == 2
+    assert store.commit_restore() == 1
+    assert len(store) == 1 and [c["cluster_id"] for c in store.load_all()] == ["quantum"]
+    assert store.match([model.embed("power")], threshold=0.9) == []
+
+    # Re-archiving replaces the previous record
+    power["signal_count"] = 3
+    store.archive([power])
+    assert len(store) == 2
+    assert {c["cluster_id"]: c["signal_count"] for c in make_store().load_all()}["power"] == 3
+
+
+def test_uncommitted_restore_keeps_the_cluster_archived(make_store):
+    model = TopicEmbeddingModel()
+    power = _cluster("power", "2026-01-01", "Datacenter power demand", model.embed("power").tolist())
+    make_store().archive([power])
+
+    # The run restores the cluster, then dies before saving its working set
+    make_store().restore(["power"])
+    store = make_store()
+    assert "power" in store and store.restore(["power"])[0]["signals"] == power["signals"]
+
+    # Archived again in the same run (e.g., still dormant): the commit keeps it
+    store.archive([power])
+    assert store.commit_restore() == 0
+    assert "power" in make_store()
+
+
+def test_qdrant_mode_writes_no_local_files(tmp_path):
+    model = TopicEmbeddingModel()
+    store = _qdrant_store(tmp_path, QdrantClient(":memory:"))
+    store.archive([_cluster("power", "2026-01-01", "Datacenter power demand", model.embed("power").tolist())])
+    store.restore(["power"])
+    store.commit_restore()
+    assert list(tmp_path.iterdir()) == []
+
+
+_ARCHIVE_AND_EVICT = """
+import sys
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+from src.memory.tiering import ColdStore, evict_from_qdrant
+from tests.embedding_stub import DIM, TopicEmbeddingModel
+from tests.test_tiering import _cluster
+
+client = QdrantClient(path=sys.argv[1])
+client.create_collection("signals_hot", vectors_config=models.VectorParams(size=DIM, distance=models.Distance.COSINE))
+model = TopicEmbeddingModel()
+power = _cluster("power", "2026-01-01", "Datacenter power demand", model.embed("power").tolist())
+client.upsert("signals_hot", points=[
+    models.PointStruct(id=i, vector=power["centroid"], payload={"signal_id": s["signal_id"]})
+    for i, s in enumerate(power["signals"])
+])
+store = ColdStore(sys.argv[2], sys.argv[3], client=client)
+if store.archive([power]) != ["power"]:
+    sys.exit("archive failed")
+evict_from_qdrant([power], signal_client=client)
+client.close()
+"""
+
+
+def test_evicted_cluster_is_found_again_from_a_fresh_process(tmp_path):
+    qdrant_path = tmp_path / "qdrant"
+    cold_file, index_file = tmp_path / "cold.jsonl.gz", tmp_path / "cold_index.npz"
+    repo_root = Path(__file__).resolve().parent.parent
+    subprocess.run(
+        [sys.executable, "-c", _ARCHIVE_AND_EVICT, str(qdrant_path), str(cold_file), str(index_file)],
+        cwd=repo_root, check=True, capture_output=True
+    )
+
+    # Only the (persistent) Qdrant store survives the ingest process - no local cold files
+    assert not cold_file.exists() and not index_file.exists()
+    client = QdrantClient(path=str(qdrant_path))
+    try:
+        assert client.count("signals_hot").count == 0
+        model = TopicEmbeddingModel()
+        store = ColdStore(cold_file, index_file, client=client)
+        assert store.match([model.embed("grid power limits")], threshold=0.9) == ["power"]
+        assert store.search("datacenter power", model, min_final_score=0.35)[0]["cluster_id"] == "power"
+        restored = store.restore(["power"])
+        assert [s["signal_id"] for s in restored[0]["signals"]] == ["power-0", "power-1"]
+        store.commit_restore()
+        assert len(ColdStore(cold_file, index_file, client=client)) == 0
+    finally:
+        client.close()
+
+
+def test_evicted_clusters_are_removed_from_qdrant():
+    memory = QdrantMemory(collection_name="signals_hot", vector_size=3, use_cloud=False)
+    old, fresh = _cluster("old", "2026-01-01", "power", None), _cluster("fresh", "2026-05-20", "chips", None)
+    signals = [Signal.from_dict(s) for c in (old, fresh) for s in c["signals"]]
+    memory.upsert_signals(signals, [[1.0, 0.0, float(i)] for i in range(len(signals))])
+
+    evict_from_qdrant([old], signal_client=memory.client)
+    points, _ = memory.client.scroll("signals_hot", limit=10, with_payload=True)
+    assert sorted(p.payload["signal_id"] for p in points) == ["fresh-0", "fresh-1"]
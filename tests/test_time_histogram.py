@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta
+
+from src.dashboard.catalog import ClusterCatalog
+from src.dashboard.feed import build_emerging_feed
+from src.scoring.emergence import compute_emergence
+from src.scoring.time_histogram import (
+    HistogramIndex,
+    build_day_histogram,
+    histogram_covers,
+    recent_count_from_histogram,
+)
+
+
+def _clusters(seed=29, n_clusters=60):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    clusters = []
+    for c in range(n_clusters):
+        signals = [
+            {"text": f"signal {c}-{i}", "timestamp": (now - timedelta(days=rng.uniform(0, 80))).isoformat()}
+            for i in range(rng.randint(1, 8))
+        ]
+        cluster = {"cluster_id": f"c{c}", "signals": signals, "signal_count": len(signals), "created_at": signals[0]["timestamp"]}
+        if c % 4:
+            cluster["day_histogram"] = build_day_histogram(signals)
+        if c % 9 == 0 and len(signals) > 1:
+            # Time-filtered copy: the full histogram no longer covers the signals
+            cluster["signals"] = signals[:1]
+        clusters.append(cluster)
+    return clusters
+
+
+def _naive_feed(clusters, recent_days):
+    """Feed order from per-cluster compute_emergence() (the loop the histogram pass replaced)."""
+    items = []
+    for cluster in clusters:
+        emergence = compute_emergence(cluster, recent_days=recent_days)
+        items.append((cluster["cluster_id"], emergence["emergence_level"], emergence["growth_ratio"]))
+    priority = {"rapid": 3, "stable": 2, "dormant": 1}
+    return sorted(items, key=lambda x: (priority[x[1]], x[2]), reverse=True)
+
+
+def test_recent_counts_match_the_per_cluster_histograms():
+    clusters = _clusters()
+    index = HistogramIndex(clusters)
+    for recent_days in (1, 7, 30, 365):
+        counts = index.recent_counts(recent_days).tolist()
+        for cluster, count in zip(clusters, counts):
+            histogram = cluster.get("day_histogram") or build_day_histogram(cluster["signals"])
+            assert count == recent_count_from_histogram(histogram, recent_days)
+
+
+def test_feed_and_catalog_from_the_index_match_compute_emergence():
+    clusters = _clusters()
+    index = HistogramIndex(clusters)
+    assert index.covered.tolist() == [histogram_covers(c) for c in clusters]
+    for recent_days in (7, 30):
+        expected = _naive_feed(clusters, recent_days)
+        for histogram_index in (None, index):
+            feed = build_emerging_feed(clusters, recent_days=recent_days, histogram_index=histogram_index)
+            assert [(i["cluster_id"], i["emergence_level"], i["growth_ratio"]) for i in feed] == expected
+
+    catalog = ClusterCatalog(clusters, histogram_index=index)
+    assert [i["cluster_id"] for i in catalog.emerging_feed()] == [cluster_id for cluster_id, _, _ in _naive_feed(clusters, 30)]
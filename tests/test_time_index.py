@@ -0,0 +1,95 @@
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.dashboard.time_index import TimeIndex
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def _clusters(seed=7, n_clusters=40):
+    rng = random.Random(seed)
+    clusters = []
+    for c in range(n_clusters):
+        signals, embeddings = [], []
+        for i in range(rng.randint(0, 12)):
+            kind = rng.random()
+            if kind < 0.1:
+                timestamp = None
+            elif kind < 0.15:
+                timestamp = "not a timestamp"
+            else:
+                timestamp = (NOW - timedelta(days=rng.uniform(0, 400))).isoformat()
+            signals.append({"signal_id": f"{c}-{i}", "text": f"signal {c}-{i}", "timestamp": timestamp})
+            embeddings.append([rng.random() for _ in range(4)])
+        cluster = {"cluster_id": f"c{c}", "signals": signals, "signal_count": len(signals)}
+        if c % 3:
+            cluster["embeddings"] = embeddings
+        clusters.append(cluster)
+    return clusters
+
+
+def _naive_filter(clusters, days, now):
+    """The per-signal loop TimeIndex replaced (missing / invalid timestamps are kept)."""
+    cutoff = now - timedelta(days=days)
+    filtered = {}
+    for cluster in clusters:
+        signals = cluster.get("signals", [])
+        recent = []
+        for signal in signals:
+            try:
+                if not signal.get("timestamp") or datetime.fromisoformat(signal["timestamp"]) >= cutoff:
+                    recent.append(signal)
+            except (ValueError, TypeError):
+                recent.append(signal)
+        if recent:
+            filtered[cluster["cluster_id"]] = (recent, len(recent) / len(signals))
+    return filtered
+
+
+def test_filter_matches_the_per_signal_loop():
+    clusters = _clusters()
+    index = TimeIndex(clusters)
+
+    for days in (1, 7, 30, 180, 10000):
+        expected = _naive_filter(clusters, days, NOW)
+        result = index.filter(days, now=NOW)
+        assert [c["cluster_id"] for c in result] == [c for c in expected]
+
+        for cluster in result:
+            recent, growth_ratio = expected[cluster["cluster_id"]]
+            assert sorted(s["signal_id"] for s in cluster["signals"]) == sorted(s["signal_id"] for s in recent)
+            assert cluster["signal_count"] == len(recent)
+            assert cluster["growth_ratio"] == growth_ratio
+
+            # Embedding rows stay aligned with the (time-ordered) signals
+            original = next(c for c in clusters if c["cluster_id"] == cluster["cluster_id"])
+            if "embeddings" in original:
+                row_of = {s["signal_id"]: row for s, row in zip(original["signals"], original["embeddings"])}
+                expected_rows = np.asarray([row_of[s["signal_id"]] for s in cluster["signals"]], dtype=np.float32)
+                assert np.array_equal(cluster["embeddings"], expected_rows)
+            else:
+                assert "embeddings" not in cluster
+
+        counts = index.window_counts(days, now=NOW)
+        assert counts.tolist() == [len(expected.get(c["cluster_id"], ([], 0))[0]) for c in clusters]
+
+
+def test_signals_are_time_ordered_with_undated_signals_last():
+    clusters = _clusters(seed=3, n_clusters=10)
+    index = TimeIndex(clusters)
+    for i in range(len(clusters)):
+        seconds = index.timestamps[index.offsets[i]:index.offsets[i + 1]]
+        assert seconds.tolist() == sorted(seconds.tolist())
+        undated = [s for s in index.signals_for(i) if not s["timestamp"] or s["timestamp"] == "not a timestamp"]
+        assert index.signals_for(i)[len(index.signals_for(i)) - len(undated):] == undated
+
+
+def test_mask_restricts_the_result():
+    clusters = _clusters(seed=11, n_clusters=12)
+    index = TimeIndex(clusters)
+    mask = np.arange(len(clusters)) % 2 == 0
+    unmasked = {c["cluster_id"] for c in index.filter(30, now=NOW)}
+    masked = {c["cluster_id"] for c in index.filter(30, now=NOW, mask=mask)}
+    assert masked == {cid for cid in unmasked if int(cid[1:]) % 2 == 0}
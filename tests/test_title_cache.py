@@ -0,0 +1,79 @@
+import uuid
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+
+from src.dashboard.title_cache import LEGACY_TITLE_COLLECTION, TITLE_COLLECTION, TitleCache
+
+
+class CountingClient(QdrantClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upserts = 0
+
+    def upsert(self, *args, **kwargs):
+        self.upserts += 1
+        return super().upsert(*args, **kwargs)
+
+
+def test_writes_are_batched_until_flush(tmp_path):
+    client = CountingClient(":memory:")
+    cache = TitleCache(client=client, cache_file=tmp_path / "titles.json", flush_interval=None)
+    ids = [str(uuid.uuid4()) for _ in range(5)]
+    for cluster_id in ids:
+        cache.set(cluster_id, f"Title {cluster_id[:4]}")
+    cache.get(ids[0])
+
+    assert client.upserts == 0
+    assert cache.flush() == 5
+    assert client.upserts == 1
+    assert cache.flush() == 0
+
+    # Re-setting an unchanged title is not a write
+    cache.set(ids[0], f"Title {ids[0][:4]}")
+    assert cache.flush() == 0
+
+    reloaded = TitleCache(client=client, cache_file=tmp_path / "titles.json", flush_interval=None)
+    assert reloaded.load() == 5
+    assert reloaded.get(ids[3]) == f"Title {ids[3][:4]}"
+
+
+def test_legacy_titles_are_migrated(tmp_path):
+    client = QdrantClient(":memory:")
+    client.create_collection(LEGACY_TITLE_COLLECTION, vectors_config=VectorParams(size=384, distance=Distance.COSINE))
+    cluster_id = str(uuid.uuid4())
+    client.upsert(LEGACY_TITLE_COLLECTION, points=[
+        PointStruct(id=cluster_id, vector=[0.0] * 384, payload={"cluster_id": cluster_id, "title": "Old title"})
+    ])
+
+    cache = TitleCache(client=client, cache_file=tmp_path / "titles.json", flush_interval=None)
+    assert cache.load() == 1
+    assert cache.flush() == 1
+    points, _ = client.scroll(TITLE_COLLECTION, with_payload=True)
+    assert [p.payload["title"] for p in points] == ["Old title"]
+
+
+def test_without_qdrant_titles_go_to_local_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("QDRANT_URL", raising=False)
+    cache = TitleCache(cache_file=tmp_path / "titles.json", flush_interval=None)
+    cache.set("signal-hash", "Local title")
+    assert cache.flush() == 0
+
+    reloaded = TitleCache(cache_file=tmp_path / "titles.json", flush_interval=None)
+    assert reloaded.load() == 1
+    assert reloaded.get("signal-hash") == "Local title"
+
+
+def test_loads_lazily_on_first_use_or_preload(tmp_path):
+    client = CountingClient(":memory:")
+    cache = TitleCache(client=client, cache_file=tmp_path / "titles.json", flush_interval=None)
+    assert not cache.loaded
+    assert not client.collection_exists(TITLE_COLLECTION)
+
+    cache.preload().join()
+    assert cache.loaded
+    assert client.collection_exists(TITLE_COLLECTION)
+
+    lazy = TitleCache(client=client, cache_file=tmp_path / "titles.json", flush_interval=None)
+    assert lazy.get("missing") is None
+    assert lazy.loaded
@@ -0,0 +1,30 @@
+import src.dashboard.gemini_explainer as gemini_explainer
+from src.dashboard.title_drift import title_refresh_reason, title_source
+from src.dashboard.title_service import TitleService
+
+
+def test_refresh_reason_thresholds(make_cluster):
+    cluster = make_cluster("a", 4)
+    source = title_source(cluster)
+    assert title_refresh_reason(source, cluster) is None
+    assert title_refresh_reason(source, make_cluster("a", 4, [0.0, 1.0]), drift_threshold=0.15) == "drift"
+    assert title_refresh_reason(source, make_cluster("a", 8, [1.0, 0.05]), drift_threshold=0.15, growth_threshold=1.0) == "growth"
+    assert title_refresh_reason(source, make_cluster("a", 7, [1.0, 0.05]), drift_threshold=0.15, growth_threshold=1.0) is None
+    assert title_refresh_reason(None, cluster) is None
+
+
+def test_only_changed_clusters_are_regenerated(title_cache, llm_stub, make_cluster):
+    clusters = [make_cluster(name, 4) for name in ("stable", "drifting", "growing")]
+    service = TitleService(api_key="test", api_base=llm_stub.url, requests_per_minute=6000)
+    titles, stats = gemini_explainer.refresh_cluster_titles(clusters, service=service)
+    assert stats["new"] == 3 and llm_stub.requests == 1
+
+    clusters[1]["centroid"] = [0.0, 1.0]
+    clusters[2]["signals"] += [{"text": f"growing extra {i}"} for i in range(4)]
+    titles, stats = gemini_explainer.refresh_cluster_titles(clusters, service=service)
+
+    assert (stats["drift"], stats["growth"], stats["unchanged"]) == (1, 1, 1)
+    assert llm_stub.requests == 2
+    assert "Cluster 3:" not in llm_stub.prompts[-1]
+    assert titles[clusters[0]["cluster_id"]] == "Title: stable signal 0"
+    assert title_cache.get_source(clusters[1]["cluster_id"])["centroid"] == [0.0, 1.0]
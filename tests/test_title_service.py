@@ -0,0 +1,66 @@
+from src.dashboard.title_service import TitleService, TokenBucket, parse_batch_titles
+from tests.llm_stub import LLMStub
+
+
+def _items(n):
+    return [(f"cluster-{i}", [f"Signal {i} about topic", f"Another signal {i}"]) for i in range(n)]
+
+
+def test_batches_share_one_prompt_per_batch_size():
+    with LLMStub() as stub:
+        service = TitleService(api_key="test", api_base=stub.url, batch_size=4, max_workers=2, requests_per_minute=6000)
+        titles = service.generate_titles(_items(10))
+
+    assert stub.requests == 3
+    assert titles == {f"cluster-{i}": f"Title: Signal {i} about topic" for i in range(10)}
+
+
+def test_requests_run_concurrently():
+    with LLMStub(latency=0.2) as stub:
+        service = TitleService(api_key="test", api_base=stub.url, batch_size=1, max_workers=4, requests_per_minute=6000)
+        service.generate_titles(_items(4))
+
+    assert stub.max_concurrency > 1
+
+
+def test_rate_limited_requests_are_retried_after_backoff():
+    with LLMStub(rate_limit_first=2, retry_after=0) as stub:
+        service = TitleService(api_key="test", api_base=stub.url, batch_size=8, requests_per_minute=6000)
+        titles = service.generate_titles(_items(3))
+
+    assert len(titles) == 3
+    assert service.stats["rate_limited"] == 2
+    assert stub.requests == 3
+
+
+def test_skipped_clusters_are_absent_and_failures_do_not_raise():
+    with LLMStub(skip_indexes={2}) as stub:
+        service = TitleService(api_key="test", api_base=stub.url, batch_size=8, requests_per_minute=6000)
+        titles = service.generate_titles(_items(3))
+    assert set(titles) == {"cluster-0", "cluster-2"}
+
+    unreachable = TitleService(api_key="test", api_base="http://127.0.0.1:9", max_retries=0, requests_per_minute=6000)
+    assert unreachable.generate_titles(_items(2)) == {}
+    assert unreachable.stats["failed_batches"] == 1
+
+
+def test_parse_ignores_unknown_indexes():
+    batch = _items(2)
+    text = '[{"index": 2, "title": "\\"Quoted\\""}, {"index": 7, "title": "Out of range"}, {"index": "x"}]'
+    assert parse_batch_titles(text, batch) == {"cluster-1": "Quoted"}
+
+
+def test_token_bucket_waits_for_refill():
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=1, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0.0
+    assert abs(bucket.acquire() - 0.5) < 1e-9
+
+    # A 429 holds everyone off for Retry-After; the refilled token is usable right after
+    bucket.pause(3.0)
+    assert abs(bucket.acquire() - 3.0) < 1e-9
+    assert abs(bucket.acquire() - 0.5) < 1e-9
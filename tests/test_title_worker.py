@@ -0,0 +1,59 @@
+import threading
+
+import src.dashboard.gemini_explainer as gemini_explainer
+import src.dashboard.llm_budget as llm_budget
+from src.dashboard.llm_budget import LLMBudget
+from src.dashboard.title_service import TitleService
+from src.dashboard.title_worker import TitleWorker
+
+
+def test_pending_clusters_are_queued_once_and_results_returned():
+    release = threading.Event()
+    calls = []
+
+    def generate(items):
+        release.wait(5)
+        calls.append([cluster_id for cluster_id, _ in items])
+        return {cluster_id: f"Title {cluster_id}" for cluster_id, _ in items}
+
+    worker = TitleWorker(generate, chunk_size=2, max_workers=1)
+    futures = worker.submit([("a", ["x"]), ("b", ["y"]), ("c", ["z"])])
+    assert len(futures) == 2
+    assert worker.submit([("a", ["x"]), ("c", ["z"])]) == []
+    assert worker.pending == 3
+
+    release.set()
+    results = [f.result(timeout=5) for f in futures]
+    worker.shutdown()
+
+    assert calls == [["a", "b"], ["c"]]
+    assert results[1] == {"c": "Title c"}
+    assert worker.pending == 0
+
+
+def test_failed_job_releases_clusters_for_retry():
+    def generate(items):
+        raise RuntimeError("quota")
+
+    worker = TitleWorker(generate, max_workers=1)
+    assert worker.submit([("a", ["x"])])[0].result(timeout=5) == {}
+    assert worker.stats["failed_jobs"] == 1
+    assert len(worker.submit([("a", ["x"])])) == 1
+    worker.shutdown()
+
+
+def test_one_cluster_submissions_of_a_render_share_prompts(title_cache, llm_stub, monkeypatch):
+    budget = LLMBudget(max_calls_per_minute=1000)
+    service = TitleService(api_key="test", api_base=llm_stub.url, batch_size=8, requests_per_minute=6000, budget=budget)
+    worker = TitleWorker(gemini_explainer._generate_and_cache)
+    monkeypatch.setattr(llm_budget, "_llm_budget", budget)
+    monkeypatch.setattr(gemini_explainer, "get_title_service", lambda: service)
+    monkeypatch.setattr(gemini_explainer, "_title_worker", worker)
+
+    # A page render asks for 12 untitled clusters one at a time
+    for i in range(12):
+        gemini_explainer.get_cluster_title_nowait([f"Signal {i} about topic"], f"cluster-{i}")
+    worker.shutdown()
+
+    assert llm_stub.requests == 2
+    assert all(not title_cache.is_provisional(f"cluster-{i}") and title_cache.get(f"cluster-{i}") for i in range(12))